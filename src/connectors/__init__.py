@@ -17,6 +17,7 @@ from .base_connector import (
     ConnectionError,
     QueryError
 )
+from .adaptive_pool import AdaptivePoolController
 
 from .mysql_connector import MySQLConnector
 from .psg_connector import PostgreSQLConnector
@@ -29,6 +30,7 @@ __all__ = [
     'DatabaseError',
     'ConnectionError',
     'QueryError',
+    'AdaptivePoolController',
     'MySQLConnector',
     'PostgreSQLConnector',
     'MSSQLConnector',
@@ -0,0 +1,205 @@
+"""
+Adaptive Connection Pool Sizing
+
+This module provides a lightweight controller that samples connection round-trip
+latency and grows or shrinks a connector's pool size limit in response, so that
+pool concurrency follows what the database server can actually sustain instead
+of a hard-coded value from configuration. The connector enforces the limit on
+checkout: callers beyond it wait for a connection to be returned.
+"""
+
+import logging
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class AdaptivePoolController:
+    """
+    Latency-aware pool size controller for a BaseConnector.
+    
+    Every sampling interval the controller measures a `SELECT 1` round trip
+    through the connector's pool and then re-evaluates the pool size limit:
+    - Grow by `growth_factor` (up to the ceiling) when the pool is saturated
+      and p95 latency is above the configured threshold
+    - Shrink by `shrink_factor` (down to the floor) when utilization is low
+    
+    Utilization is checked-out connections over the limit.
+    """
+    
+    def __init__(self, connector: Any,
+                 min_size: int,
+                 max_size: int,
+                 latency_threshold_ms: float = 50.0,
+                 sample_interval: float = 30.0,
+                 window_size: int = 20,
+                 growth_factor: float = 1.25,
+                 shrink_factor: float = 0.75,
+                 saturation_ratio: float = 0.9,
+                 low_utilization_ratio: float = 0.3):
+        """
+        Initialize the controller.
+        
+        Args:
+            connector: Connector whose pool size limit is managed
+            min_size: Lower bound for the pool size limit
+            max_size: Upper bound (ceiling) for the pool size limit
+            latency_threshold_ms: p95 RTT above which a saturated pool is grown
+            sample_interval: Seconds between latency samples
+            window_size: Number of recent RTT samples kept for percentiles
+            growth_factor: Multiplier applied when growing the pool
+            shrink_factor: Multiplier applied when shrinking the pool
+            saturation_ratio: Utilization at or above which the pool is saturated
+            low_utilization_ratio: Utilization below which the pool is shrunk
+        """
+        if min_size < 1:
+            raise ValueError("min_size must be at least 1")
+        if max_size < min_size:
+            raise ValueError("max_size must be greater than or equal to min_size")
+        
+        self.connector = connector
+        self.min_size = min_size
+        self.max_size = max_size
+        self.latency_threshold_ms = latency_threshold_ms
+        self.sample_interval = sample_interval
+        self.growth_factor = growth_factor
+        self.shrink_factor = shrink_factor
+        self.saturation_ratio = saturation_ratio
+        self.low_utilization_ratio = low_utilization_ratio
+        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        self._samples: Deque[float] = deque(maxlen=window_size)
+        self._samples_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def is_running(self) -> bool:
+        """Check if the background sampling thread is running"""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start the background sampling thread."""
+        if self.is_running:
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"{self.connector.__class__.__name__}-pool-controller",
+            daemon=True
+        )
+        self._thread.start()
+        self.logger.debug("Adaptive pool controller started")
+    
+    def stop(self) -> None:
+        """Stop the background sampling thread."""
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.sample_interval)
+        self._thread = None
+        self.logger.debug("Adaptive pool controller stopped")
+    
+    def record_latency(self, latency_ms: float) -> None:
+        """
+        Record a round-trip latency sample.
+        
+        Args:
+            latency_ms: Measured round-trip time in milliseconds
+        """
+        with self._samples_lock:
+            self._samples.append(latency_ms)
+    
+    def get_latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Get a latency percentile over the current sample window.
+        
+        Args:
+            percentile: Percentile in the range 0-100
+        
+        Returns:
+            Latency in milliseconds, or None if no samples were recorded
+        """
+        with self._samples_lock:
+            samples = sorted(self._samples)
+        
+        if not samples:
+            return None
+        
+        index = max(0, math.ceil(percentile / 100 * len(samples)) - 1)
+        return samples[index]
+    
+    def evaluate(self, active_connections: int, current_size: int) -> int:
+        """
+        Compute the pool size limit for the current load.
+        
+        Args:
+            active_connections: Connections currently checked out of the pool
+            current_size: Current pool size limit
+        
+        Returns:
+            New pool size limit, clamped to [min_size, max_size]
+        """
+        utilization = active_connections / current_size if current_size > 0 else 1.0
+        p95 = self.get_latency_percentile(95)
+        
+        new_size = current_size
+        if (utilization >= self.saturation_ratio and p95 is not None
+                and p95 > self.latency_threshold_ms):
+            new_size = math.ceil(current_size * self.growth_factor)
+        elif utilization < self.low_utilization_ratio:
+            new_size = math.floor(current_size * self.shrink_factor)
+        
+        return max(self.min_size, min(self.max_size, new_size))
+    
+    def sample_and_adjust(self) -> int:
+        """
+        Take one latency sample and resize the connector's pool if needed.
+        
+        Returns:
+            Pool size limit after adjustment
+        """
+        try:
+            self.record_latency(self.connector.measure_latency())
+        except Exception as e:
+            self.logger.warning(f"Latency sampling failed: {str(e)}")
+        
+        status = self.connector.get_pool_status()
+        current_size = status['pool_size_limit']
+        new_size = self.evaluate(status['active_connections'], current_size)
+        
+        if new_size != current_size:
+            self.logger.info(f"Resizing connection pool: {current_size} -> {new_size} "
+                             f"(p95 latency: {self.get_latency_percentile(95)} ms)")
+            self.connector.resize_pool(new_size)
+        
+        return new_size
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get controller statistics.
+        
+        Returns:
+            Dictionary with latency percentiles and size bounds
+        """
+        with self._samples_lock:
+            sample_count = len(self._samples)
+        
+        return {
+            'samples': sample_count,
+            'p50_latency_ms': self.get_latency_percentile(50),
+            'p95_latency_ms': self.get_latency_percentile(95),
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'running': self.is_running
+        }
+    
+    def _run(self) -> None:
+        """Background loop: sample latency and adjust every interval."""
+        while not self._stop_event.wait(self.sample_interval):
+            try:
+                self.sample_and_adjust()
+            except Exception as e:
+                self.logger.warning(f"Adaptive pool adjustment failed: {str(e)}")
@@ -8,12 +8,14 @@ including connection management, query execution, and error handling.
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Union, Tuple
 from contextlib import contextmanager
 import threading
 from dataclasses import dataclass
 from enum import Enum
 
+from .adaptive_pool import AdaptivePoolController
+
 
 class ConnectionStatus(Enum):
     """Connection status enumeration"""
@@ -43,6 +45,11 @@ class ConnectionConfig:
     retry_attempts: int = 3
     retry_delay: int = 5
     query_timeout: int = 300
+    adaptive_pool: bool = False
+    min_connections: int = 2
+    max_connections_ceiling: Optional[int] = None
+    latency_threshold_ms: float = 50.0
+    latency_sample_interval: int = 30
 
 
 class DatabaseError(Exception):
@@ -90,7 +97,24 @@ class BaseConnector(ABC):
         self._pool = []
         self._pool_lock = threading.Lock()
         self._active_connections = 0
+        self._pool_size_limit = config.max_connections
+        # Signalled when a connection is returned or the pool size limit changes
+        self._pool_available = threading.Condition(self._pool_lock)
+        
+        # Statements run on every new connection (see add_session_init_statements)
+        self._session_init_statements: List[str] = []
         
+        # Latency-aware pool sizing (started on connect)
+        self._pool_controller = None
+        if config.adaptive_pool:
+            self._pool_controller = AdaptivePoolController(
+                self,
+                min_size=min(config.min_connections, config.max_connections),
+                max_size=config.max_connections_ceiling or config.max_connections * 4,
+                latency_threshold_ms=config.latency_threshold_ms,
+                sample_interval=config.latency_sample_interval
+            )
+    
     @property
     def status(self) -> ConnectionStatus:
         """Get current connection status"""
@@ -108,7 +132,7 @@ class BaseConnector(ABC):
         
         Returns:
             Database connection object
-            
+        
         Raises:
             ConnectionError: If connection creation fails
         """
@@ -121,7 +145,7 @@ class BaseConnector(ABC):
         
         Args:
             connection: Database connection object
-            
+        
         Returns:
             True if connection is valid, False otherwise
         """
@@ -146,10 +170,10 @@ class BaseConnector(ABC):
             connection: Database connection object
             query: SQL query string
             params: Query parameters
-            
+        
         Returns:
             Query result object
-            
+        
         Raises:
             QueryError: If query execution fails
         """
@@ -165,7 +189,7 @@ class BaseConnector(ABC):
         with self._connection_lock:
             if self._status == ConnectionStatus.CONNECTED:
                 return True
-                
+            
             try:
                 self._status = ConnectionStatus.CONNECTING
                 self.logger.info(f"Connecting to database {self.config.database} on {self.config.host}:{self.config.port}")
@@ -176,10 +200,12 @@ class BaseConnector(ABC):
                     self._close_connection(test_conn)
                     self._status = ConnectionStatus.CONNECTED
                     self.logger.info("Database connection established successfully")
+                    if self._pool_controller:
+                        self._pool_controller.start()
                     return True
                 else:
                     raise ConnectionError("Connection test failed")
-                    
+            
             except Exception as e:
                 self._status = ConnectionStatus.ERROR
                 self.logger.error(f"Failed to connect to database: {str(e)}")
@@ -190,10 +216,13 @@ class BaseConnector(ABC):
         with self._connection_lock:
             if self._status == ConnectionStatus.DISCONNECTED:
                 return
-                
+            
             self._status = ConnectionStatus.CLOSING
             self.logger.info("Disconnecting from database...")
             
+            if self._pool_controller:
+                self._pool_controller.stop()
+            
             # Close all connections in pool
             with self._pool_lock:
                 for conn in self._pool:
@@ -204,6 +233,7 @@ class BaseConnector(ABC):
                 
                 self._pool.clear()
                 self._active_connections = 0
+                self._pool_available.notify_all()
             
             self._status = ConnectionStatus.DISCONNECTED
             self.logger.info("Database disconnected")
@@ -212,9 +242,13 @@ class BaseConnector(ABC):
         """
         Get a connection from the pool or create a new one.
         
+        With adaptive pool sizing, at most pool size limit connections are
+        checked out at a time; callers wait up to the connection timeout for
+        one to be returned.
+        
         Returns:
             Database connection object
-            
+        
         Raises:
             ConnectionError: If no connection can be obtained
         """
@@ -223,6 +257,12 @@ class BaseConnector(ABC):
                 raise ConnectionError("Cannot establish database connection")
         
         with self._pool_lock:
+            if self._pool_controller and not self._pool_available.wait_for(
+                    lambda: self._active_connections < self._pool_size_limit,
+                    timeout=self.config.connection_timeout):
+                raise ConnectionError(f"No connection available within {self.config.connection_timeout}s "
+                                      f"(pool size limit: {self._pool_size_limit})")
+            
             # Try to get connection from pool
             if self._pool:
                 conn = self._pool.pop()
@@ -236,6 +276,7 @@ class BaseConnector(ABC):
             try:
                 conn = self._create_connection()
                 if self._test_connection(conn):
+                    self._init_session(conn)
                     self._active_connections += 1
                     return conn
                 else:
@@ -243,6 +284,37 @@ class BaseConnector(ABC):
             except Exception as e:
                 raise ConnectionError(f"Failed to create connection: {str(e)}")
     
+    def add_session_init_statements(self, statements: List[str]) -> None:
+        """
+        Register statements to run on every new connection (e.g. session settings).
+        
+        Idle pooled connections are closed so that every connection handed out
+        afterwards has run the statements; failing statements are skipped.
+        
+        Args:
+            statements: SQL statements to run once per connection
+        """
+        new_statements = [stmt for stmt in statements if stmt not in self._session_init_statements]
+        if not new_statements:
+            return
+        
+        with self._pool_lock:
+            self._session_init_statements.extend(new_statements)
+            for conn in self._pool:
+                try:
+                    self._close_connection(conn)
+                except Exception as e:
+                    self.logger.warning(f"Error closing connection: {str(e)}")
+            self._pool.clear()
+    
+    def _init_session(self, connection: Any) -> None:
+        """Run the registered session statements on a new connection (best effort)."""
+        for statement in self._session_init_statements:
+            try:
+                self._execute_query(connection, statement)
+            except Exception as e:
+                self.logger.debug(f"Session statement skipped ({statement}): {str(e)}")
+    
     def return_connection(self, connection: Any) -> None:
         """
         Return a connection to the pool.
@@ -252,9 +324,9 @@ class BaseConnector(ABC):
         """
         if not connection:
             return
-            
+        
         with self._pool_lock:
-            if len(self._pool) < self.config.max_connections:
+            if len(self._pool) < self._pool_size_limit:
                 try:
                     if self._test_connection(connection):
                         self._pool.append(connection)
@@ -266,6 +338,7 @@ class BaseConnector(ABC):
                 self._close_connection(connection)
             
             self._active_connections = max(0, self._active_connections - 1)
+            self._pool_available.notify()
     
     @contextmanager
     def get_connection_context(self):
@@ -290,10 +363,10 @@ class BaseConnector(ABC):
         Args:
             query: SQL query string
             params: Query parameters
-            
+        
         Returns:
             Query result object
-            
+        
         Raises:
             QueryError: If query execution fails
         """
@@ -303,6 +376,56 @@ class BaseConnector(ABC):
             except Exception as e:
                 raise QueryError(f"Query execution failed: {str(e)}")
     
+    def stream_query(self, query: str, params: Optional[Dict] = None, chunksize: int = 1000) -> Iterator[Any]:
+        """
+        Execute a SELECT and yield its rows without materializing the result.
+        
+        Connectors with server-side cursors fetch the rows in chunks; the
+        default falls back to execute_query. The connection is held until the
+        iterator is exhausted or closed.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            chunksize: Rows fetched per round trip
+        
+        Yields:
+            Result rows
+        
+        Raises:
+            QueryError: If query execution fails
+        """
+        yield from self.execute_query(query, params) or []
+    
+    def execute_prepared(self, query: str, params: Optional[Dict] = None) -> Any:
+        """
+        Execute a repeatedly used query, as a prepared statement where supported.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+        
+        Returns:
+            Query result object
+        
+        Raises:
+            QueryError: If query execution fails
+        """
+        with self.get_connection_context() as conn:
+            try:
+                return self._execute_prepared(conn, query, params)
+            except Exception as e:
+                raise QueryError(f"Query execution failed: {str(e)}")
+    
+    def _execute_prepared(self, connection: Any, query: str, params: Optional[Dict] = None) -> Any:
+        """
+        Execute a query as a prepared statement on the given connection.
+        
+        Connectors with server-side prepared statements override this; the
+        default runs the query through _execute_query.
+        """
+        return self._execute_query(connection, query, params)
+    
     def execute_many(self, query: str, params_list: List[Dict]) -> List[Any]:
         """
         Execute a query multiple times with different parameters.
@@ -310,10 +433,10 @@ class BaseConnector(ABC):
         Args:
             query: SQL query string
             params_list: List of parameter dictionaries
-            
+        
         Returns:
             List of query results
-            
+        
         Raises:
             QueryError: If query execution fails
         """
@@ -327,6 +450,44 @@ class BaseConnector(ABC):
             except Exception as e:
                 raise QueryError(f"Batch query execution failed: {str(e)}")
     
+    def measure_latency(self) -> float:
+        """
+        Measure round-trip latency of a connection test query (SELECT 1).
+        
+        Returns:
+            Round-trip time in milliseconds
+        
+        Raises:
+            ConnectionError: If the test query fails
+        """
+        with self.get_connection_context() as conn:
+            start_time = time.perf_counter()
+            if not self._test_connection(conn):
+                raise ConnectionError("Latency probe failed")
+            return (time.perf_counter() - start_time) * 1000
+    
+    def resize_pool(self, new_size: int) -> None:
+        """
+        Change the pool size limit.
+        
+        The limit caps the idle connections kept for reuse and, with adaptive
+        pool sizing, the connections checked out at a time. Idle connections
+        above the new limit are closed immediately; checked-out connections
+        above it stay open until returned, and waiting callers are woken up
+        when the limit grows.
+        
+        Args:
+            new_size: New pool size limit
+        """
+        if new_size < 1:
+            raise ValueError("Pool size must be at least 1")
+        
+        with self._pool_lock:
+            self._pool_size_limit = new_size
+            while len(self._pool) > new_size:
+                self._close_connection(self._pool.pop(0))
+            self._pool_available.notify_all()
+    
     def health_check(self) -> bool:
         """
         Perform a health check on the database connection.
@@ -359,13 +520,19 @@ class BaseConnector(ABC):
             Dictionary with pool statistics
         """
         with self._pool_lock:
-            return {
+            status = {
                 "total_connections": len(self._pool) + self._active_connections,
                 "pool_size": len(self._pool),
                 "active_connections": self._active_connections,
                 "max_connections": self.config.max_connections,
+                "pool_size_limit": self._pool_size_limit,
                 "status": self._status.value
             }
+        
+        if self._pool_controller:
+            status["adaptive"] = self._pool_controller.get_stats()
+        
+        return status
     
     def __enter__(self):
         """Context manager entry"""
@@ -114,6 +114,11 @@ class ConfigLoader:
             max_connections=pool_settings.get('max_connections', 10),
             idle_timeout=pool_settings.get('idle_timeout', 300),
             connection_timeout=pool_settings.get('connection_timeout', 30),
+            adaptive_pool=pool_settings.get('adaptive', False),
+            min_connections=pool_settings.get('min_connections', 2),
+            max_connections_ceiling=pool_settings.get('max_connections_ceiling'),
+            latency_threshold_ms=pool_settings.get('latency_threshold_ms', 50.0),
+            latency_sample_interval=pool_settings.get('latency_sample_interval', 30),
             retry_attempts=connection_defaults.get('retry_attempts', 3),
             retry_delay=connection_defaults.get('retry_delay', 5),
             query_timeout=connection_defaults.get('query_timeout', 300)
@@ -6,7 +6,7 @@ using pyodbc library.
 """
 
 import logging
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 import pyodbc
 from pyodbc import Error as ODBCError
 import urllib.parse
@@ -41,7 +41,6 @@ class MSSQLConnector(BaseConnector):
             config: Connection configuration object
         """
         super().__init__(config)
-        self._pool = None
         self._pool_config = None
         self._driver = self._detect_driver()
         
@@ -228,6 +227,42 @@ class MSSQLConnector(BaseConnector):
             connection.rollback()
             raise QueryError(f"Unexpected error executing MSSQL query: {str(e)}")
     
+    def stream_query(self, query: str, params: Optional[Dict] = None, chunksize: int = 1000) -> Iterator[Any]:
+        """
+        Execute a SELECT and yield rows fetched in chunks of cursor.fetchmany().
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (mapping or sequence)
+            chunksize: Rows fetched per round trip
+            
+        Yields:
+            Result rows as dictionaries
+            
+        Raises:
+            QueryError: If query execution fails
+        """
+        with self.get_connection_context() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = chunksize
+            try:
+                if params:
+                    param_list = list(params.values()) if isinstance(params, dict) else list(params)
+                    cursor.execute(query, param_list)
+                else:
+                    cursor.execute(query)
+                
+                columns = [column[0] for column in cursor.description] if cursor.description else []
+                rows = cursor.fetchmany(chunksize)
+                while rows:
+                    for row in rows:
+                        yield dict(zip(columns, row))
+                    rows = cursor.fetchmany(chunksize)
+            except ODBCError as e:
+                raise QueryError(f"MSSQL query execution failed: {str(e)}")
+            finally:
+                cursor.close()
+    
     def execute_transaction(self, queries: List[Tuple[str, Optional[Dict]]]) -> List[Any]:
         """
         Execute multiple queries in a single transaction.
@@ -6,7 +6,7 @@ using mysql-connector-python library.
 """
 
 import logging
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 import mysql.connector
 from mysql.connector import Error as MySQLError
 from mysql.connector.pooling import MySQLConnectionPool
@@ -20,6 +20,9 @@ from .base_connector import (
     DatabaseError
 )
 
+# Prepared statements kept per connection (the server caps them via max_prepared_stmt_count)
+_MAX_PREPARED_STATEMENTS = 64
+
 
 class MySQLConnector(BaseConnector):
     """
@@ -41,9 +44,11 @@ class MySQLConnector(BaseConnector):
             config: Connection configuration object
         """
         super().__init__(config)
-        self._pool = None
         self._pool_config = None
         
+        # Prepared cursors per connection id, keyed by statement text
+        self._prepared_cursors: Dict[int, Dict[str, Any]] = {}
+        
     def _create_connection(self) -> Any:
         """
         Create a new MySQL connection.
@@ -124,6 +129,13 @@ class MySQLConnector(BaseConnector):
         Args:
             connection: MySQL connection object
         """
+        # Prepared statements live and die with their connection
+        for cursor in self._prepared_cursors.pop(id(connection), {}).values():
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        
         try:
             if connection and connection.is_connected():
                 connection.close()
@@ -173,6 +185,90 @@ class MySQLConnector(BaseConnector):
             connection.rollback()
             raise QueryError(f"Unexpected error executing MySQL query: {str(e)}")
     
+    def _execute_prepared(self, connection: Any, query: str, params: Optional[Dict] = None) -> Any:
+        """
+        Execute a parameterized SELECT as a server-side prepared statement.
+        
+        Each connection keeps one prepared cursor per statement text, so the
+        server parses and plans a repeated metadata query once per connection
+        and afterwards only executes it with new parameters.
+        
+        Args:
+            connection: MySQL connection object
+            query: SQL query string
+            params: Query parameters
+            
+        Returns:
+            Query result rows
+            
+        Raises:
+            QueryError: If query execution fails
+        """
+        if not params or query.lstrip()[:6].upper() != 'SELECT':
+            return self._execute_query(connection, query, params)
+        
+        statements = self._prepared_cursors.setdefault(id(connection), {})
+        cursor = statements.get(query)
+        if cursor is None:
+            if len(statements) >= _MAX_PREPARED_STATEMENTS:
+                return self._execute_query(connection, query, params)
+            try:
+                cursor = connection.cursor(prepared=True, dictionary=True)
+            except Exception as e:
+                # Older drivers have no dictionary prepared cursor
+                self.logger.debug(f"Prepared cursor unavailable: {str(e)}")
+                return self._execute_query(connection, query, params)
+            statements[query] = cursor
+        
+        try:
+            cursor.execute(query, tuple(params))
+            return cursor.fetchall()
+        except MySQLError as e:
+            statements.pop(query, None)
+            connection.rollback()
+            raise QueryError(f"MySQL query execution failed: {str(e)}")
+        except Exception as e:
+            statements.pop(query, None)
+            connection.rollback()
+            raise QueryError(f"Unexpected error executing MySQL query: {str(e)}")
+    
+    def stream_query(self, query: str, params: Optional[Dict] = None, chunksize: int = 1000) -> Iterator[Any]:
+        """
+        Execute a SELECT on an unbuffered cursor and yield rows fetched in chunks.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters
+            chunksize: Rows fetched per round trip
+            
+        Yields:
+            Result rows as dictionaries
+            
+        Raises:
+            QueryError: If query execution fails
+        """
+        with self.get_connection_context() as conn:
+            cursor = conn.cursor(dictionary=True, buffered=False)
+            try:
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                rows = cursor.fetchmany(chunksize)
+                while rows:
+                    yield from rows
+                    rows = cursor.fetchmany(chunksize)
+            except MySQLError as e:
+                raise QueryError(f"MySQL query execution failed: {str(e)}")
+            finally:
+                # Drain rows an abandoned iteration left unread so the pooled connection stays usable
+                try:
+                    conn.consume_results()
+                    cursor.close()
+                except Exception as e:
+                    self.logger.warning(f"Error closing MySQL streaming cursor: {str(e)}")
+    
     def execute_transaction(self, queries: List[Tuple[str, Optional[Dict]]]) -> List[Any]:
         """
         Execute multiple queries in a single transaction.
@@ -43,7 +43,6 @@ class PostgreSQLConnector(BaseConnector):
             config: Connection configuration object
         """
         super().__init__(config)
-        self._pool = None
         self._pool_config = None
         
     def _create_connection(self) -> Any:
@@ -12,15 +12,32 @@ Key Features:
 - Clean output format optimized for embeddings
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
 import logging
 from datetime import datetime
 
-from .config_loader import EnrichmentConfigLoader
+from ._compat import DATACLASS_OPTIONS
+from .config_loader import EnrichmentConfigLoader, register_cache_clear_hook
+from .enrichment_summary import EnrichmentSummaryAccumulator
+from .rule_matching import (
+    CompiledRule,
+    CompiledEntity,
+    compile_domain_rules,
+    compile_entity_types,
+    build_field_automaton,
+    build_indicator_automaton,
+    matches_rule
+)
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class EnrichedColumnData:
     """Enriched column data optimized for embeddings."""
     
@@ -40,105 +57,274 @@ class EnrichedColumnData:
     table_name: Optional[str] = None
     full_identifier: Optional[str] = None
     
-    # Enrichment metadata
-    enrichment_timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Enrichment metadata (stamped once per enrichment batch)
+    enrichment_timestamp: Optional[str] = None
+
+
+# Read-only row with the same fields as EnrichedColumnData; batch enrichment builds
+# these compact tuples and only enrich_single_column returns the dataclass
+_EnrichedRow = namedtuple('_EnrichedRow', [f.name for f in fields(EnrichedColumnData)])
+
+
+def _column_signature(column_data: Dict[str, Any]) -> Tuple[str, str, bool, Optional[str]]:
+    """Get the (name, type, nullable, key_type) signature enrichment depends on."""
+    return (
+        column_data.get('name', ''),
+        column_data.get('type', ''),
+        column_data.get('nullable', True),
+        column_data.get('key_type')
+    )
 
 
 class ColumnEnricher:
     """Main class for enriching column data with key phrases and entity types."""
     
     def __init__(self, config_path: Optional[str] = None):
+        self.config_path = config_path
         self.config_loader = EnrichmentConfigLoader(config_path)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
         # Load configurations
         self.key_phrases_config = self.config_loader.load_key_phrases_config()
         self.entity_types_config = self.config_loader.load_entity_types_config()
         
+        # Precompile rule patterns once instead of scanning them per column
+        self._compile_rules()
+        
+        # Columns like id, status or created_at repeat across tables, so cache
+        # enrichment results per column signature (configs are fixed after init)
+        self._enrich_signature = lru_cache(maxsize=4096)(self._compute_signature_enrichment)
+        
         self.logger.info("ColumnEnricher initialized with configurations")
     
+    def _compile_rules(self) -> None:
+        """Precompile field name, data type and indicator patterns from the configs."""
+        
+        extraction_rules = self.key_phrases_config.get('key_phrase_extraction_rules', {})
+        self._compiled_rules = {
+            domain: compile_domain_rules(extraction_rules.get(domain, {}))
+            for domain in ('healthcare_domain', 'general_domain')
+        }
+        self._field_automaton = build_field_automaton(self._compiled_rules)
+        self._compiled_entities = compile_entity_types(self.entity_types_config.get('entity_types', {}))
+        self._indicator_automaton = build_indicator_automaton(self._compiled_entities)
+        
+        selection_rules = self.key_phrases_config.get('phrase_selection_rules', {})
+        self._max_phrases = selection_rules.get('max_phrases_per_field', 5)
+    
     def enrich_column_summary(self, column_summary: Dict[str, Any]) -> Dict[str, Any]:
         """Enrich a complete minimal column summary."""
+        return self._enrich_table(column_summary, datetime.now().isoformat(), {})
+    
+    def enrich_schema(self, column_summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Enrich the minimal column summaries of every table in a schema in one call.
+        
+        Columns with identical signatures (name, type, nullable, key type) across
+        tables are enriched once and the result is reused for each table.
+        
+        Args:
+            column_summaries: Minimal column summaries, one per table
+        
+        Returns:
+            Dictionary with per-table enrichment results in input order
+        """
+        
+        enrichment_timestamp = datetime.now().isoformat()
+        enrichments = {}
+        
+        tables = [
+            self._enrich_table(column_summary, enrichment_timestamp, enrichments)
+            for column_summary in column_summaries
+        ]
+        
+        return {
+            'total_tables': len(tables),
+            'total_columns': sum(table['total_columns'] for table in tables),
+            'unique_column_signatures': len(enrichments),
+            'tables': tables,
+            'enrichment_timestamp': enrichment_timestamp
+        }
+    
+    def enrich_column_summary_parallel(self, column_summary: Dict[str, Any],
+                                       max_workers: Optional[int] = None,
+                                       chunk_size: int = 256,
+                                       min_signatures: int = 1000) -> Dict[str, Any]:
+        """
+        Enrich a large minimal column summary using worker processes.
+        
+        Unique column signatures are split into chunks and enriched by workers
+        that each build (once) an enricher for this enricher's config path;
+        results are then assembled in column order. Tables with few unique
+        signatures are enriched serially, where process overhead would dominate.
+        Workers use the base class, so subclass overrides do not apply to them.
+        
+        Args:
+            column_summary: Minimal column summary of one table
+            max_workers: Maximum number of worker processes (default: CPU count)
+            chunk_size: Number of signatures sent to a worker per task
+            min_signatures: Minimum unique signatures before processes are used
+        
+        Returns:
+            Same result as enrich_column_summary
+        """
+        
+        signatures = list(dict.fromkeys(
+            _column_signature(col) for col in column_summary.get('columns', [])
+        ))
+        if len(signatures) < min_signatures:
+            return self.enrich_column_summary(column_summary)
+        
+        chunks = [signatures[i:i + chunk_size] for i in range(0, len(signatures), chunk_size)]
+        enrichments = {}
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for chunk, results in zip(chunks, executor.map(_enrich_signatures, repeat(self.config_path), chunks)):
+                enrichments.update(zip(chunk, results))
+        
+        return self._enrich_table(column_summary, datetime.now().isoformat(), enrichments)
+    
+    def _enrich_table(self, column_summary: Dict[str, Any], enrichment_timestamp: str,
+                      enrichments: Dict[Tuple, Tuple]) -> Dict[str, Any]:
+        """Enrich one table, sharing per-signature results through `enrichments`."""
         
         table_name = column_summary.get('table', 'unknown')
         enriched_columns = []
+        summary = EnrichmentSummaryAccumulator()
         
+        # Emit output dicts and summary statistics in the same pass
         for col in column_summary.get('columns', []):
-            enriched_col = self.enrich_single_column(col, table_name)
-            enriched_columns.append(enriched_col)
+            signature = _column_signature(col)
+            enrichment = enrichments.get(signature)
+            if enrichment is None:
+                enrichment = enrichments[signature] = self._enrich_signature(*signature)
+            row = self._build_row(signature, enrichment, table_name, enrichment_timestamp)
+            enriched_columns.append(row._asdict())
+            summary.add(row)
         
         return {
             'table': table_name,
             'total_columns': len(enriched_columns),
-            'enriched_columns': [col.__dict__ for col in enriched_columns],
-            'enrichment_summary': self._create_enrichment_summary(enriched_columns),
-            'enrichment_timestamp': datetime.now().isoformat()
+            'enriched_columns': enriched_columns,
+            'enrichment_summary': summary.to_dict(),
+            'enrichment_timestamp': enrichment_timestamp
         }
     
-    def enrich_single_column(self, column_data: Dict[str, Any], table_name: str = None) -> EnrichedColumnData:
+    def enrich_single_column(self, column_data: Dict[str, Any], table_name: str = None,
+                             enrichment_timestamp: Optional[str] = None) -> EnrichedColumnData:
         """Enrich a single column with key phrases and entity types."""
         
+        signature = _column_signature(column_data)
+        row = self._build_row(
+            signature, self._enrich_signature(*signature), table_name,
+            enrichment_timestamp or datetime.now().isoformat()
+        )
+        
         # Create base enriched column
-        enriched = EnrichedColumnData(
-            name=column_data.get('name', ''),
-            type=column_data.get('type', ''),
-            nullable=column_data.get('nullable', True),
-            key_type=column_data.get('key_type'),
+        return EnrichedColumnData(*row)
+    
+    def _build_row(self, signature: Tuple, enrichment: Tuple, table_name: Optional[str],
+                   enrichment_timestamp: str) -> _EnrichedRow:
+        """Build an enriched row from a column signature and its cached enrichment."""
+        
+        name, type_, nullable, key_type = signature
+        key_phrases, entity_type, confidence, semantic_tags = enrichment
+        
+        return _EnrichedRow(
+            name=name,
+            type=type_,
+            nullable=nullable,
+            key_type=key_type,
+            key_phrases=list(key_phrases),
+            entity_type=entity_type,
+            entity_confidence=confidence,
+            semantic_tags=list(semantic_tags),
             table_name=table_name,
-            full_identifier=f"{table_name}.{column_data.get('name', '')}" if table_name else column_data.get('name', '')
+            full_identifier=f"{table_name}.{name}" if table_name else name,
+            enrichment_timestamp=enrichment_timestamp
         )
+    
+    def _compute_signature_enrichment(self, name: str, type_: str, nullable: bool,
+                                      key_type: Optional[str]) -> Tuple[Tuple[str, ...], Optional[str], float, Tuple[str, ...]]:
+        """Compute enrichment for a column signature (cached by _enrich_signature)."""
+        
+        column = EnrichedColumnData(name=name, type=type_, nullable=nullable, key_type=key_type)
+        name_lower = name.lower()
+        type_lower = type_.lower()
         
         # Extract key phrases
-        enriched.key_phrases = self.extract_key_phrases(enriched)
+        key_phrases = self.extract_key_phrases(column, name_lower, type_lower)
         
         # Classify entity type
-        entity_result = self.classify_entity_type(enriched)
-        enriched.entity_type = entity_result['entity_type']
-        enriched.entity_confidence = entity_result['confidence']
-        enriched.semantic_tags = entity_result['semantic_tags']
+        entity_result = self.classify_entity_type(column, name_lower)
         
-        return enriched
+        return (
+            tuple(key_phrases),
+            entity_result['entity_type'],
+            entity_result['confidence'],
+            tuple(entity_result['semantic_tags'])
+        )
     
-    def extract_key_phrases(self, column: EnrichedColumnData) -> List[str]:
+    def extract_key_phrases(self, column: EnrichedColumnData,
+                            name_lower: Optional[str] = None,
+                            type_lower: Optional[str] = None) -> List[str]:
         """Extract key phrases for a column based on configured rules."""
         
-        key_phrases = []
-        extraction_rules = self.key_phrases_config.get('key_phrase_extraction_rules', {})
-        
-        # Check healthcare domain rules first
-        healthcare_rules = extraction_rules.get('healthcare_domain', {})
-        phrases = self._extract_from_domain_rules(column, healthcare_rules)
-        key_phrases.extend(phrases)
+        # Lowercase once per column; callers that already did may pass them in
+        if name_lower is None:
+            name_lower = column.name.lower()
+        if type_lower is None:
+            type_lower = column.type.lower()
         
-        # Check general domain rules
-        general_rules = extraction_rules.get('general_domain', {})
-        phrases = self._extract_from_domain_rules(column, general_rules)
-        key_phrases.extend(phrases)
+        # One scan of the column name finds every rule whose field patterns it contains
+        field_hits = self._field_automaton.find(name_lower)
         
-        # Apply phrase selection rules
-        key_phrases = self._apply_phrase_selection_rules(key_phrases)
+        key_phrases = []
+        seen = set()
+        if self._max_phrases <= 0:
+            return key_phrases
+        
+        # Healthcare domain rules first, then general ones; dedupe case-insensitively
+        # and stop evaluating rules once the phrase limit is reached
+        for domain in ('healthcare_domain', 'general_domain'):
+            for phrase in self._extract_from_domain_rules(domain, name_lower, type_lower, field_hits):
+                phrase_lower = phrase.lower()
+                if phrase_lower not in seen:
+                    seen.add(phrase_lower)
+                    key_phrases.append(phrase)
+                    if len(key_phrases) >= self._max_phrases:
+                        return key_phrases
         
         return key_phrases
     
-    def classify_entity_type(self, column: EnrichedColumnData) -> Dict[str, Any]:
+    def classify_entity_type(self, column: EnrichedColumnData,
+                             name_lower: Optional[str] = None) -> Dict[str, Any]:
         """Classify the entity type of a column."""
         
-        entity_types = self.entity_types_config.get('entity_types', {})
+        if name_lower is None:
+            name_lower = column.name.lower()
+        
         classification_rules = self.entity_types_config.get('entity_classification_rules', {})
         
         best_match = None
         best_confidence = 0.0
         best_semantic_tags = []
         
+        # One scan of the column name finds every entity with a matching indicator
+        name_matches = self._indicator_automaton.find(name_lower)
+        
         # Check all entity categories
-        for category, entities in entity_types.items():
-            for entity_key, entity_config in entities.items():
-                confidence = self._calculate_entity_confidence(column, entity_config, classification_rules)
+        for index, entity in enumerate(self._compiled_entities):
+            confidence = self._calculate_entity_confidence(column, entity, classification_rules, index in name_matches)
+            
+            if confidence > best_confidence:
+                best_confidence = confidence
+                best_match = entity.config.get('type')
+                best_semantic_tags = entity.config.get('semantic_tags', [])
                 
-                if confidence > best_confidence:
-                    best_confidence = confidence
-                    best_match = entity_config.get('type')
-                    best_semantic_tags = entity_config.get('semantic_tags', [])
+                # Confidence is capped at 1.0, so no later entity can win
+                if best_confidence >= 1.0:
+                    break
         
         # Apply confidence thresholds
         thresholds = classification_rules.get('confidence_thresholds', {})
@@ -154,53 +340,36 @@ class ColumnEnricher:
             'semantic_tags': best_semantic_tags
         }
     
-    def _extract_from_domain_rules(self, column: EnrichedColumnData, domain_rules: Dict[str, Any]) -> List[str]:
-        """Extract key phrases from domain-specific rules."""
-        
-        phrases = []
-        
-        for rule_name, rule_config in domain_rules.items():
-            if self._matches_rule(column, rule_config):
-                rule_phrases = rule_config.get('key_phrases', [])
-                phrases.extend(rule_phrases)
-        
-        return phrases
+    def _extract_from_domain_rules(self, domain: str, name_lower: str, type_lower: str,
+                                   field_hits: Set[Tuple[str, int]]) -> Iterator[str]:
+        """Extract key phrases from domain-specific rules (lazily, in rule order)."""
+        
+        for index, rule in enumerate(self._compiled_rules[domain]):
+            # Rules with field patterns can only match if the name scan hit them
+            if rule.field_re is not None and (domain, index) not in field_hits:
+                continue
+            if self._matches_rule(rule, name_lower, type_lower):
+                yield from rule.key_phrases
     
-    def _matches_rule(self, column: EnrichedColumnData, rule_config: Dict[str, Any]) -> bool:
+    def _matches_rule(self, rule: CompiledRule, name_lower: str, type_lower: str) -> bool:
         """Check if a column matches a specific rule configuration."""
         
-        # Check field name patterns
-        field_patterns = rule_config.get('field_name_patterns', [])
-        if field_patterns:
-            field_match = any(pattern.lower() in column.name.lower() for pattern in field_patterns)
-            if not field_match:
-                return False
-        
-        # Check data type patterns
-        type_patterns = rule_config.get('data_type_patterns', [])
-        if type_patterns:
-            type_match = any(pattern.lower() in column.type.lower() for pattern in type_patterns)
-            if not type_match:
-                return False
-        
         # Skip pattern-based matching since we removed patterns field
         # Focus on field name and data type matching only
-        
-        return True
+        return matches_rule(rule, name_lower, type_lower)
     
     def _calculate_entity_confidence(self, column: EnrichedColumnData, 
-                                   entity_config: Dict[str, Any],
-                                   classification_rules: Dict[str, Any]) -> float:
+                                   entity: CompiledEntity,
+                                   classification_rules: Dict[str, Any],
+                                   name_match: bool) -> float:
         """Calculate confidence score for entity type classification."""
         
         confidence = 0.0
+        entity_config = entity.config
         
         # Field name matching
-        field_indicators = entity_config.get('field_indicators', [])
-        if field_indicators:
-            field_match = any(indicator.lower() in column.name.lower() for indicator in field_indicators)
-            if field_match:
-                confidence += 0.4
+        if name_match:
+            confidence += 0.4
         
         # Data characteristics matching
         data_chars = entity_config.get('data_characteristics', {})
@@ -217,55 +386,48 @@ class ColumnEnricher:
         # Skip pattern-based matching since patterns are removed for clean profiling
         
         return min(confidence, 1.0)  # Cap at 1.0
-    
-    def _apply_phrase_selection_rules(self, phrases: List[str]) -> List[str]:
-        """Apply phrase selection rules to filter and deduplicate key phrases."""
-        
-        selection_rules = self.key_phrases_config.get('phrase_selection_rules', {})
-        max_phrases = selection_rules.get('max_phrases_per_field', 5)
-        
-        # Remove duplicates while preserving order
-        unique_phrases = []
-        seen = set()
-        for phrase in phrases:
-            if phrase.lower() not in seen:
-                unique_phrases.append(phrase)
-                seen.add(phrase.lower())
-        
-        # Limit to max phrases
-        return unique_phrases[:max_phrases]
-    
-    def _create_enrichment_summary(self, enriched_columns: List[EnrichedColumnData]) -> Dict[str, Any]:
-        """Create summary of enrichment results."""
-        
-        return {
-            'total_columns': len(enriched_columns),
-            'columns_with_key_phrases': len([col for col in enriched_columns if col.key_phrases]),
-            'columns_with_entity_types': len([col for col in enriched_columns if col.entity_type]),
-            'unique_entity_types': len(set(col.entity_type for col in enriched_columns if col.entity_type)),
-            'avg_entity_confidence': sum(col.entity_confidence for col in enriched_columns) / len(enriched_columns) if enriched_columns else 0.0,
-            'total_key_phrases': sum(len(col.key_phrases) for col in enriched_columns),
-            'unique_semantic_tags': len(set(tag for col in enriched_columns for tag in col.semantic_tags))
-        }
 
 
 # Convenience functions
+def _enrich_signatures(config_path: Optional[str], signatures: List[Tuple]) -> List[Tuple]:
+    """Enrich a chunk of column signatures in a worker process."""
+    enricher = _get_enricher(config_path)
+    return [enricher._enrich_signature(*signature) for signature in signatures]
+
+
+@lru_cache(maxsize=8)
+def _get_enricher(config_path: Optional[str] = None) -> ColumnEnricher:
+    """
+    Get a shared enricher for a config path.
+    
+    Enrichers are read-only after initialization (the signature cache is an
+    lru_cache, which is thread-safe), so one instance can serve all callers.
+    After changing config files on disk, call
+    `EnrichmentConfigLoader.clear_global_cache()` (or `reload_configs()`),
+    which also drops these enrichers.
+    """
+    return ColumnEnricher(config_path)
+
+
+register_cache_clear_hook(_get_enricher.cache_clear)
+
+
 def enrich_minimal_column_summary(column_summary: Dict[str, Any], config_path: Optional[str] = None) -> Dict[str, Any]:
     """Convenience function to enrich a minimal column summary."""
-    enricher = ColumnEnricher(config_path)
+    enricher = _get_enricher(config_path)
     return enricher.enrich_column_summary(column_summary)
 
 
 def extract_key_phrases(column_data: Dict[str, Any], table_name: str = None, config_path: Optional[str] = None) -> List[str]:
     """Convenience function to extract key phrases for a single column."""
-    enricher = ColumnEnricher(config_path)
+    enricher = _get_enricher(config_path)
     enriched = enricher.enrich_single_column(column_data, table_name)
     return enriched.key_phrases
 
 
 def classify_entity_types(column_data: Dict[str, Any], table_name: str = None, config_path: Optional[str] = None) -> Dict[str, Any]:
     """Convenience function to classify entity type for a single column."""
-    enricher = ColumnEnricher(config_path)
+    enricher = _get_enricher(config_path)
     enriched = enricher.enrich_single_column(column_data, table_name)
     return {
         'entity_type': enriched.entity_type,
@@ -8,10 +8,71 @@ for key phrase extraction and entity type classification.
 
 import json
 import logging
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Longer strings are descriptions, not identifiers worth interning
+_MAX_INTERNED_LENGTH = 256
+
+
+def _intern_strings(value: Any) -> Any:
+    """
+    Recursively intern the short strings of a parsed config.
+    
+    Entity types, semantic tags and key phrases are copied into every
+    enriched column; interning makes all of them share one object per value.
+    """
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) < _MAX_INTERNED_LENGTH else value
+    if isinstance(value, dict):
+        return {_intern_strings(key): _intern_strings(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    return value
+
+
+# Parsed configs shared by all loaders in the process, keyed by
+# (resolved config directory, config name). Entries are treated as read-only.
+_GLOBAL_CONFIG_CACHE: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_GLOBAL_CONFIG_LOCK = threading.Lock()
+
+# Callbacks dropping objects built from cached configs (e.g. shared enrichers)
+_CACHE_CLEAR_HOOKS: List[Callable[[], None]] = []
+
+
+def register_cache_clear_hook(hook: Callable[[], None]) -> None:
+    """
+    Register a callback run whenever cached configurations are dropped.
+    
+    Args:
+        hook: Callable clearing a cache of objects built from the configs
+    """
+    _CACHE_CLEAR_HOOKS.append(hook)
+
+
+def _run_cache_clear_hooks() -> None:
+    """Run the registered cache clear callbacks."""
+    for hook in _CACHE_CLEAR_HOOKS:
+        hook()
+
 
 @dataclass
 class EnrichmentConfig:
@@ -31,52 +92,55 @@ class EnrichmentConfigLoader:
         else:
             self.config_base_path = Path(config_base_path)
         
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self._cached_configs = {}
     
     def load_key_phrases_config(self) -> Dict[str, Any]:
         """Load key phrases extraction rules configuration."""
-        
-        config_file = self.config_base_path / "key_phrases_config.json"
-        
-        if 'key_phrases' not in self._cached_configs:
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
-                self._cached_configs['key_phrases'] = config
-                self.logger.info(f"Loaded key phrases config from: {config_file}")
-                
-            except FileNotFoundError:
-                self.logger.error(f"Key phrases config file not found: {config_file}")
-                raise
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Invalid JSON in key phrases config: {e}")
-                raise
-        
-        return self._cached_configs['key_phrases']
+        return self._load_config('key_phrases', "key_phrases_config.json", "key phrases")
     
     def load_entity_types_config(self) -> Dict[str, Any]:
         """Load entity types classification configuration."""
+        return self._load_config('entity_types', "entity_types_config.json", "entity types")
+    
+    def _load_config(self, config_name: str, file_name: str, description: str) -> Dict[str, Any]:
+        """
+        Load a configuration file through the instance and process-level caches.
+        
+        Args:
+            config_name: Cache key of the configuration
+            file_name: File name inside the config directory
+            description: Human readable name used in log messages
+        
+        Returns:
+            Parsed configuration (shared across loaders; do not mutate)
+        """
+        if config_name in self._cached_configs:
+            return self._cached_configs[config_name]
         
-        config_file = self.config_base_path / "entity_types_config.json"
+        config_file = self.config_base_path / file_name
+        cache_key = (str(self.config_base_path.resolve()), config_name)
         
-        if 'entity_types' not in self._cached_configs:
+        with _GLOBAL_CONFIG_LOCK:
+            config = _GLOBAL_CONFIG_CACHE.get(cache_key)
+        
+        if config is None:
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
-                self._cached_configs['entity_types'] = config
-                self.logger.info(f"Loaded entity types config from: {config_file}")
+                config = _intern_strings(_loads_json(config_file.read_bytes()))
+                self.logger.info("Loaded %s config from: %s", description, config_file)
                 
             except FileNotFoundError:
-                self.logger.error(f"Entity types config file not found: {config_file}")
+                self.logger.error("%s config file not found: %s", description.capitalize(), config_file)
                 raise
             except json.JSONDecodeError as e:
-                self.logger.error(f"Invalid JSON in entity types config: {e}")
+                self.logger.error("Invalid JSON in %s config: %s", description, e)
                 raise
+            
+            with _GLOBAL_CONFIG_LOCK:
+                config = _GLOBAL_CONFIG_CACHE.setdefault(cache_key, config)
         
-        return self._cached_configs['entity_types']
+        self._cached_configs[config_name] = config
+        return config
     
     def load_complete_config(self) -> EnrichmentConfig:
         """Load complete enrichment configuration."""
@@ -98,9 +162,22 @@ class EnrichmentConfigLoader:
     
     def reload_configs(self) -> None:
         """Clear cache and reload all configurations."""
+        base_path = str(self.config_base_path.resolve())
+        with _GLOBAL_CONFIG_LOCK:
+            for cache_key in [key for key in _GLOBAL_CONFIG_CACHE if key[0] == base_path]:
+                del _GLOBAL_CONFIG_CACHE[cache_key]
+        
         self._cached_configs.clear()
+        _run_cache_clear_hooks()
         self.logger.info("Cleared configuration cache")
     
+    @staticmethod
+    def clear_global_cache() -> None:
+        """Clear the process-level cache of parsed configurations and shared enrichers for all paths."""
+        with _GLOBAL_CONFIG_LOCK:
+            _GLOBAL_CONFIG_CACHE.clear()
+        _run_cache_clear_hooks()
+    
     def get_config_info(self) -> Dict[str, Any]:
         """Get information about loaded configurations."""
         
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Enrichment Summary
+
+This module accumulates the per-table enrichment summary while columns are
+being enriched, so the enrichers do not need a second pass over the
+enriched columns to compute it.
+"""
+
+from typing import Any, Dict
+
+
+class EnrichmentSummaryAccumulator:
+    """Incrementally computes the enrichment summary of a table."""
+    
+    def __init__(self):
+        self.total_columns = 0
+        self.with_key_phrases = 0
+        self.with_entity_types = 0
+        self.total_key_phrases = 0
+        self.total_confidence = 0.0
+        self.entity_types = set()
+        self.semantic_tags = set()
+    
+    def add(self, column: Any) -> None:
+        """
+        Add an enriched column to the summary.
+        
+        Args:
+            column: Enriched column or row with key_phrases, entity_type,
+                entity_confidence and semantic_tags attributes
+        """
+        self.total_columns += 1
+        if column.key_phrases:
+            self.with_key_phrases += 1
+            self.total_key_phrases += len(column.key_phrases)
+        if column.entity_type:
+            self.with_entity_types += 1
+            self.entity_types.add(column.entity_type)
+        self.total_confidence += column.entity_confidence
+        self.semantic_tags.update(column.semantic_tags)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the summary of all added columns."""
+        return {
+            'total_columns': self.total_columns,
+            'columns_with_key_phrases': self.with_key_phrases,
+            'columns_with_entity_types': self.with_entity_types,
+            'unique_entity_types': len(self.entity_types),
+            'avg_entity_confidence': self.total_confidence / self.total_columns if self.total_columns else 0.0,
+            'total_key_phrases': self.total_key_phrases,
+            'unique_semantic_tags': len(self.semantic_tags)
+        }
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Rule Matching Helpers
+
+This module precompiles the substring patterns used by the enrichment rules
+so each column is matched with a single C-level regex scan instead of a
+Python loop over every pattern, specializes each rule's predicate to the
+pattern groups it actually has, and builds Aho-Corasick automata over rule
+field name patterns and entity field indicators so one pass over a column
+name finds every rule and entity it can match.
+"""
+
+import re
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+RuleMatcher = Callable[[str, str], bool]
+
+
+class CompiledRule(NamedTuple):
+    """Key phrase extraction rule with precompiled field name and data type patterns."""
+    name: str
+    field_patterns: Tuple[str, ...]
+    field_re: Optional[re.Pattern]
+    type_re: Optional[re.Pattern]
+    key_phrases: List[str]
+    matcher: RuleMatcher
+
+
+class CompiledEntity(NamedTuple):
+    """Entity type configuration flattened out of its category."""
+    category: str
+    key: str
+    config: Dict[str, Any]
+
+
+class IndicatorAutomaton:
+    """
+    Aho-Corasick automaton for multi-pattern substring matching.
+    
+    Each added pattern carries a payload; `find` returns the payloads of all
+    patterns occurring in a text in a single linear scan.
+    """
+    
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[Hashable]] = [set()]
+        self._built = False
+    
+    def add(self, pattern: str, payload: Hashable) -> None:
+        """Add a (lowercased) pattern with its payload."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].add(payload)
+        self._built = False
+    
+    def build(self) -> None:
+        """Compute failure links and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+                queue.append(next_state)
+        
+        self._built = True
+    
+    def find(self, text: str) -> Set[Hashable]:
+        """
+        Find the payloads of all patterns contained in a text.
+        
+        Args:
+            text: Lowercased text to scan
+        
+        Returns:
+            Set of payloads of matching patterns
+        """
+        if not self._built:
+            self.build()
+        
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set(output[0])  # Empty patterns match everything
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+def compile_substring_pattern(patterns: Iterable[str]) -> Optional[re.Pattern]:
+    """
+    Compile substring patterns into one case-insensitive alternation.
+    
+    `pattern.search(text.lower())` is equivalent to
+    `any(p.lower() in text.lower() for p in patterns)`.
+    
+    Args:
+        patterns: Substrings to look for
+    
+    Returns:
+        Compiled pattern, or None if there are no patterns (no constraint)
+    """
+    lowered = [p.lower() for p in patterns]
+    if not lowered:
+        return None
+    
+    # Longest first so the alternation prefers the most specific substring
+    lowered.sort(key=len, reverse=True)
+    return re.compile('|'.join(re.escape(p) for p in lowered))
+
+
+def _always_match(name_lower: str, type_lower: str) -> bool:
+    """Matcher for rules without field name or data type patterns."""
+    return True
+
+
+def compile_rule_matcher(field_re: Optional[re.Pattern], type_re: Optional[re.Pattern]) -> RuleMatcher:
+    """
+    Specialize a rule predicate for the pattern groups the rule actually has.
+    
+    The returned callable skips the None checks of a generic matcher and binds
+    the compiled patterns' search methods directly.
+    
+    Args:
+        field_re: Compiled field name pattern, or None for no constraint
+        type_re: Compiled data type pattern, or None for no constraint
+    
+    Returns:
+        Callable taking (name_lower, type_lower) and returning whether they match
+    """
+    if field_re is None and type_re is None:
+        return _always_match
+    
+    if type_re is None:
+        field_search = field_re.search
+        return lambda name_lower, type_lower: field_search(name_lower) is not None
+    
+    if field_re is None:
+        type_search = type_re.search
+        return lambda name_lower, type_lower: type_search(type_lower) is not None
+    
+    field_search = field_re.search
+    type_search = type_re.search
+    return lambda name_lower, type_lower: (field_search(name_lower) is not None
+                                           and type_search(type_lower) is not None)
+
+
+def _compile_rule(rule_name: str, rule_config: Dict[str, Any]) -> CompiledRule:
+    """Compile a single key phrase extraction rule."""
+    field_patterns = rule_config.get('field_name_patterns', [])
+    field_re = compile_substring_pattern(field_patterns)
+    type_re = compile_substring_pattern(rule_config.get('data_type_patterns', []))
+    return CompiledRule(
+        name=rule_name,
+        field_patterns=tuple(pattern.lower() for pattern in field_patterns),
+        field_re=field_re,
+        type_re=type_re,
+        key_phrases=rule_config.get('key_phrases', []),
+        matcher=compile_rule_matcher(field_re, type_re)
+    )
+
+
+def compile_domain_rules(domain_rules: Dict[str, Any]) -> List[CompiledRule]:
+    """
+    Precompile all rules of a key phrase extraction domain.
+    
+    Args:
+        domain_rules: Mapping of rule name to rule configuration
+    
+    Returns:
+        List of compiled rules in configuration order
+    """
+    return [
+        _compile_rule(rule_name, rule_config)
+        for rule_name, rule_config in domain_rules.items()
+    ]
+
+
+def compile_entity_types(entity_types: Dict[str, Any]) -> List[CompiledEntity]:
+    """
+    Flatten and precompile all entity type configurations.
+    
+    Args:
+        entity_types: Mapping of category to {entity_key: entity_config}
+    
+    Returns:
+        List of compiled entities in configuration order
+    """
+    return [
+        CompiledEntity(category=category, key=entity_key, config=entity_config)
+        for category, entities in entity_types.items()
+        for entity_key, entity_config in entities.items()
+    ]
+
+
+def build_indicator_automaton(entities: List[CompiledEntity]) -> IndicatorAutomaton:
+    """
+    Build one automaton over the field indicators of all entities.
+    
+    Args:
+        entities: Compiled entities
+    
+    Returns:
+        Automaton whose payloads are indexes into `entities`
+    """
+    automaton = IndicatorAutomaton()
+    for index, entity in enumerate(entities):
+        for indicator in entity.config.get('field_indicators', []):
+            automaton.add(indicator.lower(), index)
+    automaton.build()
+    return automaton
+
+
+def build_field_automaton(domains: Dict[str, List[CompiledRule]]) -> IndicatorAutomaton:
+    """
+    Build one automaton over the field name patterns of all rule domains.
+    
+    A single scan of a column name then yields every rule whose field name
+    patterns occur in it, so the remaining rules can be skipped outright.
+    
+    Args:
+        domains: Mapping of domain name to its compiled rules
+    
+    Returns:
+        Automaton whose payloads are (domain, rule index) pairs
+    """
+    automaton = IndicatorAutomaton()
+    for domain, rules in domains.items():
+        for index, rule in enumerate(rules):
+            for pattern in rule.field_patterns:
+                automaton.add(pattern, (domain, index))
+    automaton.build()
+    return automaton
+
+
+def matches_rule(rule: CompiledRule, name_lower: str, type_lower: str) -> bool:
+    """
+    Check if a column matches a compiled rule.
+    
+    Args:
+        rule: Compiled rule
+        name_lower: Lowercased column name
+        type_lower: Lowercased column data type
+    
+    Returns:
+        True if every configured pattern group matches
+    """
+    return rule.matcher(name_lower, type_lower)
@@ -16,6 +16,11 @@ from .column_normalizer import (
     ColumnFieldNormalizer,
     ViewType,
     NormalizedField,
+    CompiledColumnSummary,
+    ColumnRecord,
+    PatternFieldInfo,
+    TypeFieldInfo,
+    quality_score,
     normalize_to_field_list,
     normalize_to_column_dict,
     normalize_to_flat_structure,
@@ -28,6 +33,11 @@ __all__ = [
     'ColumnFieldNormalizer',
     'ViewType',
     'NormalizedField',
+    'CompiledColumnSummary',
+    'ColumnRecord',
+    'PatternFieldInfo',
+    'TypeFieldInfo',
+    'quality_score',
     'normalize_to_field_list',
     'normalize_to_column_dict', 
     'normalize_to_flat_structure',
@@ -14,10 +14,27 @@ Key Normalization Views:
 - LLM-optimized formats
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Callable, Dict, Iterable, List, Any, NamedTuple, Optional, Sequence, Tuple, Union
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields as dataclass_fields
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+import json
+import re
+import sys
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
 
 
 class ViewType(Enum):
@@ -30,7 +47,77 @@ class ViewType(Enum):
     LLM_OPTIMIZED = "llm_optimized"
 
 
-@dataclass
+# Data type keywords per category, checked in order (first substring match wins)
+_CATEGORY_KEYWORDS = (
+    ('integer', ('int', 'bigint', 'smallint', 'tinyint')),
+    ('numeric', ('float', 'double', 'decimal', 'numeric')),
+    ('text', ('varchar', 'text', 'char', 'string')),
+    ('temporal', ('date', 'time', 'timestamp')),
+    ('boolean', ('bool', 'bit')),
+    ('structured', ('json', 'xml'))
+)
+
+# One precompiled alternation per category, so a cache miss costs at most
+# six C-level searches instead of a Python loop over every keyword
+_CATEGORY_PATTERNS = tuple(
+    (category, re.compile('|'.join(re.escape(keyword) for keyword in keywords)))
+    for category, keywords in _CATEGORY_KEYWORDS
+)
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern a repeated identifier string (key types, data types).
+    
+    Category names and the 'none' sentinel are source literals and already
+    interned; strings read from a column summary are not.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=1024)
+def _categorize_type(data_type: str) -> str:
+    """Categorize a raw data type string (cached; schemas reuse few distinct types)."""
+    type_lower = data_type.lower()
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(type_lower):
+            return category
+    return 'other'
+
+
+def quality_score(null_pct: float, unique_pct: float, is_key: bool) -> float:
+    """
+    Calculate a data quality score from null percentage and uniqueness.
+    
+    Args:
+        null_pct: Percentage of null values (0-100)
+        unique_pct: Percentage of unique values (0-100)
+        is_key: Whether the column is a key column
+    
+    Returns:
+        Quality score where 1.0 is best
+    """
+    # Higher score for lower null percentage and appropriate uniqueness
+    null_score = (100 - null_pct) / 100
+    
+    # Uniqueness score depends on field type
+    if is_key:
+        unique_score = unique_pct / 100  # Keys should be unique
+    elif unique_pct < 10:
+        unique_score = unique_pct / 10  # Low uniqueness
+    elif unique_pct > 90:
+        unique_score = (100 - unique_pct) / 10 + 0.9  # Very high uniqueness
+    else:
+        unique_score = 1.0  # Good moderate uniqueness for non-keys
+    
+    return (null_score * 0.7) + (unique_score * 0.3)
+
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class NormalizedField:
     """Normalized field representation."""
     name: str
@@ -48,349 +135,717 @@ class NormalizedField:
     quality_score: float = field(init=False)
     
     def __post_init__(self):
-        self.is_key = self.key_type is not None
+        # Derived attributes are plain slots rather than cached properties: fields
+        # are built once per column signature (see _build_normalized) and views
+        # that need none of them skip NormalizedField altogether
+        is_key = self.key_type is not None
+        self.is_key = is_key
         self.is_pattern_field = len(self.patterns) > 0
-        self.data_category = self._categorize_data_type()
-        self.quality_score = self._calculate_quality_score()
+        self.data_category = _categorize_type(self.type)
+        self.quality_score = quality_score(self.null_pct, self.unique_pct, is_key)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the field as a plain dictionary in field order (patterns list copied)."""
+        data = dict(zip(_FIELD_NAMES, _field_values(self)))
+        data['patterns'] = list(self.patterns)
+        return data
     
     def _categorize_data_type(self) -> str:
         """Categorize data type into broad categories."""
-        type_lower = self.type.lower()
-        
-        if any(t in type_lower for t in ['int', 'bigint', 'smallint', 'tinyint']):
-            return 'integer'
-        elif any(t in type_lower for t in ['float', 'double', 'decimal', 'numeric']):
-            return 'numeric'
-        elif any(t in type_lower for t in ['varchar', 'text', 'char', 'string']):
-            return 'text'
-        elif any(t in type_lower for t in ['date', 'time', 'timestamp']):
-            return 'temporal'
-        elif any(t in type_lower for t in ['bool', 'bit']):
-            return 'boolean'
-        elif any(t in type_lower for t in ['json', 'xml']):
-            return 'structured'
-        else:
-            return 'other'
+        return _categorize_type(self.type)
     
     def _calculate_quality_score(self) -> float:
         """Calculate data quality score based on null percentage and uniqueness."""
-        # Higher score for lower null percentage and appropriate uniqueness
-        null_score = (100 - self.null_pct) / 100
-        
-        # Uniqueness score depends on field type
-        if self.is_key:
-            unique_score = self.unique_pct / 100  # Keys should be unique
-        else:
-            # Non-keys: moderate uniqueness is often good
-            if self.unique_pct < 10:
-                unique_score = self.unique_pct / 10  # Low uniqueness
-            elif self.unique_pct > 90:
-                unique_score = (100 - self.unique_pct) / 10 + 0.9  # Very high uniqueness
-            else:
-                unique_score = 1.0  # Good moderate uniqueness
-        
-        return (null_score * 0.7) + (unique_score * 0.3)
+        return quality_score(self.null_pct, self.unique_pct, self.is_key)
 
 
-class ColumnFieldNormalizer:
-    """Main class for normalizing column summaries into different views."""
+# Field names (including derived ones) and a C-level getter used by as_dict
+_FIELD_NAMES = tuple(f.name for f in dataclass_fields(NormalizedField))
+_field_values = attrgetter(*_FIELD_NAMES)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _build_normalized(name: str, type_: str, nullable: bool, key_type: Optional[str],
+                      patterns: tuple, null_pct: float, unique_pct: float) -> NormalizedField:
+    """Build a NormalizedField for a column record (cached by _normalized_field)."""
+    return NormalizedField(
+        name=name,
+        type=type_,
+        nullable=nullable,
+        key_type=key_type,
+        patterns=list(patterns),
+        null_pct=null_pct,
+        unique_pct=unique_pct
+    )
+
+
+class ColumnRecord(NamedTuple):
+    """Column summary entry with its defaults applied (fields in _build_normalized order)."""
+    name: str
+    type: str
+    nullable: bool
+    key_type: Optional[str]
+    patterns: Tuple[str, ...]
+    null_pct: float
+    unique_pct: float
+
+
+def _column_record(col: Dict[str, Any]) -> ColumnRecord:
+    """Read a column summary entry once, applying defaults and interning identifiers."""
+    return ColumnRecord(
+        col['name'],
+        _intern(col['type']),
+        col['nullable'],
+        _intern(col.get('key_type')),
+        tuple(col.get('patterns', [])),
+        col.get('null_pct', 0.0),
+        col.get('unique_pct', 0.0)
+    )
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class CompiledColumnSummary:
+    """
+    Column summary whose entries were read and defaulted once.
     
-    def __init__(self):
-        self.supported_views = list(ViewType)
+    Pass it anywhere a column summary is accepted to normalize the same
+    summary into several views without re-reading the column dicts.
+    """
+    table: Optional[str]
+    columns: Tuple[ColumnRecord, ...]
     
-    def normalize(self, column_summary: Dict[str, Any], view_type: ViewType) -> Dict[str, Any]:
-        """Main normalization method that routes to specific normalizers."""
-        
-        if view_type == ViewType.FIELD_LIST:
-            return self.to_field_list(column_summary)
-        elif view_type == ViewType.COLUMN_DICT:
-            return self.to_column_dict(column_summary)
-        elif view_type == ViewType.FLAT_STRUCTURE:
-            return self.to_flat_structure(column_summary)
-        elif view_type == ViewType.PATTERN_GROUPS:
-            return self.to_pattern_groups(column_summary)
-        elif view_type == ViewType.TYPE_GROUPS:
-            return self.to_type_groups(column_summary)
-        elif view_type == ViewType.LLM_OPTIMIZED:
-            return self.to_llm_optimized(column_summary)
-        else:
-            raise ValueError(f"Unsupported view type: {view_type}")
+    @classmethod
+    def from_summary(cls, column_summary: Dict[str, Any]) -> 'CompiledColumnSummary':
+        """Compile a minimal column summary."""
+        return cls(
+            table=column_summary.get('table'),
+            columns=tuple(_column_record(col) for col in column_summary.get('columns', []))
+        )
+
+
+SummaryInput = Union[Dict[str, Any], CompiledColumnSummary]
+
+
+def _summary_records(column_summary: SummaryInput) -> Tuple[Optional[str], Iterable[ColumnRecord]]:
+    """Get the table name and column records of a plain or compiled summary."""
+    if isinstance(column_summary, CompiledColumnSummary):
+        return column_summary.table, column_summary.columns
+    return column_summary.get('table'), map(_column_record, column_summary.get('columns', []))
+
+
+def _normalized_field(record: ColumnRecord) -> NormalizedField:
+    """
+    Get the NormalizedField of a column record.
     
-    def to_field_list(self, column_summary: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert to field list view - array of field objects."""
-        
-        fields = []
-        for col in column_summary.get('columns', []):
-            field_obj = NormalizedField(
-                name=col['name'],
-                type=col['type'],
-                nullable=col['nullable'],
-                key_type=col.get('key_type'),
-                patterns=col.get('patterns', []),
-                null_pct=col.get('null_pct', 0.0),
-                unique_pct=col.get('unique_pct', 0.0)
-            )
-            fields.append(field_obj.__dict__)
-        
+    Fields are shared between views and repeated columns, so treat them as
+    read-only and copy mutable attributes into view output.
+    """
+    return _build_normalized(*record)
+
+
+class PatternFieldInfo(NamedTuple):
+    """Compact field entry of the pattern grouping view (same keys as its dict form)."""
+    name: str
+    type: str
+    key_type: Optional[str]
+    quality_score: float
+
+
+class TypeFieldInfo(NamedTuple):
+    """Compact field entry of the data type grouping view (same keys as its dict form)."""
+    name: str
+    nullable: bool
+    key_type: Optional[str]
+    patterns: Tuple[str, ...]
+    quality_score: float
+
+
+@lru_cache(maxsize=256)
+def _join_patterns(patterns: tuple) -> str:
+    """Comma-join a pattern set (cached, since the same sets recur across columns)."""
+    return ','.join(patterns)
+
+
+@lru_cache(maxsize=4096)
+def _compact_field(name: str, type_: str, nullable: bool, key_type: Optional[str],
+                   patterns: tuple) -> str:
+    """Compact 'name:type NOT NULL KEY [patterns]' string of a field, joined once from its parts."""
+    parts = [name, ':', type_]
+    if not nullable:
+        parts.append(" NOT NULL")
+    if key_type:
+        parts += (' ', key_type)
+    if patterns:
+        parts += (' [', _join_patterns(patterns), ']')
+    return ''.join(parts)
+
+
+class _FieldListView:
+    """Accumulates the field list view - array of field objects."""
+    
+    def __init__(self, table: Optional[str]):
+        self.table = table
+        self.fields = []
+        self.key_fields = 0
+        self.pattern_fields = 0
+        self.nullable_fields = 0
+        self.quality_total = 0
+    
+    def add(self, field_obj: NormalizedField) -> None:
+        self.fields.append(field_obj.as_dict())
+        if field_obj.is_key:
+            self.key_fields += 1
+        if field_obj.is_pattern_field:
+            self.pattern_fields += 1
+        if field_obj.nullable:
+            self.nullable_fields += 1
+        self.quality_total += field_obj.quality_score
+    
+    def build(self) -> Dict[str, Any]:
+        fields = self.fields
         return {
-            'table': column_summary.get('table'),
+            'table': self.table,
             'total_columns': len(fields),
             'view_type': 'field_list',
             'fields': fields,
             'summary': {
-                'key_fields': len([f for f in fields if f.get('is_key')]),
-                'pattern_fields': len([f for f in fields if f.get('is_pattern_field')]),
-                'nullable_fields': len([f for f in fields if f.get('nullable')]),
-                'avg_quality_score': sum(f.get('quality_score', 0) for f in fields) / len(fields) if fields else 0
+                'key_fields': self.key_fields,
+                'pattern_fields': self.pattern_fields,
+                'nullable_fields': self.nullable_fields,
+                'avg_quality_score': self.quality_total / len(fields) if fields else 0
             }
         }
+
+
+class _ColumnDictView:
+    """Accumulates the column dictionary view - key-value mapping by column name."""
     
-    def to_column_dict(self, column_summary: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert to column dictionary view - key-value mapping by column name."""
-        
-        columns_dict = {}
-        for col in column_summary.get('columns', []):
-            field_obj = NormalizedField(
-                name=col['name'],
-                type=col['type'],
-                nullable=col['nullable'],
-                key_type=col.get('key_type'),
-                patterns=col.get('patterns', []),
-                null_pct=col.get('null_pct', 0.0),
-                unique_pct=col.get('unique_pct', 0.0)
-            )
-            
-            columns_dict[col['name']] = {
-                'type': field_obj.type,
-                'nullable': field_obj.nullable,
-                'key_type': field_obj.key_type,
-                'patterns': field_obj.patterns,
-                'data_category': field_obj.data_category,
-                'quality_score': field_obj.quality_score,
-                'statistics': {
-                    'null_pct': field_obj.null_pct,
-                    'unique_pct': field_obj.unique_pct
-                }
+    def __init__(self, table: Optional[str]):
+        self.table = table
+        self.columns_dict = {}
+    
+    def add(self, field_obj: NormalizedField) -> None:
+        self.columns_dict[field_obj.name] = {
+            'type': field_obj.type,
+            'nullable': field_obj.nullable,
+            'key_type': field_obj.key_type,
+            'patterns': list(field_obj.patterns),
+            'data_category': field_obj.data_category,
+            'quality_score': field_obj.quality_score,
+            'statistics': {
+                'null_pct': field_obj.null_pct,
+                'unique_pct': field_obj.unique_pct
             }
-        
+        }
+    
+    def build(self) -> Dict[str, Any]:
         return {
-            'table': column_summary.get('table'),
+            'table': self.table,
             'view_type': 'column_dict',
-            'columns': columns_dict,
+            'columns': self.columns_dict,
             'metadata': {
-                'total_columns': len(columns_dict),
-                'column_names': list(columns_dict.keys())
+                'total_columns': len(self.columns_dict),
+                'column_names': list(self.columns_dict.keys())
             }
         }
+
+
+class _FlatStructureView:
+    """Accumulates the flat structure view - single-level objects."""
     
-    def to_flat_structure(self, column_summary: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert to flat structure view - single-level objects."""
-        
-        flat_columns = []
-        for col in column_summary.get('columns', []):
-            field_obj = NormalizedField(
-                name=col['name'],
-                type=col['type'],
-                nullable=col['nullable'],
-                key_type=col.get('key_type'),
-                patterns=col.get('patterns', []),
-                null_pct=col.get('null_pct', 0.0),
-                unique_pct=col.get('unique_pct', 0.0)
-            )
-            
-            flat_col = {
-                'table_name': column_summary.get('table'),
-                'column_name': field_obj.name,
-                'data_type': field_obj.type,
-                'data_category': field_obj.data_category,
-                'is_nullable': field_obj.nullable,
-                'is_key': field_obj.is_key,
-                'key_type': field_obj.key_type or 'none',
-                'has_patterns': field_obj.is_pattern_field,
-                'pattern_count': len(field_obj.patterns),
-                'patterns_list': ','.join(field_obj.patterns) if field_obj.patterns else 'none',
-                'null_percentage': field_obj.null_pct,
-                'unique_percentage': field_obj.unique_pct,
-                'quality_score': field_obj.quality_score,
-                'full_identifier': f"{column_summary.get('table')}.{field_obj.name}"
-            }
-            flat_columns.append(flat_col)
-        
+    def __init__(self, table: Optional[str]):
+        self.table = table
+        self.table_prefix = f"{table}."
+        self.flat_columns = []
+    
+    def add(self, field_obj: NormalizedField) -> None:
+        self.flat_columns.append({
+            'table_name': self.table,
+            'column_name': field_obj.name,
+            'data_type': field_obj.type,
+            'data_category': field_obj.data_category,
+            'is_nullable': field_obj.nullable,
+            'is_key': field_obj.is_key,
+            'key_type': field_obj.key_type or 'none',
+            'has_patterns': field_obj.is_pattern_field,
+            'pattern_count': len(field_obj.patterns),
+            'patterns_list': _join_patterns(tuple(field_obj.patterns)) if field_obj.patterns else 'none',
+            'null_percentage': field_obj.null_pct,
+            'unique_percentage': field_obj.unique_pct,
+            'quality_score': field_obj.quality_score,
+            'full_identifier': self.table_prefix + field_obj.name
+        })
+    
+    def build(self) -> Dict[str, Any]:
         return {
             'view_type': 'flat_structure',
-            'columns': flat_columns,
-            'total_columns': len(flat_columns)
+            'columns': self.flat_columns,
+            'total_columns': len(self.flat_columns)
         }
+
+
+class _PatternGroupsView:
+    """
+    Accumulates the pattern-based grouping view.
     
-    def to_pattern_groups(self, column_summary: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert to pattern-based grouping view."""
-        
-        pattern_groups = defaultdict(list)
-        no_pattern_fields = []
-        
-        for col in column_summary.get('columns', []):
-            field_obj = NormalizedField(
-                name=col['name'],
-                type=col['type'],
-                nullable=col['nullable'],
-                key_type=col.get('key_type'),
-                patterns=col.get('patterns', []),
-                null_pct=col.get('null_pct', 0.0),
-                unique_pct=col.get('unique_pct', 0.0)
-            )
-            
+    Only reads a few column attributes, so it also accepts raw column summary
+    records through `add_record` without building a NormalizedField. With
+    `compact`, field entries are PatternFieldInfo tuples instead of dicts.
+    """
+    
+    def __init__(self, table: Optional[str], compact: bool = False):
+        self.table = table
+        self.compact = compact
+        self.pattern_groups = defaultdict(list)
+        self.no_pattern_fields = []
+        self.fields_with_patterns = 0
+    
+    def add(self, field_obj: NormalizedField) -> None:
+        self._add(field_obj.name, field_obj.type, field_obj.key_type,
+                  field_obj.patterns, field_obj.quality_score)
+    
+    def add_record(self, record: ColumnRecord) -> None:
+        key_type = record.key_type
+        self._add(record.name, record.type, key_type, record.patterns,
+                  quality_score(record.null_pct, record.unique_pct, key_type is not None))
+    
+    def _add(self, name: str, type_: str, key_type: Optional[str],
+             patterns: Sequence[str], quality: float) -> None:
+        if self.compact:
+            field_info = PatternFieldInfo(name, type_, key_type, quality)
+        else:
             field_info = {
-                'name': field_obj.name,
-                'type': field_obj.type,
-                'key_type': field_obj.key_type,
-                'quality_score': field_obj.quality_score
+                'name': name,
+                'type': type_,
+                'key_type': key_type,
+                'quality_score': quality
             }
-            
-            if field_obj.patterns:
-                for pattern in field_obj.patterns:
-                    pattern_groups[pattern].append(field_info)
-            else:
-                no_pattern_fields.append(field_info)
         
+        if patterns:
+            for pattern in patterns:
+                self.pattern_groups[pattern].append(field_info)
+            self.fields_with_patterns += len(patterns)
+        else:
+            self.no_pattern_fields.append(field_info)
+    
+    def build(self) -> Dict[str, Any]:
         return {
-            'table': column_summary.get('table'),
+            'table': self.table,
             'view_type': 'pattern_groups',
-            'pattern_groups': dict(pattern_groups),
-            'no_pattern_fields': no_pattern_fields,
+            'pattern_groups': dict(self.pattern_groups),
+            'no_pattern_fields': self.no_pattern_fields,
             'summary': {
-                'total_patterns': len(pattern_groups),
-                'fields_with_patterns': sum(len(fields) for fields in pattern_groups.values()),
-                'fields_without_patterns': len(no_pattern_fields)
+                'total_patterns': len(self.pattern_groups),
+                'fields_with_patterns': self.fields_with_patterns,
+                'fields_without_patterns': len(self.no_pattern_fields)
             }
         }
+
+
+class _TypeGroupsView:
+    """
+    Accumulates the data type grouping view.
     
-    def to_type_groups(self, column_summary: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert to data type grouping view."""
-        
-        type_groups = defaultdict(list)
-        category_groups = defaultdict(list)
-        
-        for col in column_summary.get('columns', []):
-            field_obj = NormalizedField(
-                name=col['name'],
-                type=col['type'],
-                nullable=col['nullable'],
-                key_type=col.get('key_type'),
-                patterns=col.get('patterns', []),
-                null_pct=col.get('null_pct', 0.0),
-                unique_pct=col.get('unique_pct', 0.0)
-            )
-            
+    Like the pattern grouping view, accepts raw column summary entries through
+    `add_record`, and with `compact` stores TypeFieldInfo tuples.
+    """
+    
+    def __init__(self, table: Optional[str], compact: bool = False):
+        self.table = table
+        self.compact = compact
+        self.type_groups = defaultdict(list)
+        self.category_groups = defaultdict(list)
+        self.category_counts = defaultdict(int)
+    
+    def add(self, field_obj: NormalizedField) -> None:
+        self._add(field_obj.name, field_obj.type, field_obj.nullable, field_obj.key_type,
+                  field_obj.patterns, field_obj.data_category, field_obj.quality_score)
+    
+    def add_record(self, record: ColumnRecord) -> None:
+        key_type = record.key_type
+        self._add(record.name, record.type, record.nullable, key_type, record.patterns,
+                  _categorize_type(record.type),
+                  quality_score(record.null_pct, record.unique_pct, key_type is not None))
+    
+    def _add(self, name: str, type_: str, nullable: bool, key_type: Optional[str],
+             patterns: Sequence[str], category: str, quality: float) -> None:
+        if self.compact:
+            field_info = TypeFieldInfo(name, nullable, key_type, tuple(patterns), quality)
+        else:
             field_info = {
-                'name': field_obj.name,
-                'nullable': field_obj.nullable,
-                'key_type': field_obj.key_type,
-                'patterns': field_obj.patterns,
-                'quality_score': field_obj.quality_score
+                'name': name,
+                'nullable': nullable,
+                'key_type': key_type,
+                'patterns': list(patterns),
+                'quality_score': quality
             }
-            
-            # Group by specific data type
-            type_groups[field_obj.type].append(field_info)
-            
-            # Group by data category
-            category_groups[field_obj.data_category].append(field_info)
         
+        # Group by specific data type
+        self.type_groups[type_].append(field_info)
+        
+        # Group by data category
+        self.category_groups[category].append(field_info)
+        self.category_counts[category] += 1
+    
+    def build(self) -> Dict[str, Any]:
         return {
-            'table': column_summary.get('table'),
+            'table': self.table,
             'view_type': 'type_groups',
-            'by_data_type': dict(type_groups),
-            'by_category': dict(category_groups),
+            'by_data_type': dict(self.type_groups),
+            'by_category': dict(self.category_groups),
             'summary': {
-                'unique_types': len(type_groups),
-                'unique_categories': len(category_groups),
-                'category_distribution': {cat: len(fields) for cat, fields in category_groups.items()}
+                'unique_types': len(self.type_groups),
+                'unique_categories': len(self.category_groups),
+                'category_distribution': dict(self.category_counts)
             }
         }
+
+
+class _LLMOptimizedView:
+    """Accumulates the LLM-optimized view with minimal tokens and clear structure."""
     
-    def to_llm_optimized(self, column_summary: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert to LLM-optimized view with minimal tokens and clear structure."""
-        
-        fields = []
-        key_fields = []
-        pattern_fields = []
-        
-        for col in column_summary.get('columns', []):
-            field_obj = NormalizedField(
-                name=col['name'],
-                type=col['type'],
-                nullable=col['nullable'],
-                key_type=col.get('key_type'),
-                patterns=col.get('patterns', []),
-                null_pct=col.get('null_pct', 0.0),
-                unique_pct=col.get('unique_pct', 0.0)
-            )
-            
-            # Compact field representation
-            field_compact = f"{field_obj.name}:{field_obj.type}"
-            if not field_obj.nullable:
-                field_compact += " NOT NULL"
-            if field_obj.key_type:
-                field_compact += f" {field_obj.key_type}"
-            if field_obj.patterns:
-                field_compact += f" [{','.join(field_obj.patterns)}]"
-            
-            fields.append(field_compact)
-            
-            # Separate key and pattern fields for quick reference
-            if field_obj.is_key:
-                key_fields.append(field_obj.name)
-            if field_obj.is_pattern_field:
-                pattern_fields.append({
-                    'field': field_obj.name,
-                    'patterns': field_obj.patterns
-                })
+    def __init__(self, table: Optional[str]):
+        self.table = table
+        self.fields = []
+        self.key_fields = []
+        self.pattern_fields = []
+    
+    def add(self, field_obj: NormalizedField) -> None:
+        # Compact field representation
+        self.fields.append(_compact_field(field_obj.name, field_obj.type, field_obj.nullable,
+                                          field_obj.key_type, tuple(field_obj.patterns)))
         
+        # Separate key and pattern fields for quick reference
+        if field_obj.is_key:
+            self.key_fields.append(field_obj.name)
+        if field_obj.is_pattern_field:
+            self.pattern_fields.append({
+                'field': field_obj.name,
+                'patterns': list(field_obj.patterns)
+            })
+    
+    def build(self) -> Dict[str, Any]:
         return {
-            'table': column_summary.get('table'),
+            'table': self.table,
             'view_type': 'llm_optimized',
-            'fields': fields,  # Compact string representation
-            'keys': key_fields,
-            'patterns': pattern_fields,
+            'fields': self.fields,  # Compact string representation
+            'keys': self.key_fields,
+            'patterns': self.pattern_fields,
             'stats': {
-                'total': len(fields),
-                'keys': len(key_fields),
-                'patterns': len(pattern_fields)
+                'total': len(self.fields),
+                'keys': len(self.key_fields),
+                'patterns': len(self.pattern_fields)
             }
         }
 
 
+# View accumulators by view type
+_VIEW_BUILDERS = {
+    ViewType.FIELD_LIST: _FieldListView,
+    ViewType.COLUMN_DICT: _ColumnDictView,
+    ViewType.FLAT_STRUCTURE: _FlatStructureView,
+    ViewType.PATTERN_GROUPS: _PatternGroupsView,
+    ViewType.TYPE_GROUPS: _TypeGroupsView,
+    ViewType.LLM_OPTIMIZED: _LLMOptimizedView
+}
+
+
+class ColumnFieldNormalizer:
+    """Main class for normalizing column summaries into different views."""
+    
+    # The normalizer holds no per-instance state
+    supported_views = tuple(ViewType)
+    
+    # Normalizer method per view type (looked up by name so subclasses can override)
+    _VIEW_METHODS = {
+        ViewType.FIELD_LIST: 'to_field_list',
+        ViewType.COLUMN_DICT: 'to_column_dict',
+        ViewType.FLAT_STRUCTURE: 'to_flat_structure',
+        ViewType.PATTERN_GROUPS: 'to_pattern_groups',
+        ViewType.TYPE_GROUPS: 'to_type_groups',
+        ViewType.LLM_OPTIMIZED: 'to_llm_optimized'
+    }
+    
+    def normalize(self, column_summary: SummaryInput, view_type: ViewType) -> Dict[str, Any]:
+        """Main normalization method that routes to specific normalizers."""
+        
+        method_name = self._VIEW_METHODS.get(view_type)
+        if method_name is None:
+            raise ValueError(f"Unsupported view type: {view_type}")
+        return getattr(self, method_name)(column_summary)
+    
+    def normalize_multi(self, column_summary: SummaryInput,
+                        view_types: Iterable[ViewType]) -> Dict[ViewType, Dict[str, Any]]:
+        """
+        Build several views of a column summary in a single pass over its columns.
+        
+        Args:
+            column_summary: Minimal column summary, or a CompiledColumnSummary
+            view_types: Views to build
+        
+        Returns:
+            Dictionary mapping each requested view type to its view
+        """
+        
+        table, records = _summary_records(column_summary)
+        views = {}
+        for view_type in view_types:
+            if view_type not in _VIEW_BUILDERS:
+                raise ValueError(f"Unsupported view type: {view_type}")
+            views[view_type] = _VIEW_BUILDERS[view_type](table)
+        
+        accumulators = list(views.values())
+        
+        # Views that only need a few column attributes skip NormalizedField
+        if all(hasattr(accumulator, 'add_record') for accumulator in accumulators):
+            adders = [accumulator.add_record for accumulator in accumulators]
+            if len(adders) == 1:
+                add = adders[0]
+                for record in records:
+                    add(record)
+            else:
+                for record in records:
+                    for add in adders:
+                        add(record)
+            return {view_type: view.build() for view_type, view in views.items()}
+        
+        # Bound methods and a local function reference keep the per-column loop
+        # free of attribute and global lookups
+        normalized_field = _normalized_field
+        adders = [accumulator.add for accumulator in accumulators]
+        if len(adders) == 1:
+            add = adders[0]
+            for record in records:
+                add(normalized_field(record))
+        else:
+            for record in records:
+                field_obj = normalized_field(record)
+                for add in adders:
+                    add(field_obj)
+        
+        return {view_type: view.build() for view_type, view in views.items()}
+    
+    def to_flat_structure_soa(self, column_summary: SummaryInput) -> Dict[str, Any]:
+        """
+        Convert to a column-oriented (structure of arrays) flat structure view.
+        
+        Holds the same attributes as the flat structure view, but as one list per
+        attribute indexed by column position, which is cheaper to hold and to
+        aggregate over than a list of per-column dictionaries.
+        
+        Args:
+            column_summary: Minimal column summary, or a CompiledColumnSummary
+        
+        Returns:
+            Dictionary with one list per flat structure attribute and a summary
+        """
+        
+        table, records = _summary_records(column_summary)
+        table_prefix = f"{table}."
+        field_objs = [_normalized_field(record) for record in records]
+        
+        is_nullable = [f.nullable for f in field_objs]
+        is_key = [f.is_key for f in field_objs]
+        has_patterns = [f.is_pattern_field for f in field_objs]
+        quality_scores = [f.quality_score for f in field_objs]
+        
+        return {
+            'table': table,
+            'view_type': 'flat_structure_soa',
+            'total_columns': len(field_objs),
+            'columns': {
+                'column_name': [f.name for f in field_objs],
+                'data_type': [f.type for f in field_objs],
+                'data_category': [f.data_category for f in field_objs],
+                'is_nullable': is_nullable,
+                'is_key': is_key,
+                'key_type': [f.key_type or 'none' for f in field_objs],
+                'has_patterns': has_patterns,
+                'pattern_count': [len(f.patterns) for f in field_objs],
+                'patterns_list': [_join_patterns(tuple(f.patterns)) if f.patterns else 'none'
+                                  for f in field_objs],
+                'null_percentage': [f.null_pct for f in field_objs],
+                'unique_percentage': [f.unique_pct for f in field_objs],
+                'quality_score': quality_scores,
+                'full_identifier': [table_prefix + f.name for f in field_objs]
+            },
+            'summary': {
+                'key_fields': sum(is_key),
+                'pattern_fields': sum(has_patterns),
+                'nullable_fields': sum(1 for nullable in is_nullable if nullable),
+                'avg_quality_score': sum(quality_scores) / len(quality_scores) if quality_scores else 0
+            }
+        }
+    
+    def compile_for_schema(self, schema_template: SummaryInput
+                           ) -> Callable[[Sequence[Tuple[float, float]]], Dict[str, Any]]:
+        """
+        Specialize the field list view for a fixed table schema.
+        
+        Everything that depends only on the schema (categories, key and pattern
+        flags, summary counts) is computed once; the returned function only
+        scores the statistics it is given. Use it when the same schema is
+        normalized repeatedly with changing statistics.
+        
+        Args:
+            schema_template: Minimal column summary; its statistics are ignored
+        
+        Returns:
+            Function taking one (null_pct, unique_pct) pair per column, in
+            column order, and returning the field list view
+        """
+        
+        table, records = _summary_records(schema_template)
+        columns = [
+            (record.name, record.type, record.nullable, record.key_type, record.patterns,
+             record.key_type is not None, len(record.patterns) > 0, _categorize_type(record.type))
+            for record in records
+        ]
+        
+        column_count = len(columns)
+        key_fields = sum(1 for column in columns if column[5])
+        pattern_fields = sum(1 for column in columns if column[6])
+        nullable_fields = sum(1 for column in columns if column[2])
+        
+        def field_list_view(stats: Sequence[Tuple[float, float]]) -> Dict[str, Any]:
+            if len(stats) != column_count:
+                raise ValueError(f"Expected statistics for {column_count} columns, got {len(stats)}")
+            
+            fields = []
+            quality_total = 0
+            for column, (null_pct, unique_pct) in zip(columns, stats):
+                name, type_, nullable, key_type, patterns, is_key, is_pattern_field, category = column
+                score = quality_score(null_pct, unique_pct, is_key)
+                quality_total += score
+                fields.append({
+                    'name': name,
+                    'type': type_,
+                    'nullable': nullable,
+                    'key_type': key_type,
+                    'patterns': list(patterns),
+                    'null_pct': null_pct,
+                    'unique_pct': unique_pct,
+                    'is_key': is_key,
+                    'is_pattern_field': is_pattern_field,
+                    'data_category': category,
+                    'quality_score': score
+                })
+            
+            return {
+                'table': table,
+                'total_columns': column_count,
+                'view_type': 'field_list',
+                'fields': fields,
+                'summary': {
+                    'key_fields': key_fields,
+                    'pattern_fields': pattern_fields,
+                    'nullable_fields': nullable_fields,
+                    'avg_quality_score': quality_total / column_count if fields else 0
+                }
+            }
+        
+        return field_list_view
+    
+    def to_field_list(self, column_summary: SummaryInput) -> Dict[str, Any]:
+        """Convert to field list view - array of field objects."""
+        return self.normalize_multi(column_summary, (ViewType.FIELD_LIST,))[ViewType.FIELD_LIST]
+    
+    def to_column_dict(self, column_summary: SummaryInput) -> Dict[str, Any]:
+        """Convert to column dictionary view - key-value mapping by column name."""
+        return self.normalize_multi(column_summary, (ViewType.COLUMN_DICT,))[ViewType.COLUMN_DICT]
+    
+    def to_flat_structure(self, column_summary: SummaryInput) -> Dict[str, Any]:
+        """Convert to flat structure view - single-level objects."""
+        return self.normalize_multi(column_summary, (ViewType.FLAT_STRUCTURE,))[ViewType.FLAT_STRUCTURE]
+    
+    def to_pattern_groups(self, column_summary: SummaryInput, compact: bool = False) -> Dict[str, Any]:
+        """
+        Convert to pattern-based grouping view.
+        
+        Args:
+            column_summary: Minimal column summary, or a CompiledColumnSummary
+            compact: Hold field entries as PatternFieldInfo tuples instead of
+                dicts (use `_asdict()` where a dict is needed)
+        
+        Returns:
+            Pattern grouping view
+        """
+        if compact:
+            return self._build_compact(_PatternGroupsView, column_summary)
+        return self.normalize_multi(column_summary, (ViewType.PATTERN_GROUPS,))[ViewType.PATTERN_GROUPS]
+    
+    def to_type_groups(self, column_summary: SummaryInput, compact: bool = False) -> Dict[str, Any]:
+        """
+        Convert to data type grouping view.
+        
+        Args:
+            column_summary: Minimal column summary, or a CompiledColumnSummary
+            compact: Hold field entries as TypeFieldInfo tuples instead of
+                dicts (patterns become tuples)
+        
+        Returns:
+            Data type grouping view
+        """
+        if compact:
+            return self._build_compact(_TypeGroupsView, column_summary)
+        return self.normalize_multi(column_summary, (ViewType.TYPE_GROUPS,))[ViewType.TYPE_GROUPS]
+    
+    @staticmethod
+    def _build_compact(view_class: type, column_summary: SummaryInput) -> Dict[str, Any]:
+        """Build a grouping view with compact field entries."""
+        table, records = _summary_records(column_summary)
+        view = view_class(table, compact=True)
+        for record in records:
+            view.add_record(record)
+        return view.build()
+    
+    def to_llm_optimized(self, column_summary: SummaryInput,
+                         as_bytes: bool = False) -> Union[Dict[str, Any], bytes]:
+        """
+        Convert to LLM-optimized view with minimal tokens and clear structure.
+        
+        Args:
+            column_summary: Minimal column summary, or a CompiledColumnSummary
+            as_bytes: Return the view as compact JSON bytes, ready to send
+        
+        Returns:
+            LLM-optimized view, as a dictionary or as JSON bytes
+        """
+        view = self.normalize_multi(column_summary, (ViewType.LLM_OPTIMIZED,))[ViewType.LLM_OPTIMIZED]
+        return _dumps_json(view) if as_bytes else view
+
+
+# Shared normalizer behind the convenience functions
+_DEFAULT_NORMALIZER = ColumnFieldNormalizer()
+
+
 # Convenience functions for direct usage
 def normalize_to_field_list(column_summary: Dict[str, Any]) -> Dict[str, Any]:
     """Convert minimal column summary to field list view."""
-    normalizer = ColumnFieldNormalizer()
-    return normalizer.to_field_list(column_summary)
+    return _DEFAULT_NORMALIZER.to_field_list(column_summary)
 
 
 def normalize_to_column_dict(column_summary: Dict[str, Any]) -> Dict[str, Any]:
     """Convert minimal column summary to column dictionary view."""
-    normalizer = ColumnFieldNormalizer()
-    return normalizer.to_column_dict(column_summary)
+    return _DEFAULT_NORMALIZER.to_column_dict(column_summary)
 
 
 def normalize_to_flat_structure(column_summary: Dict[str, Any]) -> Dict[str, Any]:
     """Convert minimal column summary to flat structure view."""
-    normalizer = ColumnFieldNormalizer()
-    return normalizer.to_flat_structure(column_summary)
+    return _DEFAULT_NORMALIZER.to_flat_structure(column_summary)
 
 
 def normalize_by_patterns(column_summary: Dict[str, Any]) -> Dict[str, Any]:
     """Convert minimal column summary to pattern-based grouping."""
-    normalizer = ColumnFieldNormalizer()
-    return normalizer.to_pattern_groups(column_summary)
+    return _DEFAULT_NORMALIZER.to_pattern_groups(column_summary)
 
 
 def normalize_by_data_types(column_summary: Dict[str, Any]) -> Dict[str, Any]:
     """Convert minimal column summary to data type grouping."""
-    normalizer = ColumnFieldNormalizer()
-    return normalizer.to_type_groups(column_summary)
+    return _DEFAULT_NORMALIZER.to_type_groups(column_summary)
 
 
-def normalize_for_llm(column_summary: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert minimal column summary to LLM-optimized format."""
-    normalizer = ColumnFieldNormalizer()
-    return normalizer.to_llm_optimized(column_summary) 
\ No newline at end of file
+def normalize_for_llm(column_summary: Dict[str, Any],
+                      as_bytes: bool = False) -> Union[Dict[str, Any], bytes]:
+    """Convert minimal column summary to LLM-optimized format (optionally as JSON bytes)."""
+    return _DEFAULT_NORMALIZER.to_llm_optimized(column_summary, as_bytes=as_bytes) 
\ No newline at end of file
@@ -72,6 +72,7 @@ from .incremental_manager import (
     IncrementalProfilingManager,
     FileStateManager,
     DatabaseChangeDetector,
+    FileProfileCache,
     MemoryProfileCache
 )
 
@@ -105,6 +106,7 @@ __all__ = [
     'IncrementalProfilingManager',
     'FileStateManager',
     'DatabaseChangeDetector',
+    'FileProfileCache',
     'MemoryProfileCache',
     'PerformanceMonitor',
     'ResourceManager',
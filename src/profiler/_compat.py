@@ -0,0 +1,10 @@
+"""
+Compatibility Helpers
+
+This module holds version-dependent settings shared by the modules of this package.
+"""
+
+import sys
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -5,14 +5,22 @@ This module provides centralized configuration management for all profiler compo
 replacing scattered parameters with a clean configuration system.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
+from operator import attrgetter
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+from ._compat import DATACLASS_OPTIONS
 from .interfaces import ProfilingStrategy
+from .json_codec import dumps_json, loads_json
 
 
-@dataclass
+# Accepted values for the enumerated string settings
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_EXPORT_FORMATS = frozenset({"json", "yaml", "xml"})
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ProfilerConfig:
     """
     Centralized configuration for schema profiling operations.
@@ -35,6 +43,8 @@ class ProfilerConfig:
     incremental_state_path: Optional[str] = None
     data_change_threshold: float = 0.1  # 10% row count change
     force_full_profile: bool = False
+    persist_profile_cache: bool = False  # Pickle table profiles next to the state file
+    max_cache_size_mb: int = 256  # In-memory profile cache limit
     
     # Resource limits
     max_connections: int = 10
@@ -85,43 +95,23 @@ class ProfilerConfig:
         if self.sample_data_limit < 0:
             raise ValueError("sample_data_limit must be non-negative")
         
+        if self.max_cache_size_mb < 1:
+            raise ValueError("max_cache_size_mb must be at least 1MB")
+        
         if self.incremental_enabled and not self.incremental_state_path:
             raise ValueError("incremental_state_path required when incremental_enabled=True")
         
-        if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
+        if self.log_level not in _VALID_LOG_LEVELS:
             raise ValueError(f"Invalid log_level: {self.log_level}")
         
-        if self.export_format not in ["json", "yaml", "xml"]:
+        if self.export_format not in _VALID_EXPORT_FORMATS:
             raise ValueError(f"Invalid export_format: {self.export_format}")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        return {
-            'database_name': self.database_name,
-            'schema_name': self.schema_name,
-            'strategy': self.strategy.value,
-            'max_workers': self.max_workers,
-            'parallel_threshold': self.parallel_threshold,
-            'incremental_enabled': self.incremental_enabled,
-            'incremental_state_path': self.incremental_state_path,
-            'data_change_threshold': self.data_change_threshold,
-            'force_full_profile': self.force_full_profile,
-            'max_connections': self.max_connections,
-            'query_timeout': self.query_timeout,
-            'memory_limit_mb': self.memory_limit_mb,
-            'pattern_recognition_enabled': self.pattern_recognition_enabled,
-            'patterns_config_path': self.patterns_config_path,
-            'log_level': self.log_level,
-            'debug_mode': self.debug_mode,
-            'profile_performance': self.profile_performance,
-            'export_format': self.export_format,
-            'output_path': self.output_path,
-            'include_sample_data': self.include_sample_data,
-            'sample_data_limit': self.sample_data_limit,
-            'validate_relationships': self.validate_relationships,
-            'validate_patterns': self.validate_patterns,
-            'strict_mode': self.strict_mode
-        }
+        data = dict(zip(_PROFILER_FIELD_NAMES, _profiler_field_values(self)))
+        data['strategy'] = self.strategy.value
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ProfilerConfig':
@@ -135,28 +125,26 @@ class ProfilerConfig:
     @classmethod
     def from_file(cls, file_path: str) -> 'ProfilerConfig':
         """Load configuration from JSON file."""
-        import json
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = loads_json(f.read())
         
         return cls.from_dict(data)
     
     def save_to_file(self, file_path: str) -> None:
         """Save configuration to JSON file."""
-        import json
-        
         # Ensure directory exists
         Path(file_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        with open(file_path, 'wb') as f:
+            f.write(dumps_json(self.to_dict()))
     
     def copy(self, **changes) -> 'ProfilerConfig':
         """Create a copy of the configuration with optional changes."""
-        current_dict = self.to_dict()
-        current_dict.update(changes)
-        return self.from_dict(current_dict)
+        # Strategy names are still accepted, as they were through from_dict
+        if isinstance(changes.get('strategy'), str):
+            changes['strategy'] = ProfilingStrategy(changes['strategy'])
+        
+        return replace(self, **changes)
     
     def get_incremental_config(self) -> 'IncrementalConfig':
         """Extract incremental-specific configuration."""
@@ -164,7 +152,9 @@ class ProfilerConfig:
             enabled=self.incremental_enabled,
             state_path=self.incremental_state_path,
             data_change_threshold=self.data_change_threshold,
-            force_full_profile=self.force_full_profile
+            force_full_profile=self.force_full_profile,
+            persist_profiles=self.persist_profile_cache,
+            max_cache_size_mb=self.max_cache_size_mb
         )
     
     def get_processing_config(self) -> 'ProcessingConfig':
@@ -179,7 +169,12 @@ class ProfilerConfig:
         )
 
 
-@dataclass
+# Field names in declaration order and a C-level getter used by to_dict
+_PROFILER_FIELD_NAMES = tuple(f.name for f in fields(ProfilerConfig))
+_profiler_field_values = attrgetter(*_PROFILER_FIELD_NAMES)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class IncrementalConfig:
     """Configuration specific to incremental profiling."""
     enabled: bool = False
@@ -187,11 +182,12 @@ class IncrementalConfig:
     data_change_threshold: float = 0.1
     force_full_profile: bool = False
     cache_profiles: bool = True
+    persist_profiles: bool = False
     max_cache_size_mb: int = 256
     cache_ttl_hours: int = 24
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ProcessingConfig:
     """Configuration specific to processing strategies."""
     strategy: ProfilingStrategy = ProfilingStrategy.ADAPTIVE
@@ -205,7 +201,7 @@ class ProcessingConfig:
     retry_delay_seconds: int = 1
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class PatternConfig:
     """Configuration specific to pattern recognition."""
     enabled: bool = True
@@ -230,7 +226,8 @@ class ConfigBuilder:
     
     def with_strategy(self, strategy: ProfilingStrategy) -> 'ConfigBuilder':
         """Set the processing strategy."""
-        self._config_dict['strategy'] = strategy
+        # Decode strategy names here so build() can construct the config directly
+        self._config_dict['strategy'] = ProfilingStrategy(strategy)
         return self
     
     def with_parallel_processing(self, max_workers: int = 4, threshold: int = 10) -> 'ConfigBuilder':
@@ -282,56 +279,72 @@ class ConfigBuilder:
     
     def build(self) -> ProfilerConfig:
         """Build the final configuration."""
-        return ProfilerConfig.from_dict(self._config_dict)
+        return ProfilerConfig(**self._config_dict)
+
+
+# Predefined configurations for common use cases, built once and copied per call
+_TEMPLATE_DATABASE_NAME = "__template__"
+
+_DEVELOPMENT_TEMPLATE = ConfigBuilder(_TEMPLATE_DATABASE_NAME) \
+    .with_strategy(ProfilingStrategy.SEQUENTIAL) \
+    .with_debugging(debug_mode=True, log_level="DEBUG") \
+    .with_resource_limits(max_connections=2, query_timeout=60) \
+    .build()
+
+_PRODUCTION_TEMPLATE = ConfigBuilder(_TEMPLATE_DATABASE_NAME) \
+    .with_strategy(ProfilingStrategy.ADAPTIVE) \
+    .with_parallel_processing(max_workers=8, threshold=5) \
+    .with_resource_limits(max_connections=10, query_timeout=300) \
+    .build()
+
+_LARGE_DATABASE_TEMPLATE = ConfigBuilder(_TEMPLATE_DATABASE_NAME) \
+    .with_strategy(ProfilingStrategy.PARALLEL) \
+    .with_parallel_processing(max_workers=12, threshold=3) \
+    .with_incremental("./incremental_state.json", change_threshold=0.02) \
+    .with_resource_limits(max_connections=15, memory_limit_mb=2048) \
+    .build()
+
+_CI_CD_TEMPLATE = ConfigBuilder(_TEMPLATE_DATABASE_NAME) \
+    .with_strategy(ProfilingStrategy.ADAPTIVE) \
+    .with_parallel_processing(max_workers=4, threshold=8) \
+    .with_resource_limits(max_connections=5, query_timeout=180) \
+    .build()
 
 
-# Predefined configurations for common use cases
 class CommonConfigs:
     """Common profiler configurations for typical use cases."""
     
     @staticmethod
     def development(database_name: str, schema_name: Optional[str] = None) -> ProfilerConfig:
         """Configuration optimized for development environments."""
-        return ConfigBuilder(database_name) \
-            .with_schema(schema_name) \
-            .with_strategy(ProfilingStrategy.SEQUENTIAL) \
-            .with_debugging(debug_mode=True, log_level="DEBUG") \
-            .with_resource_limits(max_connections=2, query_timeout=60) \
-            .build()
+        return _DEVELOPMENT_TEMPLATE.copy(database_name=database_name, schema_name=schema_name)
     
     @staticmethod
     def production(database_name: str, schema_name: Optional[str] = None,
                   state_path: Optional[str] = None) -> ProfilerConfig:
         """Configuration optimized for production environments."""
-        builder = ConfigBuilder(database_name) \
-            .with_schema(schema_name) \
-            .with_strategy(ProfilingStrategy.ADAPTIVE) \
-            .with_parallel_processing(max_workers=8, threshold=5) \
-            .with_resource_limits(max_connections=10, query_timeout=300)
-        
         if state_path:
-            builder = builder.with_incremental(state_path, change_threshold=0.05)
+            return _PRODUCTION_TEMPLATE.copy(
+                database_name=database_name,
+                schema_name=schema_name,
+                incremental_enabled=True,
+                incremental_state_path=state_path,
+                data_change_threshold=0.05
+            )
         
-        return builder.build()
+        return _PRODUCTION_TEMPLATE.copy(database_name=database_name, schema_name=schema_name)
     
     @staticmethod
     def large_database(database_name: str, schema_name: Optional[str] = None,
                       state_path: str = "./incremental_state.json") -> ProfilerConfig:
         """Configuration optimized for large databases."""
-        return ConfigBuilder(database_name) \
-            .with_schema(schema_name) \
-            .with_strategy(ProfilingStrategy.PARALLEL) \
-            .with_parallel_processing(max_workers=12, threshold=3) \
-            .with_incremental(state_path, change_threshold=0.02) \
-            .with_resource_limits(max_connections=15, memory_limit_mb=2048) \
-            .build()
+        return _LARGE_DATABASE_TEMPLATE.copy(
+            database_name=database_name,
+            schema_name=schema_name,
+            incremental_state_path=state_path
+        )
     
     @staticmethod
     def ci_cd(database_name: str, schema_name: Optional[str] = None) -> ProfilerConfig:
         """Configuration optimized for CI/CD pipelines."""
-        return ConfigBuilder(database_name) \
-            .with_schema(schema_name) \
-            .with_strategy(ProfilingStrategy.ADAPTIVE) \
-            .with_parallel_processing(max_workers=4, threshold=8) \
-            .with_resource_limits(max_connections=5, query_timeout=180) \
-            .build() 
\ No newline at end of file
+        return _CI_CD_TEMPLATE.copy(database_name=database_name, schema_name=schema_name)
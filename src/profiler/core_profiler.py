@@ -7,13 +7,85 @@ complexity or processing strategy concerns.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 
 from .interfaces import SchemaProfiler, ProfilerConfig
 from .schema_models import SchemaProfile, TableProfile
 from .metadata_extractor import MetadataExtractor
 from .simple_pattern_recognizer import SimplePatternRecognizer as FieldPatternRecognizer
 from .database_dialect import DatabaseDialect
+from .json_codec import encode_default, iter_json_chunks
+
+
+# Connector class name markers and the database type they identify, in match order
+_DB_TYPE_MARKERS = (
+    ('MySQL', 'mysql'),
+    ('PostgreSQL', 'postgresql'),
+    ('MSSQL', 'mssql')
+)
+
+# Write buffer for exported profiles, so large profiles go out in few large writes
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Values shared by every relationship record
+_REL_TYPE_FOREIGN_KEY = 'foreign_key'
+_REL_TYPE_POTENTIAL_FOREIGN_KEY = 'potential_foreign_key'
+_REASON_NAME_PATTERN = 'Column name pattern suggests relationship'
+_CONFIDENCE_MEDIUM = 'medium'
+
+
+@lru_cache(maxsize=None)
+def detect_database_type(connector_class: type) -> str:
+    """
+    Detect the database type of a connector class from its name.
+    
+    Args:
+        connector_class: Connector class (e.g. type(connector))
+    
+    Returns:
+        Database type ('mysql', 'postgresql', 'mssql' or 'unknown'), cached per class
+    """
+    class_name = connector_class.__name__
+    for marker, db_type in _DB_TYPE_MARKERS:
+        if marker in class_name:
+            return db_type
+    return 'unknown'
+
+
+@lru_cache(maxsize=4096)
+def _relationship_name_keys(column_name: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Get the lookup keys the relationship heuristic probes for a column name.
+    
+    Column names such as 'created_by' or 'customer_id' repeat across tables, so
+    the lowercasing and slicing is done once per distinct name.
+    
+    Args:
+        column_name: Column name
+    
+    Returns:
+        (primary key column keys, table name keys), all lowercased: every suffix
+        after an underscore, and for '*_id' columns the stem and its suffixes
+    """
+    name_lower = column_name.lower()
+    underscores = [i for i, char in enumerate(name_lower) if char == '_']
+    pk_keys = tuple(name_lower[i + 1:] for i in underscores)
+    
+    table_keys = ()
+    if name_lower.endswith('_id'):
+        stem = name_lower[:-3]
+        table_keys = (stem,) + tuple(stem[i + 1:] for i in underscores if i < len(stem))
+    
+    return pk_keys, table_keys
 
 
 class CoreSchemaProfiler(SchemaProfiler):
@@ -40,13 +112,18 @@ class CoreSchemaProfiler(SchemaProfiler):
         
         # Detect database type
         self.db_type = self._detect_database_type()
-        self.dialect = DatabaseDialect(self.db_type)
+        self.dialect = DatabaseDialect.get(self.db_type)
         
         # Initialize or use provided dependencies
         self.metadata_extractor = metadata_extractor or MetadataExtractor(
             connector, "", None, self.db_type
         )
         self.pattern_recognizer = pattern_recognizer or FieldPatternRecognizer()
+        
+        # Table lists of incremental runs, keyed by (database, schema): (fetched at, tables)
+        self._tables_info_cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._tables_info_refreshing: Set[Tuple[str, Optional[str]]] = set()
+        self._tables_info_lock = threading.Lock()
     
     def profile_schema(self, config: ProfilerConfig) -> SchemaProfile:
         """
@@ -54,7 +131,7 @@ class CoreSchemaProfiler(SchemaProfiler):
         
         Args:
             config: Profiling configuration
-            
+        
         Returns:
             Complete schema profile
         """
@@ -72,19 +149,22 @@ class CoreSchemaProfiler(SchemaProfiler):
             self._update_metadata_extractor_config(config)
             
             # Get list of tables
-            tables_info = self.metadata_extractor.get_tables_info()
+            tables_info = self._get_tables_info_cached(config)
             schema_profile.total_tables = len(tables_info)
             
             if not tables_info:
                 self.logger.warning("No tables found to profile")
                 return schema_profile
             
-            # Profile each table (processing strategy handled externally)
-            table_profiles = []
-            for table_info in tables_info:
-                table_profile = self.profile_table(table_info['table_name'], config)
-                table_profiles.append(table_profile)
-                schema_profile.total_columns += len(table_profile.columns)
+            # Profile each table, in parallel above the configured threshold
+            table_profiles = self._profile_tables_prefetched(
+                [table_info['table_name'] for table_info in tables_info], config
+            )
+            schema_profile.total_columns = sum(len(table_profile.columns) for table_profile in table_profiles)
+            
+            # A table without columns was most likely dropped since the list was cached
+            if any(not table_profile.columns for table_profile in table_profiles):
+                self.invalidate_tables_info_cache(config)
             
             schema_profile.tables = table_profiles
             
@@ -92,7 +172,7 @@ class CoreSchemaProfiler(SchemaProfiler):
             self._analyze_schema_relationships(schema_profile, config)
             
             self.logger.info(f"Core profiling completed. Tables: {schema_profile.total_tables}, Columns: {schema_profile.total_columns}")
-            
+        
         except Exception as e:
             self.logger.error(f"Error during core schema profiling: {e}")
             raise
@@ -106,7 +186,7 @@ class CoreSchemaProfiler(SchemaProfiler):
         Args:
             table_name: Name of the table to profile
             config: Profiling configuration
-            
+        
         Returns:
             Complete table profile
         """
@@ -114,7 +194,12 @@ class CoreSchemaProfiler(SchemaProfiler):
         
         try:
             # Get complete metadata using the metadata extractor
-            metadata = self.metadata_extractor.get_complete_table_metadata(table_name)
+            # Sample rows are only queried when the profile keeps them
+            metadata = self.metadata_extractor.get_complete_table_metadata(
+                table_name,
+                include_sample_data=config.include_sample_data,
+                sample_limit=config.sample_data_limit
+            )
             
             # Create table profile from metadata
             table_profile = TableProfile(
@@ -125,7 +210,7 @@ class CoreSchemaProfiler(SchemaProfiler):
                 primary_keys=metadata['primary_keys'],
                 foreign_keys=metadata['foreign_keys'],
                 indexes=metadata['indexes'],
-                sample_data=metadata['sample_data'] if config.include_sample_data else [],
+                sample_data=metadata['sample_data'],
                 estimated_row_count=metadata['row_count'],
                 self_referencing_columns=metadata['self_referencing_columns'],
                 potential_fk_candidates=metadata['potential_fk_candidates']
@@ -136,7 +221,7 @@ class CoreSchemaProfiler(SchemaProfiler):
                 self._add_pattern_detection(table_profile, config)
             
             return table_profile
-            
+        
         except Exception as e:
             self.logger.error(f"Error profiling table {table_name}: {e}")
             # Return minimal profile rather than failing completely
@@ -158,35 +243,141 @@ class CoreSchemaProfiler(SchemaProfiler):
         """
         Profile multiple tables.
         
+        Tables are profiled on a thread pool of up to `config.max_workers`
+        threads once there are at least `config.parallel_threshold` of them;
+        metadata extraction is dominated by database round trips.
+        
         Args:
             table_names: List of table names to profile
             config: Profiling configuration
-            
+        
+        Returns:
+            List of table profiles, in the order of `table_names`
+        """
+        max_workers = min(config.max_workers, len(table_names))
+        if max_workers <= 1 or len(table_names) < config.parallel_threshold:
+            return [self.profile_table(table_name, config) for table_name in table_names]
+        
+        self.logger.debug(f"Profiling {len(table_names)} tables with {max_workers} threads")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda table_name: self.profile_table(table_name, config), table_names))
+    
+    def _profile_tables_prefetched(self, table_names: List[str], config: ProfilerConfig) -> List[TableProfile]:
+        """Profile tables with their metadata fetched schema-wide up front (see prefetched_metadata)."""
+        with self.prefetched_metadata(table_names):
+            return self.profile_tables(table_names, config)
+    
+    @contextmanager
+    def prefetched_metadata(self, table_names: List[str]) -> Iterator[None]:
+        """
+        Serve the metadata of several tables from schema-wide queries within a block.
+        
+        When the metadata extractor supports it, columns, keys and indexes of
+        all tables are loaded with one query each instead of four per table,
+        and row counts with batched statements inside a caching_schema()
+        session instead of one COUNT(*) per table. profile_table() calls
+        inside the block use these results, which are dropped when the block
+        ends.
+        
+        Args:
+            table_names: Tables about to be profiled
+        """
+        prefetch = getattr(self.metadata_extractor, 'prefetch_schema_metadata', None)
+        if prefetch is None or len(table_names) < 2:
+            yield
+            return
+        
+        with self.metadata_extractor.caching_schema():
+            # The counts answer each table's get_row_count() from the session cache
+            self.metadata_extractor.count_rows_bulk(table_names)
+            prefetch()
+            try:
+                yield
+            finally:
+                self.metadata_extractor.clear_bulk_cache()
+    
+    def get_tables_info(self, config: Optional[ProfilerConfig] = None) -> List[Dict[str, Any]]:
+        """
+        Get basic information about all tables.
+        
+        Args:
+            config: Profiling configuration; incremental configurations reuse
+                the cached table list (see _get_tables_info_cached)
+        
         Returns:
-            List of table profiles
+            List of dictionaries containing table information
+        """
+        if config is None:
+            return self.metadata_extractor.get_tables_info()
+        return self._get_tables_info_cached(config)
+    
+    def invalidate_tables_info_cache(self, config: Optional[ProfilerConfig] = None) -> None:
         """
-        profiles = []
-        for table_name in table_names:
-            profile = self.profile_table(table_name, config)
-            profiles.append(profile)
+        Drop cached table lists, e.g. after DDL changes.
         
-        return profiles
+        Args:
+            config: Drop only the list for this configuration's database and schema
+        """
+        with self._tables_info_lock:
+            if config is None:
+                self._tables_info_cache.clear()
+            else:
+                self._tables_info_cache.pop((config.database_name, config.schema_name), None)
     
-    def get_tables_info(self) -> List[Dict[str, Any]]:
-        """Get basic information about all tables."""
-        return self.metadata_extractor.get_tables_info()
+    def _get_tables_info_cached(self, config: ProfilerConfig) -> List[Dict[str, Any]]:
+        """
+        Get the table list, reusing it across incremental runs.
+        
+        Incremental runs re-profile a mostly unchanged schema, so their table list
+        is cached per (database, schema) for the incremental cache TTL. A stale
+        list is still served while a background thread fetches a fresh one.
+        Non-incremental runs always query the database.
+        """
+        if not config.incremental_enabled:
+            return self.metadata_extractor.get_tables_info()
+        
+        key = (config.database_name, config.schema_name)
+        with self._tables_info_lock:
+            entry = self._tables_info_cache.get(key)
+        
+        if entry is None:
+            return self._refresh_tables_info(key)
+        
+        fetched_at, tables_info = entry
+        ttl_seconds = config.get_incremental_config().cache_ttl_hours * 3600
+        if time.monotonic() - fetched_at >= ttl_seconds:
+            with self._tables_info_lock:
+                start_refresh = key not in self._tables_info_refreshing
+                self._tables_info_refreshing.add(key)
+            if start_refresh:
+                self.logger.debug(f"Refreshing stale table list for {key} in the background")
+                threading.Thread(target=self._refresh_tables_info_quietly, args=(key,),
+                                 name="tables-info-refresh", daemon=True).start()
+        
+        return tables_info
+    
+    def _refresh_tables_info(self, key: Tuple[str, Optional[str]]) -> List[Dict[str, Any]]:
+        """Query the table list and cache it (empty results are not cached)."""
+        try:
+            tables_info = self.metadata_extractor.get_tables_info()
+            if tables_info:
+                with self._tables_info_lock:
+                    self._tables_info_cache[key] = (time.monotonic(), tables_info)
+            return tables_info
+        finally:
+            with self._tables_info_lock:
+                self._tables_info_refreshing.discard(key)
+    
+    def _refresh_tables_info_quietly(self, key: Tuple[str, Optional[str]]) -> None:
+        """Background refresh; failures keep the stale list."""
+        try:
+            self._refresh_tables_info(key)
+        except Exception as e:
+            self.logger.warning(f"Background table list refresh failed for {key}: {e}")
     
     def _detect_database_type(self) -> str:
         """Detect database type from connector."""
-        connector_class = self.connector.__class__.__name__
-        if 'MySQL' in connector_class:
-            return 'mysql'
-        elif 'PostgreSQL' in connector_class:
-            return 'postgresql'
-        elif 'MSSQL' in connector_class:
-            return 'mssql'
-        else:
-            return 'unknown'
+        return detect_database_type(self.connector.__class__)
     
     def _update_metadata_extractor_config(self, config: ProfilerConfig) -> None:
         """Update metadata extractor with current configuration."""
@@ -199,16 +390,29 @@ class CoreSchemaProfiler(SchemaProfiler):
         if not table_profile.sample_data:
             return
         
-        for column in table_profile.columns:
-            if column.sample_values:
-                try:
-                    # Detect patterns using the pattern recognizer
-                    column.detected_patterns = self.pattern_recognizer.detect_patterns(
-                        column.sample_values, field_name=column.name
-                    )
-                except Exception as e:
-                    self.logger.warning(f"Pattern detection failed for column {column.name}: {e}")
-                    column.detected_patterns = []
+        columns = [column for column in table_profile.columns if column.sample_values]
+        
+        # Detect all columns of the table in one call when the recognizer supports it
+        detect_batch = getattr(self.pattern_recognizer, 'detect_patterns_batch', None)
+        if detect_batch is not None:
+            try:
+                results = detect_batch([(column.name, column.sample_values) for column in columns])
+            except Exception as e:
+                self.logger.warning(f"Batched pattern detection failed for table {table_profile.name}: {e}")
+            else:
+                for column, detected_patterns in zip(columns, results):
+                    column.detected_patterns = detected_patterns
+                return
+        
+        for column in columns:
+            try:
+                # Detect patterns using the pattern recognizer
+                column.detected_patterns = self.pattern_recognizer.detect_patterns(
+                    column.sample_values, field_name=column.name
+                )
+            except Exception as e:
+                self.logger.warning(f"Pattern detection failed for column {column.name}: {e}")
+                column.detected_patterns = []
     
     def _analyze_schema_relationships(self, schema_profile: SchemaProfile, config: ProfilerConfig) -> None:
         """Analyze cross-table relationships and generate summaries."""
@@ -217,7 +421,9 @@ class CoreSchemaProfiler(SchemaProfiler):
         
         try:
             # Analyze cross-table relationships
-            schema_profile.cross_table_relationships = self._analyze_cross_table_relationships(schema_profile.tables)
+            schema_profile.cross_table_relationships = self._analyze_cross_table_relationships(
+                schema_profile.tables
+            )
             
             # Find potential relationships
             schema_profile.potential_relationships = self._find_potential_relationships(schema_profile.tables)
@@ -225,7 +431,7 @@ class CoreSchemaProfiler(SchemaProfiler):
             # Generate pattern summary
             if config.pattern_recognition_enabled:
                 schema_profile.pattern_summary = self._generate_pattern_summary(schema_profile.tables)
-            
+        
         except Exception as e:
             self.logger.error(f"Error analyzing schema relationships: {e}")
             # Set empty relationships rather than failing
@@ -236,14 +442,21 @@ class CoreSchemaProfiler(SchemaProfiler):
     def _analyze_cross_table_relationships(self, tables: List[TableProfile]) -> List[Dict[str, Any]]:
         """Analyze relationships between tables."""
         relationships = []
+        # Index tables once so relationship targets resolve without list scans
+        tables_by_name = {table.name: table for table in tables}
         
         for table in tables:
             for fk in table.foreign_keys:
+                target = tables_by_name.get(fk['referenced_table'])
+                if target is None:
+                    self.logger.debug(f"Foreign key {table.name}.{fk['column_name']} references "
+                                      f"{fk['referenced_table']}, which was not profiled")
                 relationship = {
-                    'type': 'foreign_key',
+                    'type': _REL_TYPE_FOREIGN_KEY,
                     'from_table': table.name,
                     'from_column': fk['column_name'],
-                    'to_table': fk['referenced_table'],
+                    # Share the profiled table's name instead of the driver's copy
+                    'to_table': target.name if target is not None else fk['referenced_table'],
                     'to_column': fk['referenced_column'],
                     'constraint_name': fk['constraint_name']
                 }
@@ -261,70 +474,83 @@ class CoreSchemaProfiler(SchemaProfiler):
             if table.primary_keys:
                 pk_map[table.name] = table.primary_keys[0]  # Use first PK for simplicity
         
+        # Index the candidate targets by lowercased table name and PK column, so
+        # each column is matched with a few dict probes instead of a scan of
+        # every table
+        targets = list(pk_map.items())
+        targets_by_table = defaultdict(list)
+        targets_by_pk = defaultdict(list)
+        for index, (target_table, pk_column) in enumerate(targets):
+            targets_by_table[target_table.lower()].append(index)
+            targets_by_pk[pk_column.lower()].append(index)
+        
         # Look for potential foreign keys
         for table in tables:
             for column in table.columns:
                 if not column.is_foreign_key and not column.is_primary_key:
-                    # Check if column name suggests it's a foreign key
-                    for target_table, pk_column in pk_map.items():
+                    # Simple heuristic: column name is "<target_table>_id", or ends with
+                    # "_<target_table>_id" or "_<pk_column>"
+                    pk_keys, table_keys = _relationship_name_keys(column.name)
+                    
+                    matched = set()
+                    for key in pk_keys:
+                        matched.update(targets_by_pk.get(key, ()))
+                    for key in table_keys:
+                        matched.update(targets_by_table.get(key, ()))
+                    
+                    # Report targets in table order, as a scan over pk_map would
+                    for index in sorted(matched):
+                        target_table, pk_column = targets[index]
                         if target_table != table.name:
-                            # Simple heuristic: column_name ends with target_table name or pk_column
-                            if (column.name.lower().endswith(f"_{target_table.lower()}_id") or
-                                column.name.lower().endswith(f"_{pk_column.lower()}") or
-                                column.name.lower() == f"{target_table.lower()}_id"):
-                                
-                                potential_relationships.append({
-                                    'type': 'potential_foreign_key',
-                                    'from_table': table.name,
-                                    'from_column': column.name,
-                                    'to_table': target_table,
-                                    'to_column': pk_column,
-                                    'reason': 'Column name pattern suggests relationship',
-                                    'confidence': 'medium'
-                                })
+                            potential_relationships.append({
+                                'type': _REL_TYPE_POTENTIAL_FOREIGN_KEY,
+                                'from_table': table.name,
+                                'from_column': column.name,
+                                'to_table': target_table,
+                                'to_column': pk_column,
+                                'reason': _REASON_NAME_PATTERN,
+                                'confidence': _CONFIDENCE_MEDIUM
+                            })
         
         return potential_relationships
     
     def _generate_pattern_summary(self, tables: List[TableProfile]) -> Dict[str, int]:
         """Generate a summary of detected patterns across all tables."""
-        pattern_counts = {}
-        
-        for table in tables:
-            for column in table.columns:
-                for pattern in column.detected_patterns:
-                    pattern_counts[pattern] = pattern_counts.get(pattern, 0) + 1
-        
-        return pattern_counts
+        pattern_counts = Counter(chain.from_iterable(
+            column.detected_patterns
+            for table in tables
+            for column in table.columns
+        ))
+        return dict(pattern_counts)
     
-    def export_profile(self, schema_profile: SchemaProfile, output_path: str) -> Dict[str, Any]:
+    def export_profile(self, schema_profile: SchemaProfile, output_path: str,
+                       return_dict: bool = True) -> Optional[Dict[str, Any]]:
         """
         Export schema profile to file.
         
+        The profile is encoded straight from its dataclasses, one table at a
+        time through a large write buffer; a dictionary copy is only built
+        when the caller asks for it.
+        
         Args:
             schema_profile: Schema profile to export
             output_path: Output file path
-            
+            return_dict: Whether to build and return the dictionary form
+        
         Returns:
-            Dictionary representation of the profile
+            Dictionary representation of the profile, or None if not requested
         """
-        import json
-        from dataclasses import asdict
-        from pathlib import Path
-        
         try:
-            # Convert to dictionary
-            profile_dict = asdict(schema_profile)
-            
             # Ensure directory exists
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             
             # Export to JSON
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(profile_dict, f, indent=2, ensure_ascii=False, default=str)
+            with open(output_path, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+                f.writelines(iter_json_chunks(encode_default(schema_profile), 'tables', default=encode_default))
             
             self.logger.info(f"Schema profile exported to {output_path}")
-            return profile_dict
-            
+            return asdict(schema_profile) if return_dict else None
+        
         except Exception as e:
             self.logger.error(f"Error exporting profile: {e}")
             raise 
\ No newline at end of file
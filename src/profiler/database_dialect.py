@@ -5,12 +5,58 @@ This module provides database-specific SQL syntax and operations for different d
 Supports MySQL, PostgreSQL, and Microsoft SQL Server with appropriate queries and formatting.
 """
 
-from typing import Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+from ._compat import DATACLASS_OPTIONS
+
+
+def _normalize_sql(query: str) -> str:
+    """Collapse the indentation and line breaks of a query template to single spaces."""
+    return ' '.join(query.split())
+
+
+def _limit_sample_query(columns: str, table: str, limit: int) -> str:
+    """Sample query for databases with a LIMIT clause (MySQL, PostgreSQL)."""
+    return f'SELECT {columns} FROM {table} LIMIT {limit}'
+
+
+def _top_sample_query(columns: str, table: str, limit: int) -> str:
+    """Sample query for databases with a TOP clause (SQL Server)."""
+    return f'SELECT TOP {limit} {columns} FROM {table}'
+
+
+@lru_cache(maxsize=1024)
+def _quote(template: str, identifier: str) -> str:
+    """Format an identifier into a dialect's quoting template (memoized)."""
+    return template.format(identifier)
+
+
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
+class DialectSpec:
+    """SQL templates of one database dialect"""
+    table_info_query: str
+    tables_query: str
+    foreign_keys_query: str
+    indexes_query: str
+    primary_keys_query: str
+    all_columns_query: str
+    all_foreign_keys_query: str
+    all_indexes_query: str
+    all_primary_keys_query: str
+    sample_query: str
+    count_query: str
+    quote_identifier: str
+    # One row per table whose values change with its columns, keys or indexes
+    schema_summary_query: Optional[str] = None
 
 
 class DatabaseDialect:
     """Handles database-specific SQL syntax and operations"""
     
+    __slots__ = ('db_type', 'dialect', '_sample_fn')
+    
     DIALECTS = {
         'mysql': {
             'table_info_query': """
@@ -66,6 +112,76 @@ class DatabaseDialect:
                 AND CONSTRAINT_NAME = 'PRIMARY'
                 ORDER BY ORDINAL_POSITION
             """,
+            'all_columns_query': """
+                SELECT 
+                    TABLE_NAME as table_name,
+                    COLUMN_NAME as column_name,
+                    DATA_TYPE as data_type,
+                    IS_NULLABLE as is_nullable,
+                    CHARACTER_MAXIMUM_LENGTH as character_maximum_length,
+                    COLUMN_DEFAULT as column_default,
+                    COLUMN_KEY as column_key,
+                    EXTRA as extra,
+                    ORDINAL_POSITION as ordinal_position,
+                    COLUMN_COMMENT as column_comment
+                FROM INFORMATION_SCHEMA.COLUMNS 
+                WHERE TABLE_SCHEMA = %s
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """,
+            'all_foreign_keys_query': """
+                SELECT 
+                    TABLE_NAME as table_name,
+                    COLUMN_NAME as column_name,
+                    REFERENCED_TABLE_NAME as referenced_table,
+                    REFERENCED_COLUMN_NAME as referenced_column,
+                    CONSTRAINT_NAME as constraint_name
+                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE 
+                WHERE TABLE_SCHEMA = %s 
+                AND REFERENCED_TABLE_NAME IS NOT NULL
+                ORDER BY TABLE_NAME
+            """,
+            'all_indexes_query': """
+                SELECT 
+                    TABLE_NAME as table_name,
+                    INDEX_NAME as index_name,
+                    COLUMN_NAME as column_name,
+                    NON_UNIQUE as non_unique,
+                    INDEX_TYPE as index_type,
+                    SEQ_IN_INDEX as sequence_in_index
+                FROM INFORMATION_SCHEMA.STATISTICS 
+                WHERE TABLE_SCHEMA = %s
+                ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+            """,
+            'all_primary_keys_query': """
+                SELECT TABLE_NAME as table_name, COLUMN_NAME as column_name
+                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+                WHERE TABLE_SCHEMA = %s 
+                AND CONSTRAINT_NAME = 'PRIMARY'
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """,
+            'schema_summary_query': """
+                SELECT p.table_name, COUNT(*) as part_count, SUM(p.part) as part_checksum
+                FROM (
+                    SELECT TABLE_NAME as table_name,
+                        CRC32(CONCAT_WS('|', 'C', COLUMN_NAME, DATA_TYPE, IS_NULLABLE,
+                            COALESCE(CHARACTER_MAXIMUM_LENGTH, ''), COALESCE(COLUMN_DEFAULT, '<null>'),
+                            ORDINAL_POSITION)) as part
+                    FROM INFORMATION_SCHEMA.COLUMNS
+                    WHERE TABLE_SCHEMA = %s
+                    UNION ALL
+                    SELECT TABLE_NAME,
+                        CRC32(CONCAT_WS('|', 'I', INDEX_NAME, COLUMN_NAME, NON_UNIQUE))
+                    FROM INFORMATION_SCHEMA.STATISTICS
+                    WHERE TABLE_SCHEMA = %s
+                    UNION ALL
+                    SELECT TABLE_NAME,
+                        CRC32(CONCAT_WS('|', 'K', CONSTRAINT_NAME, COLUMN_NAME,
+                            COALESCE(REFERENCED_TABLE_NAME, ''), COALESCE(REFERENCED_COLUMN_NAME, '')))
+                    FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
+                    WHERE TABLE_SCHEMA = %s
+                ) p
+                GROUP BY p.table_name
+            """,
             'sample_query': 'SELECT {} FROM {} LIMIT {}',
             'count_query': 'SELECT COUNT(*) as row_count FROM {}',
             'quote_identifier': '`{}`'
@@ -135,6 +251,63 @@ class DatabaseDialect:
                 WHERE i.indisprimary AND n.nspname = %s AND c.relname = %s
                 ORDER BY a.attnum
             """,
+            'all_columns_query': """
+                SELECT 
+                    c.table_name,
+                    c.column_name,
+                    c.data_type,
+                    c.is_nullable,
+                    c.character_maximum_length,
+                    c.column_default,
+                    c.ordinal_position,
+                    col_description(pgc.oid, c.ordinal_position) as column_comment
+                FROM information_schema.columns c
+                LEFT JOIN pg_class pgc ON pgc.relname = c.table_name
+                LEFT JOIN pg_namespace pgn ON pgn.oid = pgc.relnamespace
+                WHERE c.table_schema = %s
+                ORDER BY c.table_name, c.ordinal_position
+            """,
+            'all_foreign_keys_query': """
+                SELECT 
+                    tc.table_name,
+                    kcu.column_name,
+                    ccu.table_name AS referenced_table,
+                    ccu.column_name AS referenced_column,
+                    tc.constraint_name
+                FROM information_schema.table_constraints AS tc 
+                JOIN information_schema.key_column_usage AS kcu
+                    ON tc.constraint_name = kcu.constraint_name
+                JOIN information_schema.constraint_column_usage AS ccu
+                    ON ccu.constraint_name = tc.constraint_name
+                WHERE tc.constraint_type = 'FOREIGN KEY' 
+                AND tc.table_schema = %s
+                ORDER BY tc.table_name
+            """,
+            'all_indexes_query': """
+                SELECT 
+                    t.relname as table_name,
+                    i.relname as index_name,
+                    a.attname as column_name,
+                    ix.indisunique as is_unique,
+                    ix.indisprimary as is_primary
+                FROM pg_class t
+                JOIN pg_index ix ON t.oid = ix.indrelid
+                JOIN pg_class i ON i.oid = ix.indexrelid
+                JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                WHERE n.nspname = %s
+                AND NOT ix.indisprimary
+                ORDER BY t.relname
+            """,
+            'all_primary_keys_query': """
+                SELECT c.relname as table_name, a.attname as column_name
+                FROM pg_index i
+                JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                JOIN pg_class c ON c.oid = i.indrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE i.indisprimary AND n.nspname = %s
+                ORDER BY c.relname, a.attnum
+            """,
             'sample_query': 'SELECT {} FROM {} LIMIT {}',
             'count_query': 'SELECT COUNT(*) as row_count FROM {}',
             'quote_identifier': '"{}"'
@@ -200,12 +373,89 @@ class DatabaseDialect:
                 WHERE t.name = ? AND i.is_primary_key = 1
                 ORDER BY ic.key_ordinal
             """,
+            'all_columns_query': """
+                SELECT 
+                    c.TABLE_NAME as table_name,
+                    c.COLUMN_NAME as column_name,
+                    c.DATA_TYPE as data_type,
+                    c.IS_NULLABLE as is_nullable,
+                    c.CHARACTER_MAXIMUM_LENGTH as character_maximum_length,
+                    c.COLUMN_DEFAULT as column_default,
+                    c.ORDINAL_POSITION as ordinal_position,
+                    ep.value as column_comment
+                FROM INFORMATION_SCHEMA.COLUMNS c
+                LEFT JOIN sys.columns sc ON sc.name = c.COLUMN_NAME
+                LEFT JOIN sys.tables st ON st.name = c.TABLE_NAME
+                LEFT JOIN sys.extended_properties ep ON ep.major_id = st.object_id 
+                    AND ep.minor_id = sc.column_id AND ep.name = 'MS_Description'
+                WHERE c.TABLE_CATALOG = ?
+                ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+            """,
+            'all_foreign_keys_query': """
+                SELECT 
+                    OBJECT_NAME(fkc.parent_object_id) as table_name,
+                    COL_NAME(fkc.parent_object_id, fkc.parent_column_id) as column_name,
+                    OBJECT_NAME(fkc.referenced_object_id) as referenced_table,
+                    COL_NAME(fkc.referenced_object_id, fkc.referenced_column_id) as referenced_column,
+                    fk.name as constraint_name
+                FROM sys.foreign_key_columns fkc
+                JOIN sys.foreign_keys fk ON fkc.constraint_object_id = fk.object_id
+                WHERE DB_NAME() = ?
+                ORDER BY OBJECT_NAME(fkc.parent_object_id)
+            """,
+            'all_indexes_query': """
+                SELECT 
+                    t.name as table_name,
+                    i.name as index_name,
+                    c.name as column_name,
+                    i.is_unique,
+                    i.is_primary_key
+                FROM sys.indexes i
+                JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+                JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+                JOIN sys.tables t ON i.object_id = t.object_id
+                WHERE DB_NAME() = ? AND i.is_primary_key = 0
+                ORDER BY t.name
+            """,
+            'all_primary_keys_query': """
+                SELECT t.name as table_name, c.name as column_name
+                FROM sys.indexes i
+                JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+                JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+                JOIN sys.tables t ON i.object_id = t.object_id
+                WHERE DB_NAME() = ? AND i.is_primary_key = 1
+                ORDER BY t.name, ic.key_ordinal
+            """,
+            'schema_summary_query': """
+                SELECT t.name as table_name,
+                    CONVERT(varchar(33), t.modify_date, 126) as modify_date,
+                    (SELECT COUNT(*) FROM sys.columns c WHERE c.object_id = t.object_id) as column_count
+                FROM sys.tables t
+                WHERE DB_NAME() = ?
+            """,
             'sample_query': 'SELECT TOP {} {} FROM {}',
             'count_query': 'SELECT COUNT(*) as row_count FROM {}',
             'quote_identifier': '[{}]'
         }
     }
     
+    # Queries are shipped to the database without their source indentation
+    DIALECTS: Dict[str, DialectSpec] = {
+        db_type: DialectSpec(**{name: _normalize_sql(template) for name, template in templates.items()})
+        for db_type, templates in DIALECTS.items()
+    }
+    
+    # Statements run once on every new connection. MySQL 8 serves cached
+    # INFORMATION_SCHEMA table statistics instead of recomputing them per query
+    # (innodb_stats_on_metadata is global-only and already off by default)
+    SESSION_INIT_STATEMENTS = {
+        'mysql': ("SET SESSION information_schema_stats_expiry = 86400",)
+    }
+    
+    # Supported database types, fixed with the dialect table
+    SUPPORTED_DATABASES: Tuple[str, ...] = tuple(DIALECTS)
+    SUPPORTED: frozenset = frozenset(DIALECTS)
+    
     def __init__(self, db_type: str):
         """
         Initialize the database dialect.
@@ -215,6 +465,27 @@ class DatabaseDialect:
         """
         self.db_type = db_type.lower()
         self.dialect = self.DIALECTS.get(self.db_type, self.DIALECTS['postgresql'])
+        self._sample_fn = _top_sample_query if self.db_type == 'mssql' else _limit_sample_query
+    
+    @classmethod
+    def get(cls, db_type: str) -> 'DatabaseDialect':
+        """
+        Get the shared dialect instance for a database type.
+        
+        Dialects are stateless, so one instance per type is reused instead of
+        constructing a new one for every quoted name or query.
+        
+        Args:
+            db_type: Database type ('mysql', 'postgresql', 'mssql')
+        
+        Returns:
+            Cached DatabaseDialect instance
+        """
+        key = db_type.lower()
+        dialect = _DIALECT_INSTANCES.get(key)
+        if dialect is None:
+            dialect = _DIALECT_INSTANCES.setdefault(key, cls(key))
+        return dialect
     
     def get_sample_query(self, columns: str, table: str, limit: int = 5) -> str:
         """
@@ -224,14 +495,20 @@ class DatabaseDialect:
             columns: Column specification (e.g., '*' or 'col1, col2')
             table: Table name (should already be quoted if needed)
             limit: Number of rows to limit
-            
+        
         Returns:
             Database-specific sample query string
         """
-        if self.db_type == 'mssql':
-            return self.dialect['sample_query'].format(limit, columns, table)
-        else:
-            return self.dialect['sample_query'].format(columns, table, limit)
+        return self._sample_fn(columns, table, limit)
+    
+    def session_init_statements(self) -> List[str]:
+        """
+        Get the statements to run once per connection for faster metadata queries.
+        
+        Returns:
+            SQL statements (empty for databases that need none)
+        """
+        return list(self.SESSION_INIT_STATEMENTS.get(self.db_type, ()))
     
     def get_count_query(self, table: str) -> str:
         """
@@ -239,31 +516,57 @@ class DatabaseDialect:
         
         Args:
             table: Table name (should already be quoted if needed)
-            
+        
         Returns:
             Database-specific count query string
         """
-        return self.dialect['count_query'].format(table)
+        return self.dialect.count_query.format(table)
     
     def get_column_info_query(self) -> str:
         """Get the column information query for this database type."""
-        return self.dialect['table_info_query']
+        return self.dialect.table_info_query
     
     def get_tables_query(self) -> str:
         """Get the tables listing query for this database type."""
-        return self.dialect['tables_query']
+        return self.dialect.tables_query
     
     def get_foreign_keys_query(self) -> str:
         """Get the foreign keys query for this database type."""
-        return self.dialect['foreign_keys_query']
+        return self.dialect.foreign_keys_query
     
     def get_indexes_query(self) -> str:
         """Get the indexes query for this database type."""
-        return self.dialect['indexes_query']
+        return self.dialect.indexes_query
     
     def get_primary_keys_query(self) -> str:
         """Get the primary keys query for this database type."""
-        return self.dialect['primary_keys_query']
+        return self.dialect.primary_keys_query
+    
+    def get_all_columns_query(self) -> str:
+        """Get the schema-wide column information query (rows carry table_name)."""
+        return self.dialect.all_columns_query
+    
+    def get_all_foreign_keys_query(self) -> str:
+        """Get the schema-wide foreign keys query (rows carry table_name)."""
+        return self.dialect.all_foreign_keys_query
+    
+    def get_all_indexes_query(self) -> str:
+        """Get the schema-wide indexes query (rows carry table_name)."""
+        return self.dialect.all_indexes_query
+    
+    def get_all_primary_keys_query(self) -> str:
+        """Get the schema-wide primary keys query (rows carry table_name)."""
+        return self.dialect.all_primary_keys_query
+    
+    def get_schema_summary_query(self) -> Optional[str]:
+        """
+        Get the schema-wide summary query (one row per table, None if unsupported).
+        
+        A table's row changes whenever its columns, keys or indexes do (MySQL:
+        count and checksum of their definitions; SQL Server: the table's
+        modify_date, which ALTER TABLE and index changes update).
+        """
+        return self.dialect.schema_summary_query
     
     def quote_identifier(self, identifier: str) -> str:
         """
@@ -271,16 +574,22 @@ class DatabaseDialect:
         
         Args:
             identifier: The identifier to quote
-            
+        
         Returns:
             Properly quoted identifier for this database type
         """
-        return self.dialect['quote_identifier'].format(identifier)
+        return _quote(self.dialect.quote_identifier, identifier)
     
-    def get_supported_databases(self) -> list:
-        """Get list of supported database types."""
-        return list(self.DIALECTS.keys())
+    @classmethod
+    def get_supported_databases(cls) -> Tuple[str, ...]:
+        """Get the supported database types."""
+        return cls.SUPPORTED_DATABASES
     
-    def is_supported(self, db_type: str) -> bool:
+    @classmethod
+    def is_supported(cls, db_type: str) -> bool:
         """Check if a database type is supported."""
-        return db_type.lower() in self.DIALECTS 
\ No newline at end of file
+        return db_type.lower() in cls.SUPPORTED 
+
+
+# Shared dialect instances by lowercased database type (see DatabaseDialect.get)
+_DIALECT_INSTANCES: Dict[str, DatabaseDialect] = {}
@@ -6,11 +6,38 @@ including parameter handling, error management, and result processing.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Union, Tuple
-from abc import ABC, abstractmethod
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import Dict, Any, Iterator, List, Optional, Union, Tuple
 
+from .database_dialect import DatabaseDialect
 
-class DatabaseQuery(ABC):
+
+# Most query results kept while a caching session is open
+_QUERY_CACHE_SIZE = 2048
+
+# Tables counted per UNION ALL statement in count_rows_bulk
+_COUNT_BATCH_SIZE = 50
+
+
+def _extract_column(rows: List[Dict[str, Any]], key: str) -> List[Any]:
+    """
+    Extract one value from each row, skipping rows without the key.
+    
+    Dialect queries alias every column they return, so the C-level itemgetter
+    pass normally succeeds; only rows from an unexpected driver fall back to
+    the filtering scan.
+    """
+    try:
+        return list(map(itemgetter(key), rows))
+    except KeyError:
+        return [row[key] for row in rows if key in row]
+
+
+class DatabaseQuery:
     """
     Base class for database query operations with common patterns.
     
@@ -33,6 +60,33 @@ class DatabaseQuery(ABC):
         self.schema_name = schema_name
         self.db_type = db_type.lower()
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Session settings that speed up metadata queries, run on each new connection
+        add_session_init_statements = getattr(connector, 'add_session_init_statements', None)
+        if add_session_init_statements is not None:
+            add_session_init_statements(DatabaseDialect.get(self.db_type).session_init_statements())
+        
+        # Parameter builder for this database type, chosen once
+        if self.db_type == 'mssql':
+            self._param_fn = self._mssql_query_parameters
+        elif self.db_type == 'postgresql':
+            self._param_fn = self._postgresql_query_parameters
+        else:
+            self._param_fn = self._mysql_query_parameters
+        
+        # Repeated metadata queries run as prepared statements where the connector supports them
+        self._execute_prepared = getattr(connector, 'execute_prepared', None) or connector.execute_query
+        
+        # Quoted table names by (table name, include_schema, schema name)
+        self._quoted_table_cache: Dict[Tuple[str, bool, Optional[str]], str] = {}
+        
+        # Prefetched schema-wide metadata: per-table dialect method -> {table_name: rows}
+        self._bulk_cache: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        
+        # Query results of open caching sessions, least recently used first
+        self._query_cache: 'OrderedDict[Tuple, List[Dict[str, Any]]]' = OrderedDict()
+        self._query_cache_depth = 0
+        self._query_cache_lock = threading.Lock()
     
     def _get_query_parameters(self, table_name: Optional[str] = None, **kwargs) -> List[Union[str, None]]:
         """
@@ -41,54 +95,160 @@ class DatabaseQuery(ABC):
         Args:
             table_name: Optional table name for table-specific queries
             **kwargs: Additional parameters
-            
+        
         Returns:
             List of parameters for the query
         """
+        return self._param_fn(table_name)
+    
+    def _mssql_query_parameters(self, table_name: Optional[str]) -> List[Union[str, None]]:
+        """Query parameters for SQL Server."""
+        if table_name:
+            return [table_name]
+        return [self.database_name]
+    
+    def _postgresql_query_parameters(self, table_name: Optional[str]) -> List[Union[str, None]]:
+        """Query parameters for PostgreSQL."""
+        schema = self.schema_name or 'public'
+        if table_name:
+            return [schema, table_name]
+        return [schema, schema]  # For tables query that needs schema twice
+    
+    def _mysql_query_parameters(self, table_name: Optional[str]) -> List[Union[str, None]]:
+        """Query parameters for MySQL (and unknown database types)."""
+        schema = self.schema_name or self.database_name
+        if table_name:
+            return [schema, table_name]
+        return [schema]
+    
+    def _get_schema_query_parameters(self) -> List[str]:
+        """
+        Get the single parameter of the schema-wide metadata queries.
+        
+        Returns:
+            Schema name (MySQL, PostgreSQL) or database name (SQL Server)
+        """
         if self.db_type == 'mssql':
-            if table_name:
-                return [table_name]
-            else:
-                return [self.database_name]
+            return [self.database_name]
         elif self.db_type == 'postgresql':
-            schema = self.schema_name or 'public'
-            if table_name:
-                return [schema, table_name]
-            else:
-                return [schema, schema]  # For tables query that needs schema twice
+            return [self.schema_name or 'public']
         else:  # mysql
-            schema = self.schema_name or self.database_name
-            if table_name:
-                return [schema, table_name]
-            else:
-                return [schema]
+            return [self.schema_name or self.database_name]
+    
+    def clear_bulk_cache(self) -> None:
+        """Drop prefetched schema-wide metadata; later queries go per table again."""
+        self._bulk_cache = {}
+    
+    @contextmanager
+    def caching_schema(self) -> Iterator['DatabaseQuery']:
+        """
+        Reuse query results for the duration of a block.
+        
+        Within the block an identical query with identical parameters is only
+        sent to the database once; failed queries are not cached. Sessions can
+        be nested, and the results are dropped when the outermost one ends.
+        
+        Yields:
+            This query handler
+        """
+        with self._query_cache_lock:
+            self._query_cache_depth += 1
+        try:
+            yield self
+        finally:
+            with self._query_cache_lock:
+                self._query_cache_depth -= 1
+                if not self._query_cache_depth:
+                    self._query_cache.clear()
+    
+    def invalidate_cache(self, table_name: Optional[str] = None) -> None:
+        """
+        Drop cached query results.
+        
+        Args:
+            table_name: Only drop results of queries for this table
+        """
+        with self._query_cache_lock:
+            if table_name is None:
+                self._query_cache.clear()
+                return
+            
+            # Per-table metadata takes the name as a parameter; sample and count
+            # queries embed it in the query text (over-matching only costs a re-query)
+            for key in [key for key in self._query_cache if table_name in key[4] or table_name in key[3]]:
+                del self._query_cache[key]
     
     def _execute_query_safe(self, query: str, params: List[Any] = None, 
                            operation_name: str = "query", table_name: str = None) -> List[Dict[str, Any]]:
         """
         Execute a query with error handling and logging.
         
+        Inside a caching_schema() block results are served from the session
+        cache; callers get copies of the cached rows.
+        
         Args:
             query: SQL query to execute
             params: Query parameters
             operation_name: Name of the operation for logging
             table_name: Optional table name for more specific error messages
-            
+        
         Returns:
             Query results or empty list on error
         """
+        cache_key = None
+        if self._query_cache_depth:
+            cache_key = self._query_cache_key(query, params)
+            with self._query_cache_lock:
+                cached = self._query_cache.get(cache_key)
+                if cached is not None:
+                    self._query_cache.move_to_end(cache_key)
+                    return [dict(row) for row in cached]
+        
         try:
-            self.logger.debug(f"Executing {operation_name} query" + (f" for table {table_name}" if table_name else ""))
-            result = self.connector.execute_query(query, params)
-            return result if result else []
+            # Lazy %-style arguments: nothing is formatted while DEBUG is off
+            if table_name:
+                self.logger.debug("Executing %s query for table %s", operation_name, table_name)
+            else:
+                self.logger.debug("Executing %s query", operation_name)
+            if params:
+                result = self._execute_prepared(query, params)
+            else:
+                result = self.connector.execute_query(query, params)
+            result = result if result else []
+            
+            if cache_key is not None:
+                self._store_cached_result(cache_key, result)
+            
+            return result
         except Exception as e:
-            error_msg = f"Error executing {operation_name}"
             if table_name:
-                error_msg += f" for table {table_name}"
-            error_msg += f": {e}"
-            self.logger.error(error_msg)
+                self.logger.error("Error executing %s for table %s: %s", operation_name, table_name, e)
+            else:
+                self.logger.error("Error executing %s: %s", operation_name, e)
             return []
     
+    def _execute_query_stream(self, query: str, params: List[Any] = None,
+                              chunksize: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a query and iterate over its rows as the connector fetches them.
+        
+        Uses the connector's stream_query() (server-side cursor / fetchmany)
+        when available, otherwise iterates the execute_query() result. Errors
+        propagate to the caller.
+        
+        Args:
+            query: SQL query to execute
+            params: Query parameters
+            chunksize: Rows fetched per round trip
+        
+        Returns:
+            Iterator over result rows
+        """
+        stream_query = getattr(self.connector, 'stream_query', None)
+        if stream_query is not None:
+            return stream_query(query, params, chunksize)
+        return iter(self.connector.execute_query(query, params) or [])
+    
     def _execute_single_value_query(self, query: str, params: List[Any] = None, 
                                    operation_name: str = "query", table_name: str = None,
                                    value_key: str = None, default_value: Any = 0) -> Any:
@@ -102,18 +262,19 @@ class DatabaseQuery(ABC):
             table_name: Optional table name for error messages
             value_key: Key to extract from the first result row
             default_value: Default value to return on error
-            
+        
         Returns:
             Single value from query or default value
         """
         result = self._execute_query_safe(query, params, operation_name, table_name)
-        if result and len(result) > 0:
-            if value_key and value_key in result[0]:
-                return result[0][value_key]
-            elif len(result[0]) > 0:
-                # Return first value from first row
-                return list(result[0].values())[0]
-        return default_value
+        if not result:
+            return default_value
+        
+        row = result[0]
+        if value_key and value_key in row:
+            return row[value_key]
+        # Return first value from first row
+        return next(iter(row.values()), default_value)
     
     def _execute_list_query(self, query: str, params: List[Any] = None,
                            operation_name: str = "query", table_name: str = None,
@@ -127,15 +288,75 @@ class DatabaseQuery(ABC):
             operation_name: Name of the operation for logging
             table_name: Optional table name for error messages
             extract_key: Key to extract from each result row
-            
+        
         Returns:
             List of values or empty list
         """
         result = self._execute_query_safe(query, params, operation_name, table_name)
         if extract_key:
-            return [row[extract_key] for row in result if extract_key in row]
+            return _extract_column(result, extract_key)
         return result
     
+    def _query_cache_key(self, query: str, params: Optional[List[Any]]) -> Tuple:
+        """Get the session cache key of a query."""
+        return (self.db_type, self.database_name, self.schema_name, query, tuple(params or ()))
+    
+    def _store_cached_result(self, cache_key: Tuple, result: List[Dict[str, Any]]) -> None:
+        """Store a copy of a query result in the session cache, evicting the oldest entry."""
+        with self._query_cache_lock:
+            self._query_cache[cache_key] = [dict(row) for row in result]
+            if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+    
+    def count_rows_bulk(self, table_names: List[str]) -> Dict[str, int]:
+        """
+        Count the rows of several tables with one UNION ALL statement per batch.
+        
+        Inside a caching_schema() session the counts also answer the per-table
+        count queries that follow. A batch whose statement fails (e.g. because
+        one of its tables was dropped) is counted table by table instead.
+        
+        Args:
+            table_names: Tables to count
+        
+        Returns:
+            Mapping of table name to row count (0 where counting failed)
+        """
+        dialect = DatabaseDialect.get(self.db_type)
+        counts = {}
+        
+        for start in range(0, len(table_names), _COUNT_BATCH_SIZE):
+            batch = table_names[start:start + _COUNT_BATCH_SIZE]
+            quoted_tables = [self.get_quoted_table_name(table_name) for table_name in batch]
+            
+            # Rows are labelled with integer literals, so no table name is ever inlined as a string
+            query = ' UNION ALL '.join(
+                f"SELECT {index} AS table_index, COUNT(*) AS row_count FROM {quoted_table}"
+                for index, quoted_table in enumerate(quoted_tables)
+            )
+            try:
+                rows = self.connector.execute_query(query, None) or []
+                batch_counts = {batch[row['table_index']]: row['row_count'] for row in rows}
+            except Exception as e:
+                self.logger.warning(f"Batched row count failed, counting tables one by one: {e}")
+                batch_counts = {}
+            
+            for table_name, quoted_table in zip(batch, quoted_tables):
+                count_query = dialect.get_count_query(quoted_table)
+                if table_name not in batch_counts:
+                    counts[table_name] = self._execute_single_value_query(
+                        count_query, operation_name='row_count', table_name=table_name,
+                        value_key='row_count', default_value=0
+                    )
+                    continue
+                
+                counts[table_name] = batch_counts[table_name]
+                if self._query_cache_depth:
+                    self._store_cached_result(self._query_cache_key(count_query, None),
+                                              [{'row_count': batch_counts[table_name]}])
+        
+        return counts
+    
     def get_quoted_table_name(self, table_name: str, include_schema: bool = True) -> str:
         """
         Get properly quoted table name for the database type.
@@ -143,13 +364,17 @@ class DatabaseQuery(ABC):
         Args:
             table_name: Name of the table
             include_schema: Whether to include schema prefix
-            
+        
         Returns:
             Properly quoted table name
         """
-        # Import here to avoid circular imports
-        from .database_dialect import DatabaseDialect
-        dialect = DatabaseDialect(self.db_type)
+        # The schema is part of the key: callers may switch schema_name between runs
+        key = (table_name, include_schema, self.schema_name)
+        quoted_table = self._quoted_table_cache.get(key)
+        if quoted_table is not None:
+            return quoted_table
+        
+        dialect = DatabaseDialect.get(self.db_type)
         
         quoted_table = dialect.quote_identifier(table_name)
         
@@ -157,17 +382,19 @@ class DatabaseQuery(ABC):
             quoted_schema = dialect.quote_identifier(self.schema_name)
             quoted_table = f"{quoted_schema}.{quoted_table}"
         
+        self._quoted_table_cache[key] = quoted_table
         return quoted_table
     
-    @abstractmethod
     def get_supported_operations(self) -> List[str]:
         """
         Get list of supported operations for this query handler.
         
+        Subclasses must override this.
+        
         Returns:
             List of operation names
         """
-        pass
+        raise NotImplementedError(f"{self.__class__.__name__} must implement get_supported_operations()")
 
 
 class MetadataQueryMixin:
@@ -188,13 +415,21 @@ class MetadataQueryMixin:
             table_name: Optional table name
             operation_name: Name of the operation for logging
             extract_key: Optional key to extract from results
-            
+        
         Returns:
             Query results or extracted values
         """
         if not hasattr(self, 'dialect'):
             raise AttributeError("MetadataQueryMixin requires 'dialect' attribute")
         
+        # Serve prefetched schema-wide results; a table without rows has none
+        bulk_rows = self._bulk_cache.get(dialect_method_name)
+        if bulk_rows is not None and table_name:
+            rows = bulk_rows.get(table_name, [])
+            if extract_key:
+                return _extract_column(rows, extract_key)
+            return rows
+        
         # Get query from dialect
         query_method = getattr(self.dialect, dialect_method_name)
         query = query_method()
@@ -209,6 +444,110 @@ class MetadataQueryMixin:
             return self._execute_list_query(query, params, operation, table_name, extract_key)
         else:
             return self._execute_query_safe(query, params, operation, table_name)
+    
+    def prefetch_schema_metadata(self) -> Dict[str, int]:
+        """
+        Fetch columns, keys and indexes of every table with one query each.
+        
+        Per-table metadata lookups are then answered from memory instead of
+        running four queries per table. An operation whose schema-wide query
+        fails keeps using per-table queries. Call clear_bulk_cache() to drop
+        the prefetched results.
+        
+        Returns:
+            Number of rows fetched per per-table dialect method
+        """
+        if not hasattr(self, 'dialect'):
+            raise AttributeError("MetadataQueryMixin requires 'dialect' attribute")
+        
+        params = self._get_schema_query_parameters()
+        row_counts = {}
+        
+        for table_method_name, bulk_method_name in _BULK_QUERY_METHODS.items():
+            # Rows are grouped as they stream in; the full result list is never built
+            rows_by_table = defaultdict(list)
+            row_count = 0
+            try:
+                for row in self._execute_query_stream(getattr(self.dialect, bulk_method_name)(), params):
+                    rows_by_table[row['table_name']].append(row)
+                    row_count += 1
+            except Exception as e:
+                self.logger.warning(f"Schema-wide {bulk_method_name} failed, falling back to per-table queries: {e}")
+                continue
+            
+            self._bulk_cache[table_method_name] = dict(rows_by_table)
+            row_counts[table_method_name] = row_count
+        
+        return row_counts
+    
+    def get_schema_summary(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get one summary row per table, changing whenever the table's structure does.
+        
+        Returns:
+            Summary rows, or None if the dialect has no summary query or it failed
+        """
+        if not hasattr(self, 'dialect'):
+            raise AttributeError("MetadataQueryMixin requires 'dialect' attribute")
+        
+        query = self.dialect.get_schema_summary_query()
+        if query is None:
+            return None
+        
+        # Each UNION branch filters on the schema, so it is bound once per placeholder
+        placeholder = '?' if self.db_type == 'mssql' else '%s'
+        params = self._get_schema_query_parameters() * query.count(placeholder)
+        
+        try:
+            return self.connector.execute_query(query, params) or []
+        except Exception as e:
+            self.logger.warning(f"Schema summary query failed: {e}")
+            return None
+    
+    def prefetch_tables(self, table_names: List[str], max_workers: int = 8) -> int:
+        """
+        Run the per-table column, key and index queries of several tables concurrently.
+        
+        Results land in the caching_schema() session cache, so the following
+        per-table lookups are answered without a round trip. Must be called
+        inside a caching session, and the connector must be safe to use from
+        several threads (e.g. hand out pooled or per-thread connections).
+        
+        Args:
+            table_names: Tables whose metadata will be needed
+            max_workers: Maximum number of concurrent queries
+        
+        Returns:
+            Number of queries executed
+        """
+        if not self._query_cache_depth:
+            self.logger.debug("prefetch_tables called outside caching_schema(); skipping")
+            return 0
+        
+        # Operations already answered by a schema-wide prefetch need no queries
+        jobs = [
+            (getattr(self.dialect, method_name)(), self._get_query_parameters(table_name),
+             method_name.replace('get_', '').replace('_query', ''), table_name)
+            for table_name in table_names
+            for method_name in _BULK_QUERY_METHODS
+            if method_name not in self._bulk_cache
+        ]
+        if not jobs:
+            return 0
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+            list(executor.map(lambda job: self._execute_query_safe(*job), jobs))
+        
+        return len(jobs)
+
+
+# Per-table dialect query methods and the schema-wide queries that can answer them
+_BULK_QUERY_METHODS = {
+    'get_column_info_query': 'get_all_columns_query',
+    'get_foreign_keys_query': 'get_all_foreign_keys_query',
+    'get_indexes_query': 'get_all_indexes_query',
+    'get_primary_keys_query': 'get_all_primary_keys_query'
+}
 
 
 class QueryExecutionStats:
@@ -216,11 +555,13 @@ class QueryExecutionStats:
     Simple class to track query execution statistics.
     """
     
+    __slots__ = ('total_queries', 'successful_queries', 'failed_queries', 'queries_by_type')
+    
     def __init__(self):
         self.total_queries = 0
         self.successful_queries = 0
         self.failed_queries = 0
-        self.queries_by_type = {}
+        self.queries_by_type = defaultdict(_new_type_counts)
     
     def record_query(self, operation_name: str, success: bool):
         """Record a query execution."""
@@ -230,13 +571,7 @@ class QueryExecutionStats:
         else:
             self.failed_queries += 1
         
-        if operation_name not in self.queries_by_type:
-            self.queries_by_type[operation_name] = {'success': 0, 'failed': 0}
-        
-        if success:
-            self.queries_by_type[operation_name]['success'] += 1
-        else:
-            self.queries_by_type[operation_name]['failed'] += 1
+        self.queries_by_type[operation_name]['success' if success else 'failed'] += 1
     
     def get_success_rate(self) -> float:
         """Get overall success rate."""
@@ -251,5 +586,10 @@ class QueryExecutionStats:
             'successful_queries': self.successful_queries,
             'failed_queries': self.failed_queries,
             'success_rate': round(self.get_success_rate(), 2),
-            'queries_by_type': self.queries_by_type
-        } 
\ No newline at end of file
+            'queries_by_type': dict(self.queries_by_type)
+        }
+
+
+def _new_type_counts() -> Dict[str, int]:
+    """Per-operation counters for QueryExecutionStats."""
+    return {'success': 0, 'failed': 0}
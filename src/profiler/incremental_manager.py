@@ -6,35 +6,78 @@ handling change detection, state management, and profile caching as
 separate, focused concerns.
 """
 
-import json
 import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
 from .interfaces import IncrementalProfiler, SchemaProfiler, StateManager, ChangeDetector, ProfileCache, ProfilerConfig
+from .json_codec import dumps_json, loads_json
 from .schema_models import SchemaProfile, TableProfile
 
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; fall back to hashlib
+    xxhash = None
+
+
+# Schema hashes of different algorithms or encodings never match, so the state
+# version records how a state file's hashes were made (2.x: JSON-encoded schema;
+# 3.0: MD5, 3.1: XXH3-128 over field records)
+_STATE_VERSION = "3.1" if xxhash is not None else "3.0"
+
+
+# Fields every state file and every table state in it must have
+_REQUIRED_STATE_FIELDS = ('database_name', 'last_profile_timestamp', 'table_states')
+_REQUIRED_TABLE_FIELDS = frozenset({'table_name', 'schema_hash', 'row_count'})
+
+# Prefetched metadata operations that cover everything a schema hash reads
+_HASHED_METADATA = frozenset({
+    'get_column_info_query', 'get_primary_keys_query', 'get_foreign_keys_query', 'get_indexes_query'
+})
+
+
+def _schema_digest(data: bytes) -> str:
+    """Hex digest used to compare table schemas between runs (not for security)."""
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.md5(data).hexdigest()
+
 
 @dataclass
 class TableChangeInfo:
-    """Information about table changes for incremental profiling."""
+    """
+    Information about table changes for incremental profiling.
+    
+    Timestamps are kept as ISO 8601 strings, as stored in the state file;
+    they are only parsed on demand (see last_modified_dt).
+    """
     table_name: str
     schema_hash: str
     row_count: int
-    last_modified: Optional[datetime] = None
+    last_modified: Optional[str] = None
     structure_changed: bool = False
     data_changed: bool = False
     
+    @property
+    def last_modified_dt(self) -> Optional[datetime]:
+        """Get last_modified as a datetime."""
+        return datetime.fromisoformat(self.last_modified) if self.last_modified else None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
             'table_name': self.table_name,
             'schema_hash': self.schema_hash,
             'row_count': self.row_count,
-            'last_modified': self.last_modified.isoformat() if self.last_modified else None,
+            'last_modified': self.last_modified,
             'structure_changed': self.structure_changed,
             'data_changed': self.data_changed
         }
@@ -46,7 +89,7 @@ class TableChangeInfo:
             table_name=data['table_name'],
             schema_hash=data['schema_hash'],
             row_count=data['row_count'],
-            last_modified=datetime.fromisoformat(data['last_modified']) if data['last_modified'] else None,
+            last_modified=data['last_modified'] or None,
             structure_changed=data.get('structure_changed', False),
             data_changed=data.get('data_changed', False)
         )
@@ -54,21 +97,29 @@ class TableChangeInfo:
 
 @dataclass
 class IncrementalState:
-    """State information for incremental profiling."""
+    """State information for incremental profiling (timestamps as ISO 8601 strings)."""
     database_name: str
     schema_name: Optional[str]
-    last_profile_timestamp: datetime
+    last_profile_timestamp: str
     table_states: Dict[str, TableChangeInfo]
-    profile_version: str = "2.0"
+    profile_version: str = _STATE_VERSION
+    # Digest of the schema summary (see DatabaseChangeDetector.schema_digest)
+    overall_digest: Optional[str] = None
+    
+    @property
+    def last_profile_dt(self) -> datetime:
+        """Get last_profile_timestamp as a datetime."""
+        return datetime.fromisoformat(self.last_profile_timestamp)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             'database_name': self.database_name,
             'schema_name': self.schema_name,
-            'last_profile_timestamp': self.last_profile_timestamp.isoformat(),
+            'last_profile_timestamp': self.last_profile_timestamp,
             'table_states': {name: state.to_dict() for name, state in self.table_states.items()},
-            'profile_version': self.profile_version
+            'profile_version': self.profile_version,
+            'overall_digest': self.overall_digest
         }
     
     @classmethod
@@ -81,17 +132,27 @@ class IncrementalState:
         return cls(
             database_name=data['database_name'],
             schema_name=data.get('schema_name'),
-            last_profile_timestamp=datetime.fromisoformat(data['last_profile_timestamp']),
+            last_profile_timestamp=data['last_profile_timestamp'],
             table_states=table_states,
-            profile_version=data.get('profile_version', '2.0')
+            profile_version=data.get('profile_version', '2.0'),
+            overall_digest=data.get('overall_digest')
         )
 
 
 class FileStateManager(StateManager):
     """File-based state management for incremental profiling."""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, durable: bool = False):
+        """
+        Initialize the state manager.
+        
+        Args:
+            file_path: Path of the state file
+            durable: Also fsync the state directory after each save, so the
+                rename itself survives a power loss (POSIX only)
+        """
         self.file_path = Path(file_path)
+        self.durable = durable
         self.logger = logging.getLogger(self.__class__.__name__)
     
     def load_state(self) -> Optional[Dict[str, Any]]:
@@ -101,8 +162,8 @@ class FileStateManager(StateManager):
                 self.logger.info(f"No existing state found at {self.file_path}")
                 return None
             
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                state_data = json.load(f)
+            with open(self.file_path, 'rb') as f:
+                state_data = loads_json(f.read())
             
             if not self.validate_state(state_data):
                 self.logger.error("State validation failed, ignoring existing state")
@@ -110,7 +171,7 @@ class FileStateManager(StateManager):
             
             self.logger.info(f"Loaded incremental state from {self.file_path}")
             return state_data
-            
+        
         except Exception as e:
             self.logger.error(f"Error loading state: {e}")
             return None
@@ -125,16 +186,31 @@ class FileStateManager(StateManager):
             if not self.validate_state(state):
                 raise ValueError("Invalid state data")
             
-            # Atomic write using temporary file
+            # Atomic write using temporary file, flushed to disk before the rename
+            # so a crash leaves either the old or the new state
+            data = dumps_json(state)
             temp_path = self.file_path.with_suffix('.tmp')
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2, ensure_ascii=False)
-            
-            # Atomic rename
-            temp_path.replace(self.file_path)
+            try:
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                
+                # Atomic rename
+                os.replace(temp_path, self.file_path)
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
+            
+            if self.durable and hasattr(os, 'O_DIRECTORY'):
+                dir_fd = os.open(self.file_path.parent, os.O_DIRECTORY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
             
             self.logger.debug(f"Saved incremental state to {self.file_path}")
-            
+        
         except Exception as e:
             self.logger.error(f"Error saving state: {e}")
             raise
@@ -143,12 +219,18 @@ class FileStateManager(StateManager):
         """Validate loaded state data."""
         try:
             # Check required fields
-            required_fields = ['database_name', 'last_profile_timestamp', 'table_states']
-            for field in required_fields:
+            for field in _REQUIRED_STATE_FIELDS:
                 if field not in state:
                     self.logger.error(f"Missing required field: {field}")
                     return False
             
+            # Hashes written by another algorithm would flag every table as changed
+            profile_version = state.get('profile_version', '2.0')
+            if profile_version != _STATE_VERSION:
+                self.logger.info(f"State version {profile_version} does not match {_STATE_VERSION}, "
+                                 f"a full profile will be taken")
+                return False
+            
             # Validate timestamp format
             datetime.fromisoformat(state['last_profile_timestamp'])
             
@@ -157,23 +239,31 @@ class FileStateManager(StateManager):
                 self.logger.error("table_states must be a dictionary")
                 return False
             
-            # Validate each table state
-            for table_name, table_state in state['table_states'].items():
-                if not isinstance(table_state, dict):
-                    self.logger.error(f"Invalid table state for {table_name}")
-                    return False
-                
-                required_table_fields = ['table_name', 'schema_hash', 'row_count']
-                for field in required_table_fields:
-                    if field not in table_state:
-                        self.logger.error(f"Missing field {field} in table state for {table_name}")
-                        return False
-            
-            return True
+            # Validate each table state with one subset test of its keys; only an
+            # invalid state is scanned again to report the offending entry
+            table_states = state['table_states']
+            if all(isinstance(table_state, dict) and _REQUIRED_TABLE_FIELDS <= table_state.keys()
+                   for table_state in table_states.values()):
+                return True
             
+            self._log_invalid_table_state(table_states)
+            return False
+        
         except Exception as e:
             self.logger.error(f"State validation error: {e}")
             return False
+    
+    def _log_invalid_table_state(self, table_states: Dict[str, Any]) -> None:
+        """Log the first table state that fails validation."""
+        for table_name, table_state in table_states.items():
+            if not isinstance(table_state, dict):
+                self.logger.error(f"Invalid table state for {table_name}")
+                return
+            
+            missing_fields = _REQUIRED_TABLE_FIELDS - table_state.keys()
+            if missing_fields:
+                self.logger.error(f"Missing field {min(missing_fields)} in table state for {table_name}")
+                return
 
 
 class DatabaseChangeDetector(ChangeDetector):
@@ -182,12 +272,112 @@ class DatabaseChangeDetector(ChangeDetector):
     def __init__(self, metadata_extractor):
         self.metadata_extractor = metadata_extractor
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Schema hashes and row counts of the current run (see prime)
+        self._schema_hashes: Dict[str, str] = {}
+        self._row_counts: Dict[str, int] = {}
+        
+        # Digest of the whole schema's summary for the current run (None if unavailable)
+        self.schema_digest: Optional[str] = None
+    
+    def reset(self) -> None:
+        """Forget the schema hashes, row counts and schema digest of the previous run."""
+        self._schema_hashes.clear()
+        self._row_counts.clear()
+        self.schema_digest = None
+    
+    def compute_schema_digest(self) -> Optional[str]:
+        """
+        Compute one digest over the metadata extractor's schema summary.
+        
+        The summary is a single query returning one row per table that changes
+        with the table's structure, so an unchanged digest means no table was
+        added, dropped or altered.
+        
+        Returns:
+            Hex digest, or None if the extractor or dialect has no summary
+        """
+        get_schema_summary = getattr(self.metadata_extractor, 'get_schema_summary', None)
+        rows = get_schema_summary() if get_schema_summary is not None else None
+        if rows is None:
+            return None
+        
+        return _schema_digest(''.join(sorted(
+            '\x1f'.join(str(value) for value in row.values()) + '\x1e' for row in rows
+        )).encode())
+    
+    def prime(self, table_names: List[str], max_workers: int = 8) -> None:
+        """
+        Compute schema hashes and count rows of several tables in bulk.
+        
+        Metadata comes from the schema-wide queries of the metadata extractor
+        (per-table queries, run concurrently, for a single table) and row
+        counts from batched statements. Tables whose metadata still needs
+        queries are hashed on a thread pool so the round trips overlap.
+        Results are kept until reset(), so change detection and the state
+        update of one run share them.
+        
+        Args:
+            table_names: Tables whose hashes and row counts will be needed
+            max_workers: Maximum number of concurrent per-table queries
+        """
+        missing = [name for name in table_names if name not in self._schema_hashes]
+        if missing:
+            self._prime_schema_hashes(missing, max_workers)
+        
+        uncounted = [name for name in table_names if name not in self._row_counts]
+        count_rows_bulk = getattr(self.metadata_extractor, 'count_rows_bulk', None)
+        if count_rows_bulk is not None and len(uncounted) > 1:
+            self._row_counts.update(count_rows_bulk(uncounted))
+    
+    def _prime_schema_hashes(self, missing: List[str], max_workers: int) -> None:
+        """Hash tables in bulk (see prime)."""
+        prefetch_schema_metadata = getattr(self.metadata_extractor, 'prefetch_schema_metadata', None)
+        bulk = prefetch_schema_metadata is not None and len(missing) > 1
+        in_memory = False
+        if bulk:
+            in_memory = _HASHED_METADATA <= set(prefetch_schema_metadata() or ())
+        else:
+            prefetch_tables = getattr(self.metadata_extractor, 'prefetch_tables', None)
+            if prefetch_tables is not None:
+                prefetch_tables(missing, max_workers=max_workers)
+        
+        try:
+            if in_memory or max_workers <= 1 or len(missing) == 1:
+                hashes = [self._compute_table_schema_hash(table_name) for table_name in missing]
+            else:
+                # Hashing queries the database per table; overlap the round trips
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                    hashes = list(executor.map(self._compute_table_schema_hash, missing))
+            self._schema_hashes.update(zip(missing, hashes))
+        finally:
+            if bulk:
+                self.metadata_extractor.clear_bulk_cache()
+    
+    def get_schema_hash(self, table_name: str) -> str:
+        """Get the schema hash of a table, computed once per run."""
+        schema_hash = self._schema_hashes.get(table_name)
+        if schema_hash is None:
+            schema_hash = self._schema_hashes[table_name] = self._compute_table_schema_hash(table_name)
+        return schema_hash
+    
+    def get_row_count(self, table_name: str) -> int:
+        """Get the row count of a table, counted once per run."""
+        row_count = self._row_counts.get(table_name)
+        if row_count is None:
+            row_count = self._row_counts[table_name] = self.metadata_extractor.get_row_count(table_name)
+        return row_count
     
     def identify_changed_tables(self,
                                current_tables: List[Dict[str, Any]],
                                previous_state: Optional[Dict[str, Any]],
                                config: ProfilerConfig) -> List[Dict[str, Any]]:
         """Identify tables that need re-profiling."""
+        # Each run starts from fresh metadata; the schema digest is kept in the
+        # state even after a full profile
+        self.reset()
+        self.schema_digest = self.compute_schema_digest()
+        
         if config.force_full_profile or not previous_state:
             self.logger.info("Full profiling requested or no previous state available")
             return current_tables
@@ -211,6 +401,18 @@ class DatabaseChangeDetector(ChangeDetector):
             if removed_tables:
                 self.logger.info(f"Removed tables detected: {removed_tables}")
             
+            # An unchanged schema digest means every table kept its structure, so the
+            # stored hashes stand in for hashing; only row counts are queried then
+            existing_tables = [name for name in current_table_names if name in prev_state.table_states]
+            if self.schema_digest is not None and self.schema_digest == prev_state.overall_digest:
+                self.logger.info("Schema digest unchanged, skipping per-table schema checks")
+                for name in existing_tables:
+                    if prev_state.table_states[name].schema_hash:
+                        self._schema_hashes[name] = prev_state.table_states[name].schema_hash
+            
+            # Hash and count all existing tables in bulk before comparing them
+            self.prime(existing_tables, max_workers=config.max_workers)
+            
             # Check existing tables for changes
             for table_info in current_tables:
                 table_name = table_info['table_name']
@@ -237,7 +439,7 @@ class DatabaseChangeDetector(ChangeDetector):
             
             self.logger.info(f"Change detection completed: {len(tables_to_profile)}/{len(current_tables)} tables need profiling")
             return tables_to_profile
-            
+        
         except Exception as e:
             self.logger.error(f"Error during change detection: {e}")
             # Fall back to full profiling on error
@@ -246,16 +448,18 @@ class DatabaseChangeDetector(ChangeDetector):
     def _has_schema_changes(self, table_name: str, previous_state: TableChangeInfo) -> bool:
         """Check if table schema has changed."""
         try:
-            current_hash = self._compute_table_schema_hash(table_name)
+            current_hash = self.get_schema_hash(table_name)
             return current_hash != previous_state.schema_hash
         except Exception as e:
             self.logger.warning(f"Error checking schema changes for {table_name}: {e}")
             return True  # Assume changed on error
     
-    def _has_data_changes(self, table_name: str, previous_state: TableChangeInfo, threshold: float) -> bool:
-        """Check if table data has changed significantly."""
+    def _has_data_changes(self, table_name: str, previous_state: TableChangeInfo, threshold: float,
+                          current_row_count: Optional[int] = None) -> bool:
+        """Check if table data has changed significantly (counting rows unless a count is given)."""
         try:
-            current_row_count = self.metadata_extractor.get_row_count(table_name)
+            if current_row_count is None:
+                current_row_count = self.get_row_count(table_name)
             previous_row_count = previous_state.row_count
             
             if previous_row_count > 0:
@@ -266,7 +470,7 @@ class DatabaseChangeDetector(ChangeDetector):
                 return True
             
             return False
-            
+        
         except Exception as e:
             self.logger.warning(f"Error checking data changes for {table_name}: {e}")
             return True  # Assume changed on error
@@ -280,60 +484,87 @@ class DatabaseChangeDetector(ChangeDetector):
             foreign_keys = self.metadata_extractor.get_foreign_keys(table_name)
             indexes = self.metadata_extractor.get_indexes(table_name)
             
-            # Create deterministic representation
-            schema_data = {
-                'columns': [
-                    {
-                        'name': col.name,
-                        'data_type': col.data_type,
-                        'is_nullable': col.is_nullable,
-                        'max_length': col.max_length,
-                        'default_value': col.default_value,
-                        'ordinal_position': col.ordinal_position
-                    }
-                    for col in sorted(columns, key=lambda x: x.ordinal_position)
-                ],
-                'primary_keys': sorted(primary_keys),
-                'foreign_keys': sorted([
-                    f"{fk['column_name']}->{fk['referenced_table']}.{fk['referenced_column']}"
+            # Hash sorted field records without building a JSON document. Unit
+            # (\x1f) and record (\x1e) separators plus a marker per section keep
+            # the encoding unambiguous; all sections are joined and encoded once,
+            # so the hasher is fed one contiguous buffer in a single call
+            return _schema_digest(''.join((
+                'C',
+                *(f"{col.name}\x1f{col.data_type}\x1f{col.is_nullable}\x1f{col.max_length}\x1f"
+                  f"{col.default_value}\x1f{col.ordinal_position}\x1e"
+                  for col in sorted(columns, key=lambda x: x.ordinal_position)),
+                'P',
+                *(f"{pk}\x1e" for pk in sorted(primary_keys)),
+                'F',
+                *sorted(
+                    f"{fk['column_name']}\x1f{fk['referenced_table']}\x1f{fk['referenced_column']}\x1e"
                     for fk in foreign_keys
-                ]),
-                'indexes': sorted([
-                    f"{idx['index_name']}:{idx['column_name']}:{idx.get('is_unique', False)}"
+                ),
+                'I',
+                *sorted(
+                    f"{idx['index_name']}\x1f{idx['column_name']}\x1f{idx.get('is_unique', False)}\x1e"
                     for idx in indexes
-                ])
-            }
-            
-            # Create hash
-            schema_str = json.dumps(schema_data, sort_keys=True)
-            return hashlib.md5(schema_str.encode()).hexdigest()
-            
+                )
+            )).encode())
+        
         except Exception as e:
             self.logger.warning(f"Error computing schema hash for {table_name}: {e}")
             return ""
 
 
 class MemoryProfileCache(ProfileCache):
-    """In-memory cache for table profiles."""
+    """
+    In-memory cache for table profiles, bounded by size.
+    
+    Each profile is sized by its pickled length once, when cached; the least
+    recently used profiles are evicted to stay within max_size_mb.
+    """
     
     def __init__(self, max_size_mb: int = 256):
-        self.cache: Dict[str, TableProfile] = {}
+        # Profiles and their sizes in bytes, least recently used first
+        self.cache: 'OrderedDict[str, Tuple[TableProfile, int]]' = OrderedDict()
         self.max_size_mb = max_size_mb
+        self._max_bytes = max_size_mb * 1024 * 1024
+        self._total_bytes = 0
         self.logger = logging.getLogger(self.__class__.__name__)
     
     def get_cached_profile(self, table_name: str) -> Optional[TableProfile]:
         """Get cached profile for a table."""
-        return self.cache.get(table_name)
+        entry = self.cache.get(table_name)
+        if entry is None:
+            return None
+        self.cache.move_to_end(table_name)
+        return entry[0]
     
     def cache_profile(self, table_name: str, profile: TableProfile) -> None:
-        """Cache a table profile."""
-        # Simple caching - in production you'd implement size limits and LRU eviction
-        self.cache[table_name] = profile
+        """Cache a table profile, evicting least recently used profiles when full."""
+        try:
+            size = len(pickle.dumps(profile, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            self.logger.debug(f"Profile for table {table_name} cannot be sized, not caching: {e}")
+            return
+        
+        previous = self.cache.pop(table_name, None)
+        if previous is not None:
+            self._total_bytes -= previous[1]
+        
+        if size > self._max_bytes:
+            self.logger.debug(f"Profile for table {table_name} exceeds the cache size, not caching")
+            return
+        
+        while self.cache and self._total_bytes + size > self._max_bytes:
+            evicted_name, (_, evicted_size) = self.cache.popitem(last=False)
+            self._total_bytes -= evicted_size
+            self.logger.debug(f"Evicted cached profile for table: {evicted_name}")
+        
+        self.cache[table_name] = (profile, size)
+        self._total_bytes += size
         self.logger.debug(f"Cached profile for table: {table_name}")
     
     def clear_cache(self) -> None:
         """Clear all cached profiles."""
         self.cache.clear()
+        self._total_bytes = 0
         self.logger.info("Profile cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -341,7 +572,93 @@ class MemoryProfileCache(ProfileCache):
         return {
             'cached_tables': len(self.cache),
             'max_size_mb': self.max_size_mb,
-            'estimated_size_mb': len(self.cache) * 0.1  # Rough estimate
+            'estimated_size_mb': round(self._total_bytes / (1024 * 1024), 3)
+        }
+
+
+class FileProfileCache(ProfileCache):
+    """
+    On-disk cache for table profiles that survives restarts.
+    
+    Profiles are pickled to one file per table and schema hash, so a profile
+    is only found again while its table keeps the schema it was profiled
+    with. Only point it at a directory this process trusts, since cached
+    files are unpickled.
+    """
+    
+    def __init__(self, directory: str, schema_hash: Callable[[str], str]):
+        """
+        Initialize the profile cache.
+        
+        Args:
+            directory: Directory holding the cached profiles (created on demand)
+            schema_hash: Returns the current schema hash of a table, e.g.
+                DatabaseChangeDetector.get_schema_hash
+        """
+        self.directory = Path(directory)
+        self.schema_hash = schema_hash
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    def _table_prefix(self, table_name: str) -> str:
+        """File name prefix shared by all cached profiles of a table."""
+        return _schema_digest(table_name.encode())
+    
+    def _profile_path(self, table_name: str) -> Optional[Path]:
+        """Get the file of a table's profile for its current schema (None without a hash)."""
+        schema_hash = self.schema_hash(table_name)
+        if not schema_hash:
+            return None
+        return self.directory / f"{self._table_prefix(table_name)}-{schema_hash}.pkl"
+    
+    def get_cached_profile(self, table_name: str) -> Optional[TableProfile]:
+        """Get cached profile for a table."""
+        path = self._profile_path(table_name)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return pickle.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Error reading cached profile for {table_name}: {e}")
+            return None
+    
+    def cache_profile(self, table_name: str, profile: TableProfile) -> None:
+        """Cache a table profile, replacing profiles cached for older schemas of the table."""
+        path = self._profile_path(table_name)
+        if path is None:
+            return
+        
+        temp_path = path.with_suffix('.tmp')
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(pickle.dumps(profile, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(temp_path, path)
+            
+            for stale_path in self.directory.glob(f"{self._table_prefix(table_name)}-*.pkl"):
+                if stale_path != path:
+                    stale_path.unlink(missing_ok=True)
+            
+            self.logger.debug(f"Cached profile for table: {table_name}")
+        except Exception as e:
+            temp_path.unlink(missing_ok=True)
+            self.logger.warning(f"Error caching profile for {table_name}: {e}")
+    
+    def clear_cache(self) -> None:
+        """Clear all cached profiles."""
+        for path in self.directory.glob('*.pkl'):
+            path.unlink(missing_ok=True)
+        self.logger.info("Profile cache cleared")
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        sizes = [path.stat().st_size for path in self.directory.glob('*.pkl')]
+        return {
+            'cached_tables': len(sizes),
+            'directory': str(self.directory),
+            'size_mb': round(sum(sizes) / (1024 * 1024), 3)
         }
 
 
@@ -363,12 +680,24 @@ class IncrementalProfilingManager(IncrementalProfiler):
         """Perform incremental profiling using a base profiler."""
         self.logger.info(f"Starting incremental profiling for database: {config.database_name}")
         
+        # Change detection and the state update query the same metadata per table
+        with self._metadata_session():
+            return self._profile_incremental(base_profiler, config)
+    
+    def _metadata_session(self):
+        """Get a context in which the change detector's metadata queries are cached."""
+        metadata_extractor = getattr(self.change_detector, 'metadata_extractor', None)
+        caching_schema = getattr(metadata_extractor, 'caching_schema', None)
+        return caching_schema() if caching_schema is not None else nullcontext()
+    
+    def _profile_incremental(self, base_profiler: SchemaProfiler, config: ProfilerConfig) -> SchemaProfile:
+        """Run an incremental profile, falling back to a full profile on errors."""
         try:
             # Load previous state
             previous_state = self.state_manager.load_state()
             
-            # Get current table information
-            current_tables = base_profiler.get_tables_info()
+            # Get current table information (incremental runs may reuse a cached list)
+            current_tables = base_profiler.get_tables_info(config)
             if not current_tables:
                 self.logger.warning("No tables found to profile")
                 return SchemaProfile(
@@ -377,6 +706,9 @@ class IncrementalProfilingManager(IncrementalProfiler):
                     database_type="unknown"
                 )
             
+            # Table information by name, shared by the steps below
+            current_by_name = {table['table_name']: table for table in current_tables}
+            
             # Identify changed tables
             tables_to_profile = self.change_detector.identify_changed_tables(
                 current_tables, previous_state, config
@@ -384,21 +716,26 @@ class IncrementalProfilingManager(IncrementalProfiler):
             
             if not tables_to_profile:
                 self.logger.info("No tables have changed since last profiling")
-                return self._load_cached_schema_profile(config, current_tables)
+                return self._load_cached_schema_profile(config, current_by_name)
+            
+            # Hash and count all tables in bulk up front: on a full run change
+            # detection returned before hashing, and caching profiles and the
+            # state update both need the hashes
+            self.change_detector.prime(list(current_by_name), max_workers=config.max_workers)
             
             # Profile changed tables only
             self.logger.info(f"Profiling {len(tables_to_profile)} changed tables")
             changed_profiles = self._profile_changed_tables(base_profiler, tables_to_profile, config)
             
             # Merge with cached profiles
-            complete_schema = self._merge_profiles(config, current_tables, changed_profiles, previous_state)
+            complete_schema = self._merge_profiles(config, current_by_name, changed_profiles, previous_state)
             
             # Update state
-            self._update_state(config, current_tables, tables_to_profile)
+            self._update_state(config, current_by_name, tables_to_profile, previous_state)
             
             self.logger.info(f"Incremental profiling completed: {complete_schema.total_tables} tables, {complete_schema.total_columns} columns")
             return complete_schema
-            
+        
         except Exception as e:
             self.logger.error(f"Error during incremental profiling: {e}")
             # Fall back to full profiling
@@ -420,14 +757,15 @@ class IncrementalProfilingManager(IncrementalProfiler):
                 
                 # Cache the new profile
                 self.profile_cache.cache_profile(table_name, profile)
-                
+            
             except Exception as e:
                 self.logger.error(f"Error profiling changed table {table_name}: {e}")
                 continue
         
         return profiles
     
-    def _load_cached_schema_profile(self, config: ProfilerConfig, current_tables: List[Dict[str, Any]]) -> SchemaProfile:
+    def _load_cached_schema_profile(self, config: ProfilerConfig,
+                                    current_by_name: Dict[str, Dict[str, Any]]) -> SchemaProfile:
         """Load complete schema profile from cache."""
         # This is a placeholder - in a full implementation, you'd reconstruct
         # the complete schema from cached table profiles
@@ -437,12 +775,11 @@ class IncrementalProfilingManager(IncrementalProfiler):
             database_name=config.database_name,
             schema_name=config.schema_name,
             database_type="unknown",
-            total_tables=len(current_tables)
+            total_tables=len(current_by_name)
         )
         
         # Load cached profiles
-        for table_info in current_tables:
-            table_name = table_info['table_name']
+        for table_name in current_by_name:
             cached_profile = self.profile_cache.get_cached_profile(table_name)
             if cached_profile:
                 schema_profile.tables.append(cached_profile)
@@ -452,7 +789,7 @@ class IncrementalProfilingManager(IncrementalProfiler):
     
     def _merge_profiles(self, 
                        config: ProfilerConfig,
-                       current_tables: List[Dict[str, Any]],
+                       current_by_name: Dict[str, Dict[str, Any]],
                        changed_profiles: List[TableProfile],
                        previous_state: Optional[Dict[str, Any]]) -> SchemaProfile:
         """Merge new profiles with cached profiles."""
@@ -460,7 +797,7 @@ class IncrementalProfilingManager(IncrementalProfiler):
             database_name=config.database_name,
             schema_name=config.schema_name,
             database_type="unknown",
-            total_tables=len(current_tables)
+            total_tables=len(current_by_name)
         )
         
         changed_table_names = {p.name for p in changed_profiles}
@@ -469,8 +806,7 @@ class IncrementalProfilingManager(IncrementalProfiler):
         schema_profile.tables.extend(changed_profiles)
         
         # Add cached profiles for unchanged tables
-        for table_info in current_tables:
-            table_name = table_info['table_name']
+        for table_name in current_by_name:
             if table_name not in changed_table_names:
                 cached_profile = self.profile_cache.get_cached_profile(table_name)
                 if cached_profile:
@@ -486,59 +822,65 @@ class IncrementalProfilingManager(IncrementalProfiler):
     
     def _update_state(self, 
                      config: ProfilerConfig,
-                     current_tables: List[Dict[str, Any]],
-                     profiled_tables: List[Dict[str, Any]]) -> None:
-        """Update the incremental profiling state."""
+                     current_by_name: Dict[str, Dict[str, Any]],
+                     profiled_tables: List[Dict[str, Any]],
+                     previous_state_data: Optional[Dict[str, Any]] = None) -> None:
+        """Update the incremental profiling state, starting from the state loaded for this run."""
         try:
-            # Load existing state or create new
-            existing_state_data = self.state_manager.load_state()
+            # One timestamp for the whole update, formatted once
+            now = datetime.now().isoformat()
             
-            if existing_state_data:
-                state = IncrementalState.from_dict(existing_state_data)
+            # Reuse the state loaded at the start of the run or create new
+            if previous_state_data:
+                state = IncrementalState.from_dict(previous_state_data)
             else:
                 state = IncrementalState(
                     database_name=config.database_name,
                     schema_name=config.schema_name,
-                    last_profile_timestamp=datetime.now(),
+                    last_profile_timestamp=now,
                     table_states={}
                 )
             
-            # Update timestamp
-            state.last_profile_timestamp = datetime.now()
+            # Update timestamp; hashes below are written with the current algorithm
+            state.last_profile_timestamp = now
+            state.profile_version = _STATE_VERSION
+            state.overall_digest = getattr(self.change_detector, 'schema_digest', None)
             
-            # Update table states
+            # Update table states, hashing and counting tables change detection
+            # has not seen yet in bulk
             profiled_table_names = {t['table_name'] for t in profiled_tables}
+            self.change_detector.prime(list(current_by_name), max_workers=config.max_workers)
             
-            for table_info in current_tables:
-                table_name = table_info['table_name']
-                
+            for table_name in current_by_name:
                 # Compute current state
-                schema_hash = self.change_detector._compute_table_schema_hash(table_name)
-                row_count = self.change_detector.metadata_extractor.get_row_count(table_name)
+                schema_hash = self.change_detector.get_schema_hash(table_name)
+                row_count = self.change_detector.get_row_count(table_name)
                 
                 # Check if this table was profiled in this run
-                was_profiled = table_name in profiled_table_names
+                if table_name in profiled_table_names:
+                    last_modified = now
+                else:
+                    previous_table_state = state.table_states.get(table_name)
+                    last_modified = previous_table_state.last_modified if previous_table_state else None
                 
                 state.table_states[table_name] = TableChangeInfo(
                     table_name=table_name,
                     schema_hash=schema_hash,
                     row_count=row_count,
-                    last_modified=datetime.now() if was_profiled else 
-                                 state.table_states.get(table_name, TableChangeInfo(table_name, "", 0)).last_modified,
+                    last_modified=last_modified,
                     structure_changed=False,  # Reset after profiling
                     data_changed=False       # Reset after profiling
                 )
             
             # Remove state for tables that no longer exist
-            current_table_names = {table['table_name'] for table in current_tables}
-            tables_to_remove = set(state.table_states.keys()) - current_table_names
+            tables_to_remove = state.table_states.keys() - current_by_name.keys()
             for table_name in tables_to_remove:
                 del state.table_states[table_name]
                 self.logger.info(f"Removed state for deleted table: {table_name}")
             
             # Save updated state
             self.state_manager.save_state(state.to_dict())
-            
+        
         except Exception as e:
             self.logger.error(f"Error updating incremental state: {e}")
             # Don't fail the whole operation for state update errors
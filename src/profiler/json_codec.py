@@ -0,0 +1,107 @@
+"""
+JSON Codec
+
+This module provides the JSON encoding and decoding used for profiler files
+(configurations and exported schema profiles). It uses orjson when it is
+installed and falls back to the standard library json module otherwise.
+
+Both backends write the same documents, with one exception: orjson cannot
+write NaN or infinite floats and writes them as null, while the standard
+library writes the non-standard NaN/Infinity tokens.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+# orjson writes datetimes as ISO 8601 natively; passing them through to the
+# default encoder keeps str()'s "2024-01-02 03:04:05" form, as with json
+_ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                   if orjson is not None else 0)
+
+
+def encode_default(obj: Any) -> Any:
+    """
+    Fallback encoder for objects JSON cannot represent.
+    
+    Dataclass instances become a dict of their fields (shallow, unlike
+    dataclasses.asdict, which deep-copies the whole structure first); any
+    other object is written as its string form.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    return str(obj)
+
+
+def dumps_json(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON bytes.
+    
+    Args:
+        data: Data to serialize
+        default: Called for objects JSON cannot represent (e.g. str)
+    
+    Returns:
+        JSON document indented by two spaces, non-ASCII characters kept as is
+        (NaN and infinite floats become null with orjson, see module docstring)
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=default, option=_ORJSON_OPTIONS)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=default).encode('utf-8')
+
+
+def iter_json_chunks(data: Dict[str, Any], stream_key: str,
+                     default: Optional[Callable[[Any], Any]] = None) -> Iterator[bytes]:
+    """
+    Serialize a dict like dumps_json, encoding one list value item by item.
+    
+    Joining the chunks gives exactly dumps_json(data, default), but only one
+    item of the streamed list is held encoded at a time, so large documents
+    can be written out without building them in memory first.
+    
+    Args:
+        data: Top-level dictionary to serialize
+        stream_key: Key of the list whose items are encoded one at a time
+        default: Called for objects JSON cannot represent (e.g. str)
+    
+    Yields:
+        Consecutive pieces of the JSON document
+    """
+    items = data[stream_key]
+    head = dict(data)
+    head[stream_key] = []
+    document = dumps_json(head, default)
+    if not items:
+        yield document
+        return
+    
+    # JSON strings escape newlines, so this line only occurs for the top-level key
+    marker = b'\n  ' + dumps_json(stream_key) + b': ['
+    before, after = document.split(marker + b']', 1)
+    
+    yield before + marker
+    separator = b'\n    '
+    for item in items:
+        yield separator + dumps_json(item, default).replace(b'\n', b'\n    ')
+        separator = b',\n    '
+    yield b'\n  ]' + after
+
+
+def loads_json(data: bytes) -> Any:
+    """
+    Parse JSON bytes.
+    
+    Args:
+        data: UTF-8 JSON document
+    
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -40,7 +40,7 @@ class MetadataExtractor(DatabaseQuery, MetadataQueryMixin):
             db_type: Database type (mysql, postgresql, mssql)
         """
         super().__init__(connector, database_name, schema_name, db_type)
-        self.dialect = DatabaseDialect(self.db_type)
+        self.dialect = DatabaseDialect.get(self.db_type)
     
     def get_supported_operations(self) -> List[str]:
         """Get list of supported metadata extraction operations."""
@@ -324,12 +324,16 @@ class MetadataExtractor(DatabaseQuery, MetadataQueryMixin):
         
         return columns
     
-    def get_complete_table_metadata(self, table_name: str) -> Dict[str, Union[str, int, List[ColumnProfile], List[str], List[Dict[str, Any]]]]:
+    def get_complete_table_metadata(self, table_name: str, *, include_sample_data: bool = True,
+                                    sample_limit: int = 5) -> Dict[str, Union[str, int, List[ColumnProfile], List[str], List[Dict[str, Any]]]]:
         """
         Get complete metadata for a single table including all available information.
         
         Args:
             table_name: Name of the table
+            include_sample_data: Whether to query sample rows; when False the
+                sample query is skipped and sample_data is empty
+            sample_limit: Number of sample rows to retrieve
             
         Returns:
             Dictionary containing all metadata for the table with specific types:
@@ -349,7 +353,7 @@ class MetadataExtractor(DatabaseQuery, MetadataQueryMixin):
             'primary_keys': self.get_primary_keys(table_name),
             'foreign_keys': self.get_foreign_keys(table_name),
             'indexes': self.get_indexes(table_name),
-            'sample_data': self.get_sample_data(table_name),
+            'sample_data': self.get_sample_data(table_name, sample_limit) if include_sample_data else [],
             'row_count': self.get_row_count(table_name)
         }
         
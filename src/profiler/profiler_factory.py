@@ -6,16 +6,18 @@ with proper dependency injection and clean architecture.
 """
 
 import logging
+from pathlib import Path
 from typing import Optional
 
 from .interfaces import ProfilerFactory, SchemaProfiler, IncrementalProfiler, TableProcessor, ProfilingStrategy
 from .config import ProfilerConfig
-from .core_profiler import CoreSchemaProfiler
+from .core_profiler import CoreSchemaProfiler, detect_database_type
 from .processing_strategies import ProcessingStrategyFactory, PerformanceMonitor, ResourceManager
 from .incremental_manager import (
     IncrementalProfilingManager, 
     FileStateManager, 
     DatabaseChangeDetector, 
+    FileProfileCache,
     MemoryProfileCache
 )
 from .metadata_extractor import MetadataExtractor
@@ -74,8 +76,16 @@ class DefaultProfilerFactory(ProfilerFactory):
         )
         change_detector = DatabaseChangeDetector(metadata_extractor)
         
-        # Create profile cache
-        profile_cache = MemoryProfileCache(max_size_mb=256)
+        # Create profile cache; persisted profiles next to the state file let
+        # a new process reuse the profiles of unchanged tables
+        incremental_config = config.get_incremental_config()
+        if incremental_config.persist_profiles:
+            profile_cache = FileProfileCache(
+                Path(config.incremental_state_path).with_suffix('.profiles'),
+                change_detector.get_schema_hash
+            )
+        else:
+            profile_cache = MemoryProfileCache(max_size_mb=incremental_config.max_cache_size_mb)
         
         return IncrementalProfilingManager(state_manager, change_detector, profile_cache)
     
@@ -89,15 +99,7 @@ class DefaultProfilerFactory(ProfilerFactory):
     
     def _detect_database_type(self) -> str:
         """Detect database type from connector."""
-        connector_class = self.connector.__class__.__name__
-        if 'MySQL' in connector_class:
-            return 'mysql'
-        elif 'PostgreSQL' in connector_class:
-            return 'postgresql'
-        elif 'MSSQL' in connector_class:
-            return 'mssql'
-        else:
-            return 'unknown'
+        return detect_database_type(self.connector.__class__)
 
 
 class OrchestatingProfiler(SchemaProfiler):
@@ -128,7 +130,7 @@ class OrchestatingProfiler(SchemaProfiler):
         
         try:
             # Get table information
-            tables_info = self.core_profiler.get_tables_info()
+            tables_info = self.core_profiler.get_tables_info(config)
             if not tables_info:
                 self.logger.warning("No tables found to profile")
                 return SchemaProfile(
@@ -140,8 +142,14 @@ class OrchestatingProfiler(SchemaProfiler):
             self.logger.info(f"Found {len(tables_info)} tables to profile")
             self.logger.info(f"Using {self.table_processor.get_strategy_name()} processing strategy")
             
-            # Process tables using the configured strategy
-            table_profiles = self.table_processor.process_tables(tables_info, config)
+            # Process tables using the configured strategy, with metadata fetched schema-wide
+            table_names = [table_info['table_name'] for table_info in tables_info]
+            with self.core_profiler.prefetched_metadata(table_names):
+                table_profiles = self.table_processor.process_tables(tables_info, config)
+            
+            # A table without columns was most likely dropped since the list was cached
+            if any(not table_profile.columns for table_profile in table_profiles):
+                self.core_profiler.invalidate_tables_info_cache(config)
             
             # Create schema profile
             schema_profile = SchemaProfile(
@@ -159,12 +167,12 @@ class OrchestatingProfiler(SchemaProfiler):
             
             # Export if configured
             if config.output_path:
-                self.core_profiler.export_profile(schema_profile, config.output_path)
+                self.core_profiler.export_profile(schema_profile, config.output_path, return_dict=False)
             
             self.logger.info(f"Schema profiling completed: {schema_profile.total_tables} tables, {schema_profile.total_columns} columns")
             
             return schema_profile
-            
+        
         except Exception as e:
             self.logger.error(f"Error during orchestrated schema profiling: {e}")
             raise
@@ -177,9 +185,9 @@ class OrchestatingProfiler(SchemaProfiler):
                     report = self.performance_monitor.get_performance_report()
                     self.logger.info(f"Performance report: {report}")
     
-    def get_tables_info(self) -> list:
-        """Get basic information about all tables."""
-        return self.core_profiler.get_tables_info()
+    def get_tables_info(self, config: Optional[ProfilerConfig] = None) -> list:
+        """Get basic information about all tables (cached for incremental configurations)."""
+        return self.core_profiler.get_tables_info(config)
     
     def profile_table(self, table_name: str, config: ProfilerConfig):
         """Profile a single table."""
@@ -230,7 +238,7 @@ class UnifiedProfiler:
         
         Args:
             custom_config: Optional custom configuration (uses instance config if None)
-            
+        
         Returns:
             Complete schema profile
         """
@@ -247,7 +255,7 @@ class UnifiedProfiler:
         
         Args:
             custom_config: Optional custom configuration
-            
+        
         Returns:
             Complete schema profile
         """
@@ -261,16 +269,16 @@ class UnifiedProfiler:
         Args:
             table_name: Name of the table to profile
             custom_config: Optional custom configuration
-            
+        
         Returns:
             Table profile
         """
         config = custom_config or self.config
         return self.schema_profiler.profile_table(table_name, config)
     
-    def get_tables_info(self):
+    def get_tables_info(self, custom_config: Optional[ProfilerConfig] = None):
         """Get basic information about all tables."""
-        return self.schema_profiler.get_tables_info()
+        return self.schema_profiler.get_tables_info(custom_config or self.config)
     
     def export_profile(self, schema_profile: SchemaProfile, output_path: str):
         """Export schema profile to file."""
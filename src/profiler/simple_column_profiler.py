@@ -25,6 +25,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 from connectors.base_connector import BaseConnector
 from .simple_pattern_recognizer import SimplePatternRecognizer
 from .database_query import DatabaseQuery
+from .database_dialect import DatabaseDialect
 
 
 @dataclass
@@ -310,8 +311,7 @@ class SimpleColumnProfiler(DatabaseQuery):
     def _get_columns_metadata(self, table_name: str, schema_name: Optional[str]) -> List[Dict[str, Any]]:
         """Get column metadata for a table."""
         
-        from .database_dialect import DatabaseDialect
-        dialect = DatabaseDialect(self.connector.db_type)
+        dialect = DatabaseDialect.get(self.connector.db_type)
         
         query = dialect.get_columns_query()
         params = {'table_name': table_name}
@@ -340,22 +340,19 @@ class SimpleColumnProfiler(DatabaseQuery):
     def _get_primary_key_query(self, table_name: str, schema_name: Optional[str]) -> str:
         """Get database-specific primary key query."""
         
-        from .database_dialect import DatabaseDialect
-        dialect = DatabaseDialect(self.connector.db_type)
+        dialect = DatabaseDialect.get(self.connector.db_type)
         return dialect.get_primary_keys_query()
     
     def _get_foreign_key_query(self, table_name: str, schema_name: Optional[str]) -> str:
         """Get database-specific foreign key query."""
         
-        from .database_dialect import DatabaseDialect
-        dialect = DatabaseDialect(self.connector.db_type)
+        dialect = DatabaseDialect.get(self.connector.db_type)
         return dialect.get_foreign_keys_query()
     
     def _get_index_query(self, table_name: str, schema_name: Optional[str]) -> str:
         """Get database-specific index query."""
         
-        from .database_dialect import DatabaseDialect
-        dialect = DatabaseDialect(self.connector.db_type)
+        dialect = DatabaseDialect.get(self.connector.db_type)
         return dialect.get_indexes_query()
     
     def _get_full_table_name(self, table_name: str, schema_name: Optional[str]) -> str:
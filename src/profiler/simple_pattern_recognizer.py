@@ -8,7 +8,7 @@ focusing only on obvious and easily detectable patterns to eliminate complexity.
 import json
 import re
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, FrozenSet, List, Optional, Sequence, Tuple, Union
 from pathlib import Path
 
 
@@ -30,6 +30,9 @@ class SimplePatternRecognizer:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.patterns: Dict[str, Dict[str, Any]] = {}
         self.compiled_patterns: Dict[str, re.Pattern[str]] = {}
+        self._field_names_lower: Dict[str, FrozenSet[str]] = {}
+        self._wildcards_lower: Dict[str, Tuple[str, ...]] = {}
+        self._valid_values_lower: Dict[str, FrozenSet[str]] = {}
         
         # Simple thresholds
         self.min_match_ratio = 0.8  # 80% of values must match
@@ -63,14 +66,27 @@ class SimplePatternRecognizer:
             self.patterns = {}
     
     def _compile_regex_patterns(self) -> None:
-        """Compile regex patterns for performance."""
+        """Compile regex patterns and lowercase name/value lists for performance."""
         self.compiled_patterns = {}
+        self._field_names_lower = {}
+        self._wildcards_lower = {}
+        self._valid_values_lower = {}
         for pattern_name, pattern_info in self.patterns.items():
             if 'regex' in pattern_info:
                 try:
                     self.compiled_patterns[pattern_name] = re.compile(pattern_info['regex'])
                 except re.error as e:
                     self.logger.warning(f"Invalid regex for {pattern_name}: {e}")
+            self._field_names_lower[pattern_name] = frozenset(
+                name.lower() for name in pattern_info.get('field_names', [])
+            )
+            self._wildcards_lower[pattern_name] = tuple(
+                pattern.lower() for pattern in pattern_info.get('patterns', [])
+            )
+            if 'valid_values' in pattern_info:
+                self._valid_values_lower[pattern_name] = frozenset(
+                    value.lower() for value in pattern_info['valid_values']
+                )
     
     def detect_patterns(self, values: List[Any], field_name: Optional[str] = None) -> List[str]:
         """
@@ -94,47 +110,52 @@ class SimplePatternRecognizer:
             return []
         
         # Test each pattern
+        field_lower = field_name.lower() if field_name else None
         for pattern_name, pattern_info in self.patterns.items():
-            if self._test_pattern(pattern_name, pattern_info, string_values, field_name):
+            if self._test_pattern(pattern_name, pattern_info, string_values, field_lower):
                 detected.append(pattern_name)
         
         # Remove conflicting patterns (keep most specific)
         return self._resolve_conflicts(detected, field_name)
     
+    def detect_patterns_batch(self, items: Sequence[Tuple[Optional[str], List[Any]]]) -> List[List[str]]:
+        """
+        Detect patterns for several fields in one call.
+        
+        Args:
+            items: (field name, values) pairs, e.g. one per column of a table
+            
+        Returns:
+            Detected pattern names per item, in input order
+        """
+        detect = self.detect_patterns
+        return [detect(values, field_name=field_name) for field_name, values in items]
+    
     def _test_pattern(self, pattern_name: str, pattern_info: Dict[str, Any], 
-                     values: List[str], field_name: Optional[str]) -> bool:
-        """Test if a pattern matches the values."""
+                     values: List[str], field_lower: Optional[str]) -> bool:
+        """Test if a pattern matches the values (field name already lowercased)."""
         
-        field_name_match = field_name and self._matches_field_name(field_name, pattern_info)
-        data_match = self._test_data_match(pattern_name, pattern_info, values, threshold=self.min_match_ratio)
+        match_ratio = self._data_match_ratio(pattern_name, values)
+        if match_ratio is None or match_ratio < self.min_match_ratio:
+            return False
         
         # For obvious detection, require BOTH field name AND data match for high confidence
         # OR very strong data match (95%+) without field name for patterns with regex
-        if field_name_match and data_match:
+        if field_lower and self._matches_field_name_lower(pattern_name, field_lower):
             return True
-        elif not field_name_match and data_match and 'regex' in pattern_info:
+        elif 'regex' in pattern_info:
             # Only allow data-only matches for patterns with strong regex validation
-            return self._test_data_match(pattern_name, pattern_info, values, threshold=0.95)
+            return match_ratio >= 0.95
         
         return False
     
-    def _matches_field_name(self, field_name: str, pattern_info: Dict[str, Any]) -> bool:
-        """Check if field name matches pattern expectations."""
-        field_lower = field_name.lower()
-        
-        # Exact field name match
-        if 'field_names' in pattern_info:
-            for expected_name in pattern_info['field_names']:
-                if field_lower == expected_name.lower():
-                    return True
-        
-        # Pattern matching (wildcards)
-        if 'patterns' in pattern_info:
-            for pattern in pattern_info['patterns']:
-                if self._matches_wildcard_pattern(field_lower, pattern.lower()):
-                    return True
+    def _matches_field_name_lower(self, pattern_name: str, field_lower: str) -> bool:
+        """Check a lowercased field name against a pattern's precomputed names and wildcards."""
+        if field_lower in self._field_names_lower.get(pattern_name, ()):
+            return True
         
-        return False
+        return any(self._matches_wildcard_pattern(field_lower, pattern)
+                   for pattern in self._wildcards_lower.get(pattern_name, ()))
     
     def _matches_wildcard_pattern(self, field_name: str, pattern: str) -> bool:
         """Simple wildcard pattern matching."""
@@ -154,32 +175,30 @@ class SimplePatternRecognizer:
             # exact match
             return field_name == pattern
     
-    def _test_data_match(self, pattern_name: str, pattern_info: Dict[str, Any], 
-                        values: List[str], threshold: float) -> bool:
-        """Test if data values match the pattern."""
-        sample_size = min(len(values), 10)  # Test up to 10 values
-        matches = 0
+    def _data_match_ratio(self, pattern_name: str, values: List[str]) -> Optional[float]:
+        """
+        Get the share of (up to 10) values matching a pattern.
+        
+        Returns:
+            Match ratio, or None if the pattern has no data validation
+        """
+        sample = values[:10]  # Test up to 10 values
         
         # Regex pattern matching
-        if pattern_name in self.compiled_patterns:
-            regex = self.compiled_patterns[pattern_name]
-            for value in values[:sample_size]:
-                if regex.match(value):
-                    matches += 1
+        regex = self.compiled_patterns.get(pattern_name)
+        if regex is not None:
+            matches = sum(1 for value in sample if regex.match(value))
         
         # Valid values matching
-        elif 'valid_values' in pattern_info:
-            valid_values_lower = [v.lower() for v in pattern_info['valid_values']]
-            for value in values[:sample_size]:
-                if value.lower() in valid_values_lower:
-                    matches += 1
+        elif pattern_name in self._valid_values_lower:
+            valid_values_lower = self._valid_values_lower[pattern_name]
+            matches = sum(1 for value in sample if value.lower() in valid_values_lower)
         
         # No data validation available - rely on field name only
         else:
-            return False
+            return None
         
-        match_ratio = matches / sample_size
-        return match_ratio >= threshold
+        return matches / len(sample)
     
     def get_pattern_info(self, pattern_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific pattern."""
@@ -0,0 +1,187 @@
+"""
+Test Adaptive Pool
+
+This script tests latency-aware sizing of the connection pool and its enforcement on checkout.
+"""
+
+import sys
+import os
+import threading
+import types
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# The connectors package imports every database driver on import; register it
+# without running its __init__ so the driver-independent modules load anywhere
+if 'connectors' not in sys.modules:
+    connectors = types.ModuleType('connectors')
+    connectors.__path__ = [os.path.join(os.path.dirname(__file__), '..', 'src', 'connectors')]
+    sys.modules['connectors'] = connectors
+
+from connectors.adaptive_pool import AdaptivePoolController
+from connectors.base_connector import BaseConnector, ConnectionConfig, ConnectionError
+
+
+class FakeConnector(BaseConnector):
+    """Connector handing out fake connections and recording which were closed."""
+    
+    def __init__(self, max_connections=4, adaptive_pool=False, connection_timeout=30):
+        # The background controller never samples during a test
+        super().__init__(ConnectionConfig(host='localhost', port=0, username='user', password='secret',
+                                          database='db', max_connections=max_connections,
+                                          adaptive_pool=adaptive_pool, connection_timeout=connection_timeout,
+                                          latency_sample_interval=3600))
+        self.created = 0
+        self.closed = []
+        self.latency_ms = 10.0
+    
+    def _create_connection(self):
+        self.created += 1
+        return f"conn-{self.created}"
+    
+    def _test_connection(self, connection):
+        return True
+    
+    def _close_connection(self, connection):
+        self.closed.append(connection)
+    
+    def _execute_query(self, connection, query, params=None):
+        return []
+    
+    def measure_latency(self):
+        return self.latency_ms
+
+
+def make_controller(connector, **kwargs):
+    """Create a controller with a short window and default thresholds."""
+    kwargs.setdefault('window_size', 5)
+    return AdaptivePoolController(connector, min_size=2, max_size=8, **kwargs)
+
+
+def test_latency_percentiles_use_recent_window():
+    """Percentiles are nearest-rank over the most recent samples only."""
+    controller = make_controller(FakeConnector())
+    assert controller.get_latency_percentile(95) is None
+    
+    for latency in (100, 1, 2, 3, 4, 5):
+        controller.record_latency(latency)
+    assert controller.get_latency_percentile(50) == 3
+    assert controller.get_latency_percentile(95) == 5
+    assert controller.get_latency_percentile(0) == 1
+    assert controller.get_stats()['samples'] == 5
+
+
+def test_evaluate_grows_shrinks_and_clamps():
+    """A saturated, slow pool grows, an idle pool shrinks, and sizes stay within bounds."""
+    controller = make_controller(FakeConnector(), latency_threshold_ms=50)
+    controller.record_latency(80)
+    
+    assert controller.evaluate(active_connections=4, current_size=4) == 5
+    assert controller.evaluate(active_connections=8, current_size=7) == 8
+    assert controller.evaluate(active_connections=2, current_size=4) == 4
+    assert controller.evaluate(active_connections=0, current_size=4) == 3
+    assert controller.evaluate(active_connections=0, current_size=2) == 2
+    
+    # Saturation alone does not grow the pool while latency is low
+    fast = make_controller(FakeConnector(), latency_threshold_ms=50)
+    fast.record_latency(10)
+    assert fast.evaluate(active_connections=4, current_size=4) == 4
+    
+    try:
+        AdaptivePoolController(FakeConnector(), min_size=4, max_size=2)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_sample_and_adjust_resizes_connector():
+    """Sampling grows a busy connector's pool size limit and shrinks an idle one."""
+    connector = FakeConnector(max_connections=4)
+    connector.connect()
+    held = [connector.get_connection() for _ in range(4)]
+    
+    controller = make_controller(connector, latency_threshold_ms=50)
+    connector.latency_ms = 80.0
+    assert controller.sample_and_adjust() == 5
+    assert connector.get_pool_status()['pool_size_limit'] == 5
+    
+    for conn in held:
+        connector.return_connection(conn)
+    assert controller.sample_and_adjust() == 3
+    assert connector.get_pool_status()['pool_size_limit'] == 3
+
+
+def test_adaptive_limit_caps_checkouts():
+    """Adaptive pools hand out at most limit connections; growing the limit admits waiting callers."""
+    connector = FakeConnector(max_connections=2, adaptive_pool=True, connection_timeout=5)
+    connector.connect()
+    try:
+        held = [connector.get_connection() for _ in range(2)]
+        
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(connector.get_connection()))
+        waiter.start()
+        waiter.join(0.05)
+        assert waiter.is_alive() and connector.get_pool_status()['active_connections'] == 2
+        
+        connector.resize_pool(3)
+        waiter.join(5)
+        assert acquired and connector.get_pool_status()['active_connections'] == 3
+        
+        # A returned connection is handed to the next waiting caller
+        waiter = threading.Thread(target=lambda: acquired.append(connector.get_connection()))
+        waiter.start()
+        waiter.join(0.05)
+        assert waiter.is_alive()
+        connector.return_connection(held.pop())
+        waiter.join(5)
+        assert len(acquired) == 2 and connector.get_pool_status()['active_connections'] == 3
+    finally:
+        connector.disconnect()
+    
+    # Callers give up after the connection timeout
+    connector = FakeConnector(max_connections=1, adaptive_pool=True, connection_timeout=0.05)
+    connector.connect()
+    try:
+        connector.get_connection()
+        try:
+            connector.get_connection()
+            assert False, "expected ConnectionError"
+        except ConnectionError:
+            pass
+    finally:
+        connector.disconnect()
+
+
+def test_resize_pool_closes_idle_connections_above_limit():
+    """Shrinking closes surplus idle connections; without adaptive sizing checkouts are not capped."""
+    connector = FakeConnector(max_connections=4)
+    connector.connect()
+    held = [connector.get_connection() for _ in range(6)]
+    assert connector.get_pool_status()['active_connections'] == 6
+    
+    for conn in held:
+        connector.return_connection(conn)
+    status = connector.get_pool_status()
+    assert status['pool_size'] == 4 and status['active_connections'] == 0
+    assert connector.closed == ['conn-1', 'conn-6', 'conn-7']
+    
+    connector.resize_pool(2)
+    assert connector.get_pool_status()['pool_size'] == 2
+    assert connector.closed[3:] == ['conn-2', 'conn-3']
+    
+    try:
+        connector.resize_pool(0)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_latency_percentiles_use_recent_window()
+    test_evaluate_grows_shrinks_and_clamps()
+    test_sample_and_adjust_resizes_connector()
+    test_adaptive_limit_caps_checkouts()
+    test_resize_pool_closes_idle_connections_above_limit()
+    print("Adaptive pool tests passed")
@@ -0,0 +1,243 @@
+"""
+Test Column Enrichment
+
+This script tests the clean column enricher and its precompiled rule matching.
+"""
+
+import sys
+import os
+from dataclasses import fields
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from features_enrichment.config_loader import EnrichmentConfigLoader
+from features_enrichment import clean_column_enricher
+from features_enrichment.clean_column_enricher import CleanColumnEnricher, CleanEnrichedColumn
+from features_enrichment.rule_matching import (
+    compile_substring_pattern, compile_domain_rules, build_field_automaton, IndicatorAutomaton
+)
+
+
+def get_sample_summary():
+    """Get a small minimal column summary."""
+    return {
+        "table": "patients",
+        "columns": [
+            {"name": "patient_id", "type": "bigint", "nullable": False, "key_type": "PK"},
+            {"name": "provider_id", "type": "int", "nullable": True, "key_type": "FK"},
+            {"name": "Email_Address", "type": "varchar", "nullable": True, "key_type": None},
+            {"name": "notes", "type": "text", "nullable": True, "key_type": None}
+        ]
+    }
+
+
+def test_compiled_pattern_matches_substring_scan():
+    """Compiled alternations must agree with the any(... in ...) scan they replace."""
+    patterns = ["Patient", "pt_id", "mrn", "a.b"]
+    regex = compile_substring_pattern(patterns)
+    
+    for name in ["patient_id", "PT_ID", "xmrnx", "a.b", "axb", "status", ""]:
+        expected = any(p.lower() in name.lower() for p in patterns)
+        assert bool(regex.search(name.lower())) == expected, name
+    
+    assert compile_substring_pattern([]) is None
+
+
+def test_rule_matchers_handle_missing_pattern_groups():
+    """Specialized matchers treat an empty pattern list as no constraint."""
+    rules = compile_domain_rules({
+        "both": {"field_name_patterns": ["id"], "data_type_patterns": ["int"]},
+        "field_only": {"field_name_patterns": ["id"]},
+        "type_only": {"data_type_patterns": ["int"]},
+        "none": {}
+    })
+    matched = {rule.name for rule in rules if rule.matcher("patient_id", "varchar")}
+    assert matched == {"field_only", "none"}
+    matched = {rule.name for rule in rules if rule.matcher("status", "bigint")}
+    assert matched == {"type_only", "none"}
+    matched = {rule.name for rule in rules if rule.matcher("patient_id", "bigint")}
+    assert matched == {"both", "field_only", "type_only", "none"}
+
+
+def test_field_automaton_agrees_with_field_patterns():
+    """The name scan must hit exactly the rules whose field pattern matches."""
+    domains = {
+        "a": compile_domain_rules({"pid": {"field_name_patterns": ["Patient", "pt_id"]},
+                                   "any": {"data_type_patterns": ["int"]}}),
+        "b": compile_domain_rules({"tient": {"field_name_patterns": ["tient"]}})
+    }
+    automaton = build_field_automaton(domains)
+    
+    for name in ["outpatient_id", "pt_id", "status", "tien"]:
+        expected = {
+            (domain, index)
+            for domain, rules in domains.items()
+            for index, rule in enumerate(rules)
+            if rule.field_re is not None and rule.field_re.search(name)
+        }
+        assert automaton.find(name) == expected, name
+
+
+def test_indicator_automaton_finds_overlapping_indicators():
+    """The automaton must report every indicator contained in a name."""
+    automaton = IndicatorAutomaton()
+    indicators = {"patient": 0, "pt": 1, "tient": 2, "dept": 3, "id": 4}
+    for indicator, payload in indicators.items():
+        automaton.add(indicator, payload)
+    automaton.build()
+    
+    for name in ["patient_id", "dept_pt", "outpatient", "status", "ptdeptid"]:
+        expected = {payload for indicator, payload in indicators.items() if indicator in name}
+        assert automaton.find(name) == expected, name
+
+
+def test_clean_enrichment():
+    """Test key phrase extraction and entity classification."""
+    enricher = CleanColumnEnricher()
+    result = enricher.enrich_column_summary(get_sample_summary())
+    columns = {col['name']: col for col in result['enriched_columns']}
+    
+    assert result['total_columns'] == 4
+    assert columns['patient_id']['entity_type'] == 'PATIENT'
+    assert columns['patient_id']['entity_confidence'] == 1.0
+    assert 'patient identifier' in columns['patient_id']['key_phrases']
+    assert columns['Email_Address']['entity_type'] == 'EMAIL_ADDRESS'
+    assert columns['provider_id']['full_identifier'] == 'patients.provider_id'
+    assert columns['notes']['entity_type'] is None
+    assert list(columns['notes']) == [f.name for f in fields(CleanEnrichedColumn)]
+    
+    summary = result['enrichment_summary']
+    assert summary['total_columns'] == 4
+    assert summary['columns_with_entity_types'] == 3
+
+
+
+def test_repeated_column_signatures_are_cached():
+    """Repeated column signatures reuse cached results without sharing lists."""
+    enricher = CleanColumnEnricher()
+    column = {"name": "patient_id", "type": "bigint", "nullable": False, "key_type": "PK"}
+    
+    first = enricher.enrich_single_column(column, "patients")
+    second = enricher.enrich_single_column(column, "visits")
+    
+    assert enricher._enrich_signature.cache_info().hits == 1
+    assert first.key_phrases == second.key_phrases
+    assert first.key_phrases is not second.key_phrases
+    assert second.full_identifier == "visits.patient_id"
+
+
+def test_score_table_matches_direct_scoring():
+    """Precomputed scores and pruning must pick what scoring every entity picks."""
+    enricher = CleanColumnEnricher()
+    
+    for name in ["patient_email", "provider_id", "created_at", "status"]:
+        for data_type in ["VARCHAR", "text", "bigint", "timestamp", "decimal", ""]:
+            for key_type in ["PK", "FK", "UK", None]:
+                column = CleanEnrichedColumn(name=name, type=data_type,
+                                             nullable=True, key_type=key_type)
+                name_matches = enricher._indicator_automaton.find(column.name.lower())
+                best_confidence, best_type = 0.0, None
+                for index, entity in enumerate(enricher._compiled_entities):
+                    confidence = enricher._calculate_clean_confidence(column, entity, index in name_matches)
+                    if confidence > best_confidence:
+                        best_confidence, best_type = confidence, entity.config.get('type')
+                
+                result = enricher.classify_clean_entity_type(column)
+                assert result['confidence'] == best_confidence, (name, data_type, key_type)
+                assert result['entity_type'] == (best_type if best_confidence >= 0.4 else None)
+
+
+def test_configs_are_cached_per_process():
+    """Loaders for the same directory share parsed configs until cleared."""
+    first = EnrichmentConfigLoader().load_key_phrases_config()
+    second = EnrichmentConfigLoader().load_key_phrases_config()
+    assert first is second
+    
+    EnrichmentConfigLoader.clear_global_cache()
+    reloaded = EnrichmentConfigLoader().load_key_phrases_config()
+    assert reloaded is not first
+    assert reloaded == first
+    
+    # Config strings are interned so enriched columns share them
+    entity_types = EnrichmentConfigLoader().load_entity_types_config()['entity_types']
+    entity_type = next(iter(next(iter(entity_types.values())).values()))['type']
+    assert entity_type is sys.intern(''.join(entity_type))
+
+
+def test_convenience_function_reuses_enricher():
+    """Repeated convenience calls share one enricher per config path."""
+    clean_column_enricher._get_clean_enricher.cache_clear()
+    first = clean_column_enricher.enrich_clean_column_summary(get_sample_summary())
+    second = clean_column_enricher.enrich_clean_column_summary(get_sample_summary())
+    
+    assert clean_column_enricher._get_clean_enricher.cache_info().misses == 1
+    assert first['enriched_columns'][0]['key_phrases'] is not second['enriched_columns'][0]['key_phrases']
+    
+    # Clearing the config caches drops the shared enrichers built from them
+    EnrichmentConfigLoader.clear_global_cache()
+    assert clean_column_enricher._get_clean_enricher.cache_info().currsize == 0
+    clean_column_enricher.enrich_clean_column_summary(get_sample_summary())
+    EnrichmentConfigLoader().reload_configs()
+    assert clean_column_enricher._get_clean_enricher.cache_info().currsize == 0
+
+
+def test_enrich_schema_matches_per_table_enrichment():
+    """Schema-wide enrichment dedupes signatures and matches per-table results."""
+    enricher = CleanColumnEnricher()
+    visits = {
+        "table": "visits",
+        "columns": [
+            {"name": "patient_id", "type": "bigint", "nullable": False, "key_type": "PK"},
+            {"name": "visit_date", "type": "date", "nullable": False, "key_type": None}
+        ]
+    }
+    
+    result = enricher.enrich_schema([get_sample_summary(), visits])
+    
+    assert result['total_tables'] == 2
+    assert result['total_columns'] == 6
+    assert result['unique_column_signatures'] == 5
+    for table, summary in zip(result['tables'], [get_sample_summary(), visits]):
+        expected = enricher.enrich_column_summary(summary)
+        assert table['table'] == expected['table']
+        assert table['enrichment_timestamp'] == result['enrichment_timestamp']
+        for column, expected_column in zip(table['enriched_columns'], expected['enriched_columns']):
+            expected_column['enrichment_timestamp'] = column['enrichment_timestamp']
+            assert column == expected_column
+
+
+def test_parallel_enrichment_matches_serial():
+    """Process-parallel enrichment returns the serial result in column order."""
+    enricher = CleanColumnEnricher()
+    summary = {
+        "table": "wide_table",
+        "columns": [
+            {"name": f"{prefix}_{i}", "type": data_type, "nullable": True, "key_type": None}
+            for i in range(20)
+            for prefix, data_type in [("patient_id", "bigint"), ("email", "varchar"), ("visit_date", "date")]
+        ]
+    }
+    
+    parallel = enricher.enrich_column_summary_parallel(summary, max_workers=2, chunk_size=16, min_signatures=1)
+    serial = enricher.enrich_column_summary(summary)
+    
+    for column in parallel['enriched_columns'] + serial['enriched_columns']:
+        column.pop('enrichment_timestamp')
+    assert parallel['enriched_columns'] == serial['enriched_columns']
+    assert parallel['enrichment_summary'] == serial['enrichment_summary']
+
+
+if __name__ == "__main__":
+    test_compiled_pattern_matches_substring_scan()
+    test_rule_matchers_handle_missing_pattern_groups()
+    test_field_automaton_agrees_with_field_patterns()
+    test_indicator_automaton_finds_overlapping_indicators()
+    test_clean_enrichment()
+    test_repeated_column_signatures_are_cached()
+    test_score_table_matches_direct_scoring()
+    test_configs_are_cached_per_process()
+    test_convenience_function_reuses_enricher()
+    test_enrich_schema_matches_per_table_enrichment()
+    test_parallel_enrichment_matches_serial()
+    print("Column enrichment tests passed")
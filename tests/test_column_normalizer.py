@@ -0,0 +1,211 @@
+"""
+Test Column Normalization
+
+This script tests the column field normalizer and its data type categorization.
+"""
+
+import sys
+import os
+import json
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from normalizer import (
+    ColumnFieldNormalizer, CompiledColumnSummary, NormalizedField, ViewType
+)
+
+
+def get_sample_summary():
+    """Get a small minimal column summary with statistics."""
+    return {
+        "table": "patients",
+        "columns": [
+            {"name": "patient_id", "type": "bigint", "nullable": False, "key_type": "PK",
+             "null_pct": 0.0, "unique_pct": 100.0},
+            {"name": "email", "type": "varchar(255)", "nullable": True,
+             "patterns": ["email"], "null_pct": 12.5, "unique_pct": 97.0},
+            {"name": "birth_date", "type": "DATE", "nullable": True, "null_pct": 3.0, "unique_pct": 40.0},
+            {"name": "is_active", "type": "bit", "nullable": False, "unique_pct": 2.0},
+            {"name": "profile", "type": "jsonb", "nullable": True}
+        ]
+    }
+
+
+def test_data_type_categories():
+    """Categories follow the ordered substring rules, including odd types."""
+    expected = {
+        "bigint": "integer",
+        "TINYINT(1)": "integer",
+        "double precision": "numeric",
+        "character varying": "text",
+        "timestamp with time zone": "temporal",
+        "boolean": "boolean",
+        "jsonb": "structured",
+        "point": "integer",  # 'int' is a substring of 'point'
+        "mediumint unsigned": "integer",
+        "nvarchar(max)": "text",
+        "smalldatetime": "temporal",
+        "uuid": "other",
+        "": "other"
+    }
+    for data_type, category in expected.items():
+        field_obj = NormalizedField(name="c", type=data_type, nullable=True)
+        assert field_obj.data_category == category, data_type
+
+
+def test_all_views():
+    """Every view normalizes the sample summary."""
+    normalizer = ColumnFieldNormalizer()
+    summary = get_sample_summary()
+    
+    field_list = normalizer.normalize(summary, ViewType.FIELD_LIST)
+    assert field_list['total_columns'] == 5
+    assert field_list['summary']['key_fields'] == 1
+    assert field_list['fields'][1]['data_category'] == 'text'
+    assert list(field_list['fields'][0]) == [
+        'name', 'type', 'nullable', 'key_type', 'patterns', 'null_pct', 'unique_pct',
+        'is_key', 'is_pattern_field', 'data_category', 'quality_score'
+    ]
+    
+    type_groups = normalizer.normalize(summary, ViewType.TYPE_GROUPS)
+    assert type_groups['summary']['category_distribution'] == {
+        'integer': 1, 'text': 1, 'temporal': 1, 'boolean': 1, 'structured': 1
+    }
+    
+    llm_view = normalizer.normalize(summary, ViewType.LLM_OPTIMIZED)
+    assert llm_view['fields'][0] == "patient_id:bigint NOT NULL PK"
+    assert llm_view['fields'][1] == "email:varchar(255) [email]"
+
+
+def test_cached_fields_do_not_leak_between_views():
+    """Cached fields are reused across views without sharing mutable output."""
+    normalizer = ColumnFieldNormalizer()
+    summary = get_sample_summary()
+    
+    first = normalizer.to_field_list(summary)
+    first['fields'][1]['patterns'].append('mutated')
+    first['fields'][1]['quality_score'] = -1
+    second = normalizer.to_field_list(summary)
+    
+    assert second['fields'][1]['patterns'] == ['email']
+    assert second['fields'][1]['quality_score'] != -1
+    assert summary['columns'][1]['patterns'] == ['email']
+
+
+def test_normalize_multi_matches_single_views():
+    """A fused multi-view pass returns the same views as separate calls."""
+    normalizer = ColumnFieldNormalizer()
+    summary = get_sample_summary()
+    
+    views = normalizer.normalize_multi(summary, list(ViewType))
+    
+    assert list(views) == list(ViewType)
+    for view_type, view in views.items():
+        assert view == normalizer.normalize(summary, view_type), view_type
+
+
+def test_flat_structure_soa_matches_flat_structure():
+    """The columnar flat view holds the same values as the row-oriented one."""
+    normalizer = ColumnFieldNormalizer()
+    summary = get_sample_summary()
+    
+    rows = normalizer.to_flat_structure(summary)['columns']
+    columnar = normalizer.to_flat_structure_soa(summary)
+    field_list = normalizer.to_field_list(summary)
+    
+    assert columnar['total_columns'] == len(rows)
+    for attribute, values in columnar['columns'].items():
+        assert values == [row[attribute] for row in rows], attribute
+    for key, value in field_list['summary'].items():
+        assert abs(columnar['summary'][key] - value) < 1e-9, key
+
+
+def test_llm_view_as_bytes():
+    """The byte form of the LLM view is compact JSON of the same view."""
+    normalizer = ColumnFieldNormalizer()
+    summary = get_sample_summary()
+    
+    payload = normalizer.to_llm_optimized(summary, as_bytes=True)
+    
+    assert isinstance(payload, bytes)
+    assert b'": ' not in payload
+    assert json.loads(payload) == normalizer.to_llm_optimized(summary)
+
+
+def test_compiled_schema_matches_field_list():
+    """A schema-specialized normalizer returns the regular field list view."""
+    normalizer = ColumnFieldNormalizer()
+    summary = get_sample_summary()
+    view = normalizer.compile_for_schema(summary)
+    
+    stats = [(col.get('null_pct', 0.0), col.get('unique_pct', 0.0)) for col in summary['columns']]
+    assert view(stats) == normalizer.to_field_list(summary)
+    
+    stats[1] = (50.0, 20.0)
+    summary['columns'][1].update(null_pct=50.0, unique_pct=20.0)
+    assert view(stats) == normalizer.to_field_list(summary)
+    
+    try:
+        view(stats[:2])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_compact_grouping_views():
+    """Compact grouping views hold tuples with the same content as the dict entries."""
+    normalizer = ColumnFieldNormalizer()
+    summary = get_sample_summary()
+    
+    patterns = normalizer.to_pattern_groups(summary)
+    compact_patterns = normalizer.to_pattern_groups(summary, compact=True)
+    assert compact_patterns['summary'] == patterns['summary']
+    assert compact_patterns['pattern_groups']['email'][0]._asdict() == patterns['pattern_groups']['email'][0]
+    assert [info._asdict() for info in compact_patterns['no_pattern_fields']] == patterns['no_pattern_fields']
+    
+    types = normalizer.to_type_groups(summary)
+    compact_types = normalizer.to_type_groups(summary, compact=True)
+    assert compact_types['summary'] == types['summary']
+    for category, infos in compact_types['by_category'].items():
+        expected = types['by_category'][category]
+        assert [dict(info._asdict(), patterns=list(info.patterns)) for info in infos] == expected
+
+
+def test_key_and_data_types_are_interned():
+    """Key types and data types read from a summary are shared strings."""
+    normalizer = ColumnFieldNormalizer()
+    summary = {"table": "t", "columns": [
+        {"name": "id", "type": ''.join(["big", "int"]), "nullable": False, "key_type": ''.join(["P", "K"])}
+    ]}
+    
+    field_info = normalizer.to_field_list(summary)['fields'][0]
+    assert field_info['key_type'] is sys.intern('PK')
+    assert field_info['type'] is sys.intern('bigint')
+    assert list(normalizer.to_type_groups(summary)['by_data_type'])[0] is sys.intern('bigint')
+
+
+def test_compiled_summary_matches_plain_summary():
+    """A precompiled summary normalizes to the same views as the plain one."""
+    normalizer = ColumnFieldNormalizer()
+    summary = get_sample_summary()
+    compiled = CompiledColumnSummary.from_summary(summary)
+    
+    assert compiled.columns[2].key_type is None
+    assert compiled.columns[1].patterns == ("email",)
+    assert normalizer.normalize_multi(compiled, list(ViewType)) == normalizer.normalize_multi(summary, list(ViewType))
+    assert normalizer.to_flat_structure_soa(compiled) == normalizer.to_flat_structure_soa(summary)
+
+
+if __name__ == "__main__":
+    test_data_type_categories()
+    test_all_views()
+    test_cached_fields_do_not_leak_between_views()
+    test_normalize_multi_matches_single_views()
+    test_flat_structure_soa_matches_flat_structure()
+    test_llm_view_as_bytes()
+    test_compiled_schema_matches_field_list()
+    test_compact_grouping_views()
+    test_key_and_data_types_are_interned()
+    test_compiled_summary_matches_plain_summary()
+    print("Column normalization tests passed")
@@ -0,0 +1,298 @@
+"""
+Test Core Schema Profiler
+
+This script tests the core schema profiler against an in-memory metadata extractor.
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from datetime import date, datetime
+from decimal import Decimal
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from profiler import ProfilerConfig, json_codec
+from profiler.core_profiler import CoreSchemaProfiler, detect_database_type
+from profiler.schema_models import ColumnProfile
+
+
+class FakeConnector:
+    """Connector stand-in; the profiler only inspects its class name."""
+
+
+class FakeMetadataExtractor:
+    """Metadata extractor serving canned metadata for a small schema."""
+    
+    def __init__(self, tables, delay=0.0):
+        self.tables = tables
+        self.delay = delay
+        self.database_name = ""
+        self.schema_name = None
+        self.threads = set()
+        self.tables_info_calls = 0
+        self.sample_requests = []
+    
+    def get_tables_info(self):
+        self.tables_info_calls += 1
+        return [{'table_name': name} for name in self.tables]
+    
+    def get_complete_table_metadata(self, table_name, *, include_sample_data=True, sample_limit=5):
+        self.threads.add(threading.get_ident())
+        self.sample_requests.append((include_sample_data, sample_limit))
+        time.sleep(self.delay)
+        spec = self.tables[table_name]
+        return {
+            'columns': [
+                ColumnProfile(name=name, data_type=data_type, is_nullable=True,
+                              is_primary_key=name in spec.get('pk', []),
+                              is_foreign_key=any(fk['column_name'] == name for fk in spec.get('fks', [])))
+                for name, data_type in spec['columns']
+            ],
+            'primary_keys': spec.get('pk', []),
+            'foreign_keys': spec.get('fks', []),
+            'indexes': [],
+            'sample_data': [],
+            'row_count': 0,
+            'self_referencing_columns': [],
+            'potential_fk_candidates': []
+        }
+
+
+def get_sample_tables():
+    """Get a small schema with one declared and one undeclared relationship."""
+    return {
+        'customer': {'columns': [('id', 'int'), ('name', 'varchar')], 'pk': ['id']},
+        'orders': {
+            'columns': [('order_id', 'int'), ('customer_id', 'int'), ('product_id', 'int')],
+            'pk': ['order_id'],
+            'fks': [{'column_name': 'customer_id', 'referenced_table': 'customer',
+                     'referenced_column': 'id', 'constraint_name': 'fk_orders_customer'}]
+        },
+        'product': {'columns': [('id', 'int'), ('sku', 'varchar')], 'pk': ['id']}
+    }
+
+
+def test_profile_schema():
+    """Profiling aggregates tables, columns and relationships."""
+    extractor = FakeMetadataExtractor(get_sample_tables())
+    profiler = CoreSchemaProfiler(FakeConnector(), metadata_extractor=extractor)
+    
+    profile = profiler.profile_schema(ProfilerConfig(database_name="shop"))
+    
+    assert profile.total_tables == 3
+    assert profile.total_columns == 7
+    assert [table.name for table in profile.tables] == ['customer', 'orders', 'product']
+    assert profile.cross_table_relationships[0]['to_table'] == 'customer'
+    # 'product_id' ends with '_id', the primary key of every other table
+    assert [(rel['from_column'], rel['to_table']) for rel in profile.potential_relationships] == [
+        ('product_id', 'customer'), ('product_id', 'product')
+    ]
+
+
+def test_profile_tables_in_parallel_keeps_order():
+    """Above the threshold tables are profiled on several threads, in input order."""
+    tables = {f"t{i:02d}": {'columns': [('id', 'int')], 'pk': ['id']} for i in range(12)}
+    extractor = FakeMetadataExtractor(tables, delay=0.01)
+    profiler = CoreSchemaProfiler(FakeConnector(), metadata_extractor=extractor)
+    names = sorted(tables, reverse=True)
+    
+    profiles = profiler.profile_tables(names, ProfilerConfig(database_name="db", max_workers=4, parallel_threshold=5))
+    
+    assert [profile.name for profile in profiles] == names
+    assert len(extractor.threads) > 1
+    
+    extractor.threads.clear()
+    profiler.profile_tables(names[:4], ProfilerConfig(database_name="db", max_workers=4, parallel_threshold=5))
+    assert extractor.threads == {threading.get_ident()}
+
+
+def test_sample_data_requested_only_when_kept():
+    """The sample data flag and limit are pushed down to the metadata extractor."""
+    extractor = FakeMetadataExtractor(get_sample_tables())
+    profiler = CoreSchemaProfiler(FakeConnector(), metadata_extractor=extractor)
+    
+    profiler.profile_table('customer', ProfilerConfig(database_name="shop", sample_data_limit=3))
+    profiler.profile_table('customer', ProfilerConfig(database_name="shop", include_sample_data=False))
+    assert extractor.sample_requests == [(True, 3), (False, 5)]
+
+
+def test_tables_info_cached_for_incremental_runs():
+    """Incremental runs reuse the table list; stale lists are refreshed in the background."""
+    tables = get_sample_tables()
+    extractor = FakeMetadataExtractor(tables)
+    profiler = CoreSchemaProfiler(FakeConnector(), metadata_extractor=extractor)
+    config = ProfilerConfig(database_name="shop", incremental_enabled=True,
+                            incremental_state_path=os.path.join(tempfile.gettempdir(), "state.json"))
+    
+    profiler.profile_schema(config)
+    profiler.profile_schema(config)
+    assert [table['table_name'] for table in profiler.get_tables_info(config)] == ['customer', 'orders', 'product']
+    assert extractor.tables_info_calls == 1
+    
+    # Non-incremental runs always see the live table list
+    profiler.profile_schema(ProfilerConfig(database_name="shop"))
+    assert extractor.tables_info_calls == 2
+    
+    # A stale entry is still served while it is refreshed
+    key = ("shop", None)
+    fetched_at, cached = profiler._tables_info_cache[key]
+    profiler._tables_info_cache[key] = (fetched_at - 25 * 3600, cached)
+    tables['invoice'] = {'columns': [('id', 'int')], 'pk': ['id']}
+    assert profiler.profile_schema(config).total_tables == 3
+    for _ in range(100):
+        if profiler._tables_info_cache[key][1] is not cached:
+            break
+        time.sleep(0.01)
+    assert profiler.profile_schema(config).total_tables == 4
+    assert extractor.tables_info_calls == 3
+    
+    profiler.invalidate_tables_info_cache(config)
+    profiler.profile_schema(config)
+    assert extractor.tables_info_calls == 4
+
+
+def test_export_profile():
+    """Exported profiles are JSON, with unsupported values written as strings."""
+    extractor = FakeMetadataExtractor(get_sample_tables())
+    profiler = CoreSchemaProfiler(FakeConnector(), metadata_extractor=extractor)
+    profile = profiler.profile_schema(ProfilerConfig(database_name="shop"))
+    profile.tables[0].sample_data = [{'id': 1, 'balance': Decimal('10.50')}]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "profile.json")
+        exported = profiler.export_profile(profile, path)
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    
+    assert data['total_columns'] == 7
+    assert data['tables'][0]['sample_data'] == [{'id': 1, 'balance': '10.50'}]
+    assert data == json.loads(json.dumps(asdict(profile), default=str))
+    assert exported == asdict(profile)
+    assert profiler.export_profile(profile, os.devnull, return_dict=False) is None
+
+
+def test_export_writes_datetimes_as_strings_with_both_backends():
+    """Datetime sample values are written in str() form whether or not orjson is installed."""
+    extractor = FakeMetadataExtractor(get_sample_tables())
+    profiler = CoreSchemaProfiler(FakeConnector(), metadata_extractor=extractor)
+    profile = profiler.profile_schema(ProfilerConfig(database_name="shop"))
+    profile.tables[0].sample_data = [{'id': 1, 'created': datetime(2024, 1, 2, 3, 4, 5), 'day': date(2024, 1, 2)}]
+    profile.tables[0].columns[0].sample_values = [datetime(2024, 1, 2, 3, 4, 5)]
+    
+    original_orjson = json_codec.orjson
+    documents = []
+    try:
+        for codec in {original_orjson, None}:
+            json_codec.orjson = codec
+            with tempfile.TemporaryDirectory() as temp_dir:
+                path = os.path.join(temp_dir, "profile.json")
+                profiler.export_profile(profile, path, return_dict=False)
+                with open(path, 'rb') as f:
+                    documents.append(f.read())
+    finally:
+        json_codec.orjson = original_orjson
+    
+    data = json.loads(documents[0])
+    assert data['tables'][0]['sample_data'] == [{'id': 1, 'created': '2024-01-02 03:04:05', 'day': '2024-01-02'}]
+    assert data['tables'][0]['columns'][0]['sample_values'] == ['2024-01-02 03:04:05']
+    assert all(document == documents[0] for document in documents)
+
+
+def test_streamed_export_matches_one_shot_encoding():
+    """Table-by-table export writes exactly the one-shot JSON document."""
+    extractor = FakeMetadataExtractor(get_sample_tables())
+    profiler = CoreSchemaProfiler(FakeConnector(), metadata_extractor=extractor)
+    profile = profiler.profile_schema(ProfilerConfig(database_name="shop"))
+    profile.tables[0].sample_data = [{'id': 1, 'note': 'line\nbreak', 'balance': Decimal('1.5')}]
+    empty = profiler.profile_schema(ProfilerConfig(database_name="empty"))
+    empty.tables = []
+    
+    original_orjson = json_codec.orjson
+    try:
+        for codec in {original_orjson, None}:
+            json_codec.orjson = codec
+            for schema_profile in [profile, empty]:
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    path = os.path.join(temp_dir, "profile.json")
+                    profiler.export_profile(schema_profile, path, return_dict=False)
+                    with open(path, 'rb') as f:
+                        written = f.read()
+                assert written == json_codec.dumps_json(schema_profile, default=json_codec.encode_default)
+    finally:
+        json_codec.orjson = original_orjson
+
+
+def test_detect_database_type():
+    """Database types follow the connector class name."""
+    class MySQLConnector:
+        pass
+    
+    class MSSQLConnector:
+        pass
+    
+    assert detect_database_type(MySQLConnector) == 'mysql'
+    assert detect_database_type(MSSQLConnector) == 'mssql'
+    assert detect_database_type(FakeConnector) == 'unknown'
+    assert CoreSchemaProfiler(MySQLConnector(), metadata_extractor=FakeMetadataExtractor({})).db_type == 'mysql'
+
+
+def test_pattern_detection_batches_per_table():
+    """Tables are pattern-checked in one batch call, with a per-column fallback."""
+    class BatchRecognizer:
+        def __init__(self):
+            self.batches = []
+        
+        def detect_patterns_batch(self, items):
+            self.batches.append([name for name, values in items])
+            return [['email_address'] if name == 'name' else [] for name, values in items]
+    
+    class FailingRecognizer:
+        def detect_patterns(self, values, field_name=None):
+            if field_name == 'name':
+                raise ValueError("bad sample")
+            return ['basic_id_fallback']
+    
+    tables = get_sample_tables()
+    extractor = FakeMetadataExtractor(tables)
+    original = extractor.get_complete_table_metadata
+    
+    def with_samples(table_name, **kwargs):
+        metadata = original(table_name, **kwargs)
+        metadata['sample_data'] = [{'id': 1}]
+        for column in metadata['columns']:
+            column.sample_values = ['a', 'b', 'c']
+        return metadata
+    extractor.get_complete_table_metadata = with_samples
+    
+    recognizer = BatchRecognizer()
+    profiler = CoreSchemaProfiler(FakeConnector(), metadata_extractor=extractor, pattern_recognizer=recognizer)
+    table = profiler.profile_table('customer', ProfilerConfig(database_name="shop"))
+    assert recognizer.batches == [['id', 'name']]
+    assert [column.detected_patterns for column in table.columns] == [[], ['email_address']]
+    
+    profiler = CoreSchemaProfiler(FakeConnector(), metadata_extractor=extractor, pattern_recognizer=FailingRecognizer())
+    table = profiler.profile_table('customer', ProfilerConfig(database_name="shop"))
+    assert [column.detected_patterns for column in table.columns] == [['basic_id_fallback'], []]
+    
+    profiler = CoreSchemaProfiler(FakeConnector(), metadata_extractor=extractor, pattern_recognizer=BatchRecognizer())
+    profile = profiler.profile_schema(ProfilerConfig(database_name="shop"))
+    assert profile.pattern_summary == {'email_address': 1}
+
+
+if __name__ == "__main__":
+    test_profile_schema()
+    test_profile_tables_in_parallel_keeps_order()
+    test_sample_data_requested_only_when_kept()
+    test_tables_info_cached_for_incremental_runs()
+    test_export_profile()
+    test_export_writes_datetimes_as_strings_with_both_backends()
+    test_streamed_export_matches_one_shot_encoding()
+    test_detect_database_type()
+    test_pattern_detection_batches_per_table()
+    print("Core profiler tests passed")
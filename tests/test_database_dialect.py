@@ -85,5 +85,27 @@ def test_database_dialect():
     print(f"{'='*50}")
 
 
+
+def test_dialect_instances_are_shared():
+    """Dialects are shared per database type and quote identifiers consistently."""
+    assert DatabaseDialect.get('MySQL') is DatabaseDialect.get('mysql')
+    assert DatabaseDialect.get('mssql') is not DatabaseDialect.get('mysql')
+    assert DatabaseDialect.get('mssql').quote_identifier('orders') == '[orders]'
+    assert DatabaseDialect.get('mysql').quote_identifier('orders') == '`orders`'
+    assert DatabaseDialect.get('unknown_db').quote_identifier('orders') == '"orders"'
+    assert DatabaseDialect.get('mssql').get_sample_query('*', '[orders]', 3) == 'SELECT TOP 3 * FROM [orders]'
+    assert DatabaseDialect.get('mysql').get_sample_query('id', '`orders`') == 'SELECT id FROM `orders` LIMIT 5'
+    assert DatabaseDialect.get('mysql').session_init_statements() == [
+        "SET SESSION information_schema_stats_expiry = 86400"
+    ]
+    assert DatabaseDialect.get('postgresql').session_init_statements() == []
+    assert DatabaseDialect.get_supported_databases() == ('mysql', 'postgresql', 'mssql')
+    assert DatabaseDialect.is_supported('MSSQL') and not DatabaseDialect.is_supported('oracle')
+    assert DatabaseDialect.get('mysql').dialect.count_query == 'SELECT COUNT(*) as row_count FROM {}'
+    assert DatabaseDialect.get('postgresql').get_schema_summary_query() is None
+    assert DatabaseDialect.get('mysql').get_schema_summary_query().count('WHERE TABLE_SCHEMA = %s') == 3
+
+
 if __name__ == "__main__":
-    test_database_dialect() 
\ No newline at end of file
+    test_database_dialect()
+    test_dialect_instances_are_shared() 
\ No newline at end of file
@@ -0,0 +1,388 @@
+"""
+Test Incremental Manager
+
+This script tests change detection and state management for incremental profiling.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from profiler import incremental_manager
+from profiler import ProfilerConfig
+from profiler.incremental_manager import (
+    DatabaseChangeDetector, FileProfileCache, FileStateManager, IncrementalProfilingManager, IncrementalState,
+    MemoryProfileCache, TableChangeInfo
+)
+from profiler.schema_models import ColumnProfile, TableProfile
+
+
+class FakeMetadataExtractor:
+    """Metadata extractor serving canned column, key and index metadata."""
+    
+    def __init__(self, tables):
+        self.tables = tables
+    
+    def get_column_profiles(self, table_name):
+        return [
+            ColumnProfile(name=name, data_type=data_type, is_nullable=True, ordinal_position=position)
+            for position, (name, data_type) in enumerate(self.tables[table_name]['columns'], 1)
+        ]
+    
+    def get_primary_keys(self, table_name):
+        return self.tables[table_name].get('pk', [])
+    
+    def get_foreign_keys(self, table_name):
+        return self.tables[table_name].get('fks', [])
+    
+    def get_indexes(self, table_name):
+        return self.tables[table_name].get('indexes', [])
+    
+    def get_row_count(self, table_name):
+        return self.tables[table_name].get('rows', 0)
+
+
+class FakeSchemaProfiler:
+    """Base profiler profiling tables straight from a fake metadata extractor."""
+    
+    def __init__(self, extractor):
+        self.extractor = extractor
+        self.profiled = []
+    
+    def get_tables_info(self, config=None):
+        return [{'table_name': name} for name in self.extractor.tables]
+    
+    def profile_table(self, table_name, config):
+        self.profiled.append(table_name)
+        return TableProfile(name=table_name, columns=self.extractor.get_column_profiles(table_name))
+
+
+class CountingStateManager(FileStateManager):
+    """File state manager counting how often the state file is read."""
+    
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.loads = 0
+    
+    def load_state(self):
+        self.loads += 1
+        return super().load_state()
+
+
+def get_tables():
+    """Get canned metadata for a two-table schema."""
+    return {
+        'customer': {'columns': [('id', 'int'), ('name', 'varchar')], 'pk': ['id'], 'rows': 10},
+        'orders': {
+            'columns': [('order_id', 'int'), ('customer_id', 'int')],
+            'pk': ['order_id'],
+            'fks': [{'column_name': 'customer_id', 'referenced_table': 'customer', 'referenced_column': 'id'}],
+            'indexes': [{'index_name': 'ix_customer', 'column_name': 'customer_id', 'is_unique': False}],
+            'rows': 100
+        }
+    }
+
+
+def test_schema_hash_tracks_structure():
+    """Schema hashes are stable for unchanged tables and differ when structure changes."""
+    tables = get_tables()
+    detector = DatabaseChangeDetector(FakeMetadataExtractor(tables))
+    
+    orders_hash = detector._compute_table_schema_hash('orders')
+    assert orders_hash and orders_hash == detector._compute_table_schema_hash('orders')
+    assert orders_hash != detector._compute_table_schema_hash('customer')
+    
+    tables['orders']['columns'].append(('total', 'decimal'))
+    assert orders_hash != detector._compute_table_schema_hash('orders')
+
+
+def test_state_version_must_match_hash_algorithm():
+    """State written with another hash algorithm is rejected; current state round-trips."""
+    with tempfile.TemporaryDirectory() as directory:
+        manager = FileStateManager(os.path.join(directory, 'state.json'))
+        state = IncrementalState(
+            database_name='shop',
+            schema_name=None,
+            last_profile_timestamp='2024-01-01T12:00:00',
+            table_states={'orders': TableChangeInfo('orders', 'abc', 100)}
+        )
+        manager.save_state(state.to_dict())
+        loaded = IncrementalState.from_dict(manager.load_state())
+        assert loaded.table_states['orders'].row_count == 100
+        assert loaded.last_profile_dt == datetime(2024, 1, 1, 12, 0)
+        assert loaded.table_states['orders'].last_modified_dt is None
+        
+        # Hashes of the JSON-encoded schema (2.x, or no version at all) are stale
+        stale = state.to_dict()
+        stale['profile_version'] = '2.1'
+        assert not manager.validate_state(stale)
+        
+        legacy = state.to_dict()
+        del legacy['profile_version']
+        assert not manager.validate_state(legacy)
+        
+        broken = state.to_dict()
+        del broken['table_states']['orders']['schema_hash']
+        assert not manager.validate_state(broken)
+        broken['table_states']['orders'] = []
+        assert not manager.validate_state(broken)
+        assert state.profile_version == incremental_manager._STATE_VERSION
+
+
+def test_prime_fetches_metadata_in_bulk_once_per_run():
+    """Priming hashes and counts tables with bulk calls; later lookups reuse the results."""
+    class BulkMetadataExtractor(FakeMetadataExtractor):
+        def __init__(self, tables):
+            super().__init__(tables)
+            self.calls = []
+        
+        def prefetch_schema_metadata(self):
+            self.calls.append('prefetch_schema_metadata')
+        
+        def clear_bulk_cache(self):
+            self.calls.append('clear_bulk_cache')
+        
+        def count_rows_bulk(self, table_names):
+            self.calls.append('count_rows_bulk')
+            return {name: self.tables[name]['rows'] for name in table_names}
+        
+        def get_row_count(self, table_name):
+            self.calls.append('get_row_count')
+            return super().get_row_count(table_name)
+    
+    extractor = BulkMetadataExtractor(get_tables())
+    detector = DatabaseChangeDetector(extractor)
+    
+    detector.prime(['customer', 'orders'])
+    assert extractor.calls == ['prefetch_schema_metadata', 'clear_bulk_cache', 'count_rows_bulk']
+    assert detector.get_schema_hash('orders') == detector._compute_table_schema_hash('orders')
+    assert detector.get_row_count('orders') == 100
+    detector.prime(['customer', 'orders'])
+    assert len(extractor.calls) == 3
+    
+    detector.reset()
+    assert detector.get_row_count('orders') == 100
+    assert extractor.calls[-1] == 'get_row_count'
+
+
+def test_prime_hashes_tables_concurrently_when_metadata_needs_queries():
+    """Without prefetched metadata, tables are hashed on several threads with the same results."""
+    class SlowMetadataExtractor(FakeMetadataExtractor):
+        def __init__(self, tables):
+            super().__init__(tables)
+            self.threads = set()
+        
+        def get_column_profiles(self, table_name):
+            self.threads.add(threading.get_ident())
+            time.sleep(0.02)
+            return super().get_column_profiles(table_name)
+    
+    tables = {f"table_{i}": {'columns': [('id', 'int')], 'rows': i} for i in range(8)}
+    extractor = SlowMetadataExtractor(tables)
+    detector = DatabaseChangeDetector(extractor)
+    
+    detector.prime(list(tables), max_workers=4)
+    assert len(extractor.threads) > 1
+    assert all(detector.get_schema_hash(name) == detector._compute_table_schema_hash(name) for name in tables)
+
+
+def test_incremental_run_reads_state_once():
+    """Each run loads the state file once and re-profiles only changed tables."""
+    tables = get_tables()
+    extractor = FakeMetadataExtractor(tables)
+    base_profiler = FakeSchemaProfiler(extractor)
+    config = ProfilerConfig(database_name='shop')
+    
+    with tempfile.TemporaryDirectory() as directory:
+        state_manager = CountingStateManager(os.path.join(directory, 'state.json'))
+        manager = IncrementalProfilingManager(state_manager, DatabaseChangeDetector(extractor))
+        
+        manager.profile_incremental(base_profiler, config)
+        assert state_manager.loads == 1
+        assert sorted(base_profiler.profiled) == ['customer', 'orders']
+        
+        tables['orders']['rows'] = 200
+        schema = manager.profile_incremental(base_profiler, config)
+        assert state_manager.loads == 2
+        assert base_profiler.profiled[2:] == ['orders']
+        assert [table.name for table in schema.tables] == ['customer', 'orders']
+        state = IncrementalState.from_dict(state_manager.load_state())
+        assert state.table_states['orders'].row_count == 200
+        assert state.table_states['orders'].last_modified_dt > state.table_states['customer'].last_modified_dt
+        assert state.table_states['orders'].last_modified == state.last_profile_timestamp
+        
+        # Dropped tables leave the state
+        del tables['customer']
+        tables['orders']['rows'] = 400
+        manager.profile_incremental(base_profiler, config)
+        assert list(IncrementalState.from_dict(state_manager.load_state()).table_states) == ['orders']
+
+
+def test_memory_profile_cache_evicts_least_recently_used():
+    """Profiles are sized when cached and the least recently used one is evicted when full."""
+    def make_profile(name):
+        return TableProfile(name=name, sample_data=[{'payload': name * 400 * 1024}])
+    
+    cache = MemoryProfileCache(max_size_mb=1)
+    cache.cache_profile('a', make_profile('a'))
+    cache.cache_profile('b', make_profile('b'))
+    assert cache.get_cached_profile('a').name == 'a'
+    
+    cache.cache_profile('c', make_profile('c'))
+    assert cache.get_cached_profile('b') is None
+    assert [cache.get_cached_profile(name).name for name in ('a', 'c')] == ['a', 'c']
+    
+    stats = cache.get_cache_stats()
+    assert stats['cached_tables'] == 2 and 0.78 < stats['estimated_size_mb'] <= 1
+    
+    cache.cache_profile('huge', TableProfile(name='huge', sample_data=[{'payload': 'x' * 2 * 1024 * 1024}]))
+    assert cache.get_cached_profile('huge') is None and cache.get_cache_stats()['cached_tables'] == 2
+    
+    cache.clear_cache()
+    assert cache.get_cache_stats()['estimated_size_mb'] == 0
+
+
+def test_save_state_leaves_no_temporary_file():
+    """Saves replace the state file atomically; a failed save removes its temporary file."""
+    state = IncrementalState('shop', None, '2024-01-01T12:00:00', {}).to_dict()
+    with tempfile.TemporaryDirectory() as directory:
+        manager = FileStateManager(os.path.join(directory, 'state.json'), durable=True)
+        manager.save_state(state)
+        manager.save_state(state)
+        assert sorted(os.listdir(directory)) == ['state.json']
+        
+        # The state path is a directory, so the rename fails
+        blocked = FileStateManager(os.path.join(directory, 'blocked'))
+        os.mkdir(blocked.file_path)
+        try:
+            blocked.save_state(state)
+            assert False, "save_state should fail"
+        except OSError:
+            pass
+        assert sorted(os.listdir(directory)) == ['blocked', 'state.json']
+
+
+def test_file_profile_cache_survives_restarts():
+    """Profiles of unchanged tables are read back from disk by a new manager."""
+    tables = get_tables()
+    config = ProfilerConfig(database_name='shop')
+    
+    with tempfile.TemporaryDirectory() as directory:
+        def run():
+            # A fresh manager, detector and cache, as in a new process
+            extractor = FakeMetadataExtractor(tables)
+            detector = DatabaseChangeDetector(extractor)
+            cache = FileProfileCache(os.path.join(directory, 'profiles'), detector.get_schema_hash)
+            manager = IncrementalProfilingManager(
+                FileStateManager(os.path.join(directory, 'state.json')), detector, cache
+            )
+            base_profiler = FakeSchemaProfiler(extractor)
+            return manager.profile_incremental(base_profiler, config), base_profiler, cache
+        
+        run()
+        schema, base_profiler, cache = run()
+        assert base_profiler.profiled == []
+        assert [table.name for table in schema.tables] == ['customer', 'orders']
+        assert schema.total_columns == 4
+        
+        # A schema change misses the cache and replaces the table's old profile
+        tables['orders']['columns'].append(('total', 'decimal'))
+        schema, base_profiler, cache = run()
+        assert base_profiler.profiled == ['orders']
+        assert cache.get_cache_stats()['cached_tables'] == 2
+        
+        cache.clear_cache()
+        assert cache.get_cached_profile('customer') is None
+
+
+def test_full_run_primes_hashes_before_caching_profiles():
+    """A run without previous state hashes all tables in one bulk prime before profiles are cached."""
+    class PrimeCountingDetector(DatabaseChangeDetector):
+        def __init__(self, metadata_extractor):
+            super().__init__(metadata_extractor)
+            self.primed = []
+        
+        def prime(self, table_names, max_workers=8):
+            self.primed.append(sorted(table_names))
+            super().prime(table_names, max_workers)
+    
+    extractor = FakeMetadataExtractor(get_tables())
+    config = ProfilerConfig(database_name='shop')
+    
+    with tempfile.TemporaryDirectory() as directory:
+        detector = PrimeCountingDetector(extractor)
+        hashed_before_caching = []
+        
+        def schema_hash(table_name):
+            hashed_before_caching.append(table_name in detector._schema_hashes)
+            return detector.get_schema_hash(table_name)
+        
+        cache = FileProfileCache(os.path.join(directory, 'profiles'), schema_hash)
+        manager = IncrementalProfilingManager(
+            FileStateManager(os.path.join(directory, 'state.json')), detector, cache
+        )
+        manager.profile_incremental(FakeSchemaProfiler(extractor), config)
+        assert detector.primed[0] == ['customer', 'orders']
+        assert hashed_before_caching == [True, True]
+
+
+def test_unchanged_schema_digest_skips_schema_hashing():
+    """With an unchanged schema summary only row counts are checked."""
+    class SummarizingExtractor(FakeMetadataExtractor):
+        def get_schema_summary(self):
+            return [{'table_name': name, 'column_count': len(spec['columns'])} for name, spec in self.tables.items()]
+    
+    class RecordingDetector(DatabaseChangeDetector):
+        def __init__(self, metadata_extractor):
+            super().__init__(metadata_extractor)
+            self.hashed = []
+        
+        def _compute_table_schema_hash(self, table_name):
+            self.hashed.append(table_name)
+            return super()._compute_table_schema_hash(table_name)
+    
+    tables = get_tables()
+    extractor = SummarizingExtractor(tables)
+    base_profiler = FakeSchemaProfiler(extractor)
+    config = ProfilerConfig(database_name='shop')
+    
+    with tempfile.TemporaryDirectory() as directory:
+        state_manager = FileStateManager(os.path.join(directory, 'state.json'))
+        detector = RecordingDetector(extractor)
+        manager = IncrementalProfilingManager(state_manager, detector)
+        manager.profile_incremental(base_profiler, config)
+        assert detector.schema_digest is not None
+        assert state_manager.load_state()['overall_digest'] == detector.schema_digest
+        
+        # Data changes are still found without hashing any table
+        detector.hashed.clear()
+        tables['orders']['rows'] = 200
+        manager.profile_incremental(base_profiler, config)
+        assert detector.hashed == []
+        assert base_profiler.profiled[-1] == 'orders'
+        
+        # A structural change alters the digest and tables are hashed again
+        tables['customer']['columns'].append(('email', 'varchar'))
+        manager.profile_incremental(base_profiler, config)
+        assert sorted(detector.hashed) == ['customer', 'orders']
+        assert base_profiler.profiled[-1] == 'customer'
+
+
+if __name__ == "__main__":
+    test_schema_hash_tracks_structure()
+    test_state_version_must_match_hash_algorithm()
+    test_prime_fetches_metadata_in_bulk_once_per_run()
+    test_prime_hashes_tables_concurrently_when_metadata_needs_queries()
+    test_incremental_run_reads_state_once()
+    test_memory_profile_cache_evicts_least_recently_used()
+    test_save_state_leaves_no_temporary_file()
+    test_file_profile_cache_survives_restarts()
+    test_full_run_primes_hashes_before_caching_profiles()
+    test_unchanged_schema_digest_skips_schema_hashing()
+    print("Incremental manager tests passed")
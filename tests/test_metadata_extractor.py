@@ -0,0 +1,236 @@
+"""
+Test Metadata Extractor
+
+This script tests metadata extraction against a recording in-memory connector.
+"""
+
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from profiler import DatabaseDialect
+from profiler.metadata_extractor import MetadataExtractor
+
+
+class RecordingConnector:
+    """Connector answering dialect queries from canned rows and recording each call."""
+    
+    def __init__(self, rows_by_query, failing_queries=()):
+        self.rows_by_query = rows_by_query
+        self.failing_queries = set(failing_queries)
+        self.calls = []
+    
+    def execute_query(self, query, params=None):
+        self.calls.append((query, params))
+        if query in self.failing_queries:
+            raise RuntimeError("query failed")
+        return self.rows_by_query.get(query, [])
+
+
+def get_mysql_rows():
+    """Get schema-wide and per-table result rows for a two-table MySQL schema."""
+    dialect = DatabaseDialect('mysql')
+    columns = [
+        {'table_name': 'customer', 'column_name': 'id', 'data_type': 'int', 'is_nullable': 'NO',
+         'column_key': 'PRI', 'ordinal_position': 1},
+        {'table_name': 'orders', 'column_name': 'order_id', 'data_type': 'int', 'is_nullable': 'NO',
+         'column_key': 'PRI', 'ordinal_position': 1},
+        {'table_name': 'orders', 'column_name': 'customer_id', 'data_type': 'int', 'is_nullable': 'YES',
+         'column_key': 'MUL', 'ordinal_position': 2}
+    ]
+    return {
+        dialect.get_all_columns_query(): columns,
+        dialect.get_all_primary_keys_query(): [
+            {'table_name': 'customer', 'column_name': 'id'},
+            {'table_name': 'orders', 'column_name': 'order_id'}
+        ],
+        dialect.get_all_foreign_keys_query(): [
+            {'table_name': 'orders', 'column_name': 'customer_id', 'referenced_table': 'customer',
+             'referenced_column': 'id', 'constraint_name': 'fk_orders_customer'}
+        ],
+        dialect.get_all_indexes_query(): [],
+        dialect.get_column_info_query(): [row for row in columns if row['table_name'] == 'orders']
+    }
+
+
+def test_prefetched_metadata_answers_per_table_lookups():
+    """After a prefetch, per-table metadata comes from memory with the same shape."""
+    connector = RecordingConnector(get_mysql_rows())
+    extractor = MetadataExtractor(connector, 'shop', db_type='mysql')
+    
+    assert extractor.prefetch_schema_metadata()['get_column_info_query'] == 3
+    assert len(connector.calls) == 4
+    assert all(params == ['shop'] for query, params in connector.calls)
+    
+    assert [column.name for column in extractor.get_column_profiles('orders')] == ['order_id', 'customer_id']
+    assert extractor.get_primary_keys('orders') == ['order_id']
+    assert extractor.get_foreign_keys('orders')[0]['referenced_table'] == 'customer'
+    assert extractor.get_foreign_keys('customer') == []
+    assert extractor.get_indexes('orders') == []
+    assert len(connector.calls) == 4
+    
+    extractor.clear_bulk_cache()
+    assert [column.name for column in extractor.get_column_profiles('orders')] == ['order_id', 'customer_id']
+    assert connector.calls[-1] == (extractor.dialect.get_column_info_query(), ['shop', 'orders'])
+
+
+def test_failed_prefetch_falls_back_to_per_table_queries():
+    """An operation whose schema-wide query fails is queried per table."""
+    rows = get_mysql_rows()
+    dialect = DatabaseDialect('mysql')
+    connector = RecordingConnector(rows, failing_queries=[dialect.get_all_columns_query()])
+    extractor = MetadataExtractor(connector, 'shop', db_type='mysql')
+    
+    assert 'get_column_info_query' not in extractor.prefetch_schema_metadata()
+    calls = len(connector.calls)
+    
+    assert len(extractor.get_column_profiles('orders')) == 2
+    assert extractor.get_primary_keys('customer') == ['id']
+    assert len(connector.calls) == calls + 1
+
+
+
+def test_prefetch_streams_schema_wide_rows():
+    """Schema-wide rows are read through stream_query; a stream failing midway is discarded."""
+    rows = get_mysql_rows()
+    dialect = DatabaseDialect('mysql')
+    
+    class StreamingConnector(RecordingConnector):
+        def __init__(self, rows_by_query):
+            super().__init__(rows_by_query)
+            self.streamed = []
+        
+        def stream_query(self, query, params=None, chunksize=1000):
+            self.streamed.append(query)
+            for row in self.rows_by_query.get(query, []):
+                yield row
+                if query == dialect.get_all_primary_keys_query():
+                    raise RuntimeError("connection lost")
+    
+    connector = StreamingConnector(rows)
+    extractor = MetadataExtractor(connector, 'shop', db_type='mysql')
+    
+    assert extractor.prefetch_schema_metadata() == {
+        'get_column_info_query': 3, 'get_foreign_keys_query': 1, 'get_indexes_query': 0
+    }
+    assert len(connector.streamed) == 4 and connector.calls == []
+    assert [column.name for column in extractor.get_column_profiles('orders')] == ['order_id', 'customer_id']
+    extractor.get_primary_keys('orders')
+    assert connector.calls == [(dialect.get_primary_keys_query(), ['shop', 'orders'])]
+def test_caching_schema_reuses_query_results():
+    """Inside a caching session identical queries reach the database once."""
+    connector = RecordingConnector(get_mysql_rows())
+    extractor = MetadataExtractor(connector, 'shop', db_type='mysql')
+    
+    with extractor.caching_schema():
+        first = extractor.get_column_profiles('orders')
+        first_rows = extractor._execute_query_safe(extractor.dialect.get_column_info_query(), ['shop', 'orders'])
+        first_rows[0]['column_name'] = 'changed'
+        assert [column.name for column in extractor.get_column_profiles('orders')] == [c.name for c in first]
+        assert len(connector.calls) == 1
+        
+        extractor.invalidate_cache('orders')
+        extractor.get_column_profiles('orders')
+        assert len(connector.calls) == 2
+    
+    # Results are dropped when the session ends
+    extractor.get_column_profiles('orders')
+    assert len(connector.calls) == 3
+
+
+
+def test_prefetch_tables_fills_session_cache():
+    """Concurrently prefetched per-table metadata is served from the session cache."""
+    connector = RecordingConnector(get_mysql_rows())
+    extractor = MetadataExtractor(connector, 'shop', db_type='mysql')
+    assert extractor.prefetch_tables(['orders']) == 0
+    
+    with extractor.caching_schema():
+        assert extractor.prefetch_tables(['customer', 'orders'], max_workers=4) == 8
+        assert len(connector.calls) == 8
+        
+        assert len(extractor.get_column_profiles('orders')) == 2
+        extractor.get_primary_keys('customer')
+        extractor.get_foreign_keys('orders')
+        extractor.get_indexes('customer')
+        assert len(connector.calls) == 8
+
+
+
+def test_count_rows_bulk():
+    """Row counts come from one UNION ALL per batch, per table when a batch fails."""
+    class CountingConnector(RecordingConnector):
+        def execute_query(self, query, params=None):
+            self.calls.append((query, params))
+            if 'UNION ALL' in query:
+                if '`missing`' in query:
+                    raise RuntimeError("table does not exist")
+                return [{'table_index': 0, 'row_count': 10}, {'table_index': 1, 'row_count': 20}]
+            return [{'row_count': 7}]
+    
+    connector = CountingConnector({})
+    extractor = MetadataExtractor(connector, 'shop', db_type='mysql')
+    
+    with extractor.caching_schema():
+        assert extractor.count_rows_bulk(['customer', 'orders']) == {'customer': 10, 'orders': 20}
+        assert len(connector.calls) == 1
+        assert extractor.get_row_count('orders') == 20
+        assert len(connector.calls) == 1
+    
+    assert extractor.count_rows_bulk(['customer', 'missing']) == {'customer': 7, 'missing': 7}
+    assert len(connector.calls) == 4
+
+
+def test_parameterized_queries_use_prepared_statements():
+    """Parameterized metadata queries go through the connector's prepared path."""
+    class PreparingConnector(RecordingConnector):
+        def __init__(self, rows_by_query):
+            super().__init__(rows_by_query)
+            self.prepared_calls = []
+        
+        def execute_prepared(self, query, params=None):
+            self.prepared_calls.append((query, params))
+            return self.rows_by_query.get(query, [])
+    
+    connector = PreparingConnector(get_mysql_rows())
+    extractor = MetadataExtractor(connector, 'shop', db_type='mysql')
+    
+    assert len(extractor.get_column_profiles('orders')) == 2
+    assert connector.prepared_calls == [(extractor.dialect.get_column_info_query(), ['shop', 'orders'])]
+    assert connector.calls == []
+
+
+def test_quoted_table_name_follows_schema():
+    """Quoted names are cached per schema, so switching schema_name re-quotes."""
+    extractor = MetadataExtractor(RecordingConnector({}), 'shop', schema_name='sales', db_type='mssql')
+    assert extractor.get_quoted_table_name('orders') == '[sales].[orders]'
+    assert extractor.get_quoted_table_name('orders') == '[sales].[orders]'
+    assert extractor.get_quoted_table_name('orders', include_schema=False) == '[orders]'
+    
+    extractor.schema_name = 'archive'
+    assert extractor.get_quoted_table_name('orders') == '[archive].[orders]'
+
+
+def test_schema_summary_binds_schema_per_placeholder():
+    """The schema summary query gets the schema name once for each schema filter."""
+    connector = RecordingConnector({})
+    assert MetadataExtractor(connector, 'shop', db_type='mysql').get_schema_summary() == []
+    assert connector.calls[-1][1] == ['shop', 'shop', 'shop']
+    
+    assert MetadataExtractor(connector, 'shop', db_type='mssql').get_schema_summary() == []
+    assert connector.calls[-1][1] == ['shop']
+
+
+if __name__ == "__main__":
+    test_prefetched_metadata_answers_per_table_lookups()
+    test_failed_prefetch_falls_back_to_per_table_queries()
+    test_prefetch_streams_schema_wide_rows()
+    test_caching_schema_reuses_query_results()
+    test_prefetch_tables_fills_session_cache()
+    test_count_rows_bulk()
+    test_parameterized_queries_use_prepared_statements()
+    test_quoted_table_name_follows_schema()
+    test_schema_summary_binds_schema_per_placeholder()
+    print("Metadata extractor tests passed")
@@ -0,0 +1,99 @@
+"""
+Test Profiler Configuration
+
+This script tests profiler configuration serialization, copying and building.
+"""
+
+import sys
+import os
+import tempfile
+from dataclasses import fields
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from profiler.config import ProfilerConfig, ConfigBuilder, CommonConfigs
+from profiler.interfaces import ProfilingStrategy
+
+
+def test_to_dict_round_trip():
+    """to_dict lists every field in order with the strategy as its value."""
+    config = ProfilerConfig(database_name="db", schema_name="public",
+                            strategy=ProfilingStrategy.PARALLEL, max_workers=8)
+    data = config.to_dict()
+    
+    assert list(data) == [f.name for f in fields(ProfilerConfig)]
+    assert data['strategy'] == 'parallel'
+    assert ProfilerConfig.from_dict(data) == config
+
+
+def test_copy_and_builder():
+    """Copies apply changes and builders produce validated configurations."""
+    config = ConfigBuilder("db").with_schema("public").with_parallel_processing(max_workers=6, threshold=2).build()
+    
+    assert config.max_workers == 6
+    assert config.copy(max_workers=2).max_workers == 2
+    assert config.copy(max_workers=2).schema_name == "public"
+    assert config.max_workers == 6
+    assert config.copy(strategy="sequential").strategy is ProfilingStrategy.SEQUENTIAL
+    assert ConfigBuilder("db").with_strategy("parallel").build().strategy is ProfilingStrategy.PARALLEL
+    
+    try:
+        config.copy(log_level="VERBOSE")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_save_and_load_file():
+    """Configurations survive a save/load round trip through a JSON file."""
+    config = ProfilerConfig(database_name="café", strategy=ProfilingStrategy.SEQUENTIAL)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "nested", "config.json")
+        config.save_to_file(path)
+        with open(path, encoding='utf-8') as f:
+            assert '"database_name": "café"' in f.read()
+        assert ProfilerConfig.from_file(path) == config
+
+
+def test_incremental_config_carries_profile_cache_options():
+    """Profile cache options reach the incremental configuration; profiles stay in memory by default."""
+    incremental = ProfilerConfig(database_name="db").get_incremental_config()
+    assert not incremental.persist_profiles and incremental.max_cache_size_mb == 256
+    
+    incremental = ProfilerConfig(database_name="db", persist_profile_cache=True,
+                                 max_cache_size_mb=64).get_incremental_config()
+    assert incremental.persist_profiles and incremental.max_cache_size_mb == 64
+    
+    try:
+        ProfilerConfig(database_name="db", max_cache_size_mb=0)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_common_configs_from_templates():
+    """Presets fill in the per-call fields on top of their shared settings."""
+    production = CommonConfigs.production("db", "public", state_path="state.json")
+    assert (production.database_name, production.schema_name) == ("db", "public")
+    assert production.strategy is ProfilingStrategy.ADAPTIVE and production.max_workers == 8
+    assert production.incremental_enabled and production.incremental_state_path == "state.json"
+    assert production.data_change_threshold == 0.05
+    assert not CommonConfigs.production("db").incremental_enabled
+    
+    development = CommonConfigs.development("dev")
+    assert development.debug_mode and development.log_level == "DEBUG"
+    assert CommonConfigs.large_database("big", state_path="big.json").incremental_state_path == "big.json"
+    assert CommonConfigs.ci_cd("ci").parallel_threshold == 8
+    assert CommonConfigs.development("other").database_name == "other"
+    assert development.database_name == "dev"
+
+
+if __name__ == "__main__":
+    test_to_dict_round_trip()
+    test_copy_and_builder()
+    test_save_and_load_file()
+    test_incremental_config_carries_profile_cache_options()
+    test_common_configs_from_templates()
+    print("Profiler configuration tests passed")
@@ -0,0 +1,113 @@
+"""
+Test Profiler Factory
+
+This script tests the orchestrated profiling entry points against a recording connector.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from profiler import DatabaseDialect, ProfilerConfig
+from profiler.interfaces import ProfilingStrategy
+from profiler.profiler_factory import UnifiedProfiler
+
+
+class MySQLRecordingConnector:
+    """MySQL connector stand-in answering dialect queries from canned rows and recording each call."""
+    
+    def __init__(self, rows_by_query):
+        self.rows_by_query = rows_by_query
+        self.calls = []
+    
+    def execute_query(self, query, params=None):
+        self.calls.append(query)
+        if 'AS table_index' in query:
+            # Batched row counts: table i of the batch has (i + 1) * 10 rows
+            return [{'table_index': index, 'row_count': (index + 1) * 10} for index in range(query.count('COUNT(*)'))]
+        return self.rows_by_query.get(query, [])
+
+
+def get_mysql_rows():
+    """Get the table list and schema-wide metadata of a three-table MySQL schema."""
+    dialect = DatabaseDialect('mysql')
+    return {
+        dialect.get_tables_query(): [{'table_name': name} for name in ('customer', 'orders', 'product')],
+        dialect.get_all_columns_query(): [
+            {'table_name': 'customer', 'column_name': 'id', 'data_type': 'int', 'is_nullable': 'NO',
+             'column_key': 'PRI', 'ordinal_position': 1},
+            {'table_name': 'orders', 'column_name': 'order_id', 'data_type': 'int', 'is_nullable': 'NO',
+             'column_key': 'PRI', 'ordinal_position': 1},
+            {'table_name': 'orders', 'column_name': 'customer_id', 'data_type': 'int', 'is_nullable': 'YES',
+             'column_key': 'MUL', 'ordinal_position': 2},
+            {'table_name': 'product', 'column_name': 'id', 'data_type': 'int', 'is_nullable': 'NO',
+             'column_key': 'PRI', 'ordinal_position': 1}
+        ],
+        dialect.get_all_primary_keys_query(): [
+            {'table_name': name, 'column_name': column}
+            for name, column in (('customer', 'id'), ('orders', 'order_id'), ('product', 'id'))
+        ],
+        dialect.get_all_foreign_keys_query(): [
+            {'table_name': 'orders', 'column_name': 'customer_id', 'referenced_table': 'customer',
+             'referenced_column': 'id', 'constraint_name': 'fk_orders_customer'}
+        ],
+        dialect.get_all_indexes_query(): []
+    }
+
+
+def test_orchestrated_profiling_prefetches_metadata():
+    """The main entry point loads metadata schema-wide and counts rows in one batch instead of per table."""
+    dialect = DatabaseDialect('mysql')
+    connector = MySQLRecordingConnector(get_mysql_rows())
+    config = ProfilerConfig(database_name='shop', strategy=ProfilingStrategy.SEQUENTIAL,
+                            pattern_recognition_enabled=False, include_sample_data=False)
+    profiler = UnifiedProfiler(connector, config)
+    
+    schema = profiler.profile_schema()
+    
+    assert [table.name for table in schema.tables] == ['customer', 'orders', 'product']
+    assert [column.name for column in schema.tables[1].columns] == ['order_id', 'customer_id']
+    assert schema.tables[1].foreign_keys[0]['referenced_table'] == 'customer'
+    assert schema.cross_table_relationships[0]['to_table'] == 'customer'
+    
+    per_table_queries = {dialect.get_column_info_query(), dialect.get_primary_keys_query(),
+                         dialect.get_foreign_keys_query(), dialect.get_indexes_query()}
+    assert not any(query in per_table_queries for query in connector.calls)
+    assert connector.calls.count(dialect.get_all_columns_query()) == 1
+    
+    assert [table.estimated_row_count for table in schema.tables] == [10, 20, 30]
+    assert sum('AS table_index' in query for query in connector.calls) == 1
+    assert not any(query.startswith('SELECT COUNT(*) as row_count') for query in connector.calls)
+    
+    # Prefetched metadata and counts do not outlive the run
+    extractor = profiler.schema_profiler.core_profiler.metadata_extractor
+    assert extractor._bulk_cache == {} and not extractor._query_cache
+
+
+def test_incremental_runs_reuse_table_list():
+    """Incremental runs through the main entry point query the table list once per TTL."""
+    dialect = DatabaseDialect('mysql')
+    connector = MySQLRecordingConnector(get_mysql_rows())
+    
+    with tempfile.TemporaryDirectory() as directory:
+        config = ProfilerConfig(database_name='shop', strategy=ProfilingStrategy.SEQUENTIAL,
+                                pattern_recognition_enabled=False, include_sample_data=False,
+                                incremental_enabled=True,
+                                incremental_state_path=os.path.join(directory, 'state.json'))
+        profiler = UnifiedProfiler(connector, config)
+        
+        first = profiler.profile_schema()
+        second = profiler.profile_schema()
+        assert [table.name for table in first.tables] == ['customer', 'orders', 'product']
+        assert [table.name for table in second.tables] == ['customer', 'orders', 'product']
+        assert profiler.get_tables_info() == [{'table_name': name} for name in ('customer', 'orders', 'product')]
+        assert connector.calls.count(dialect.get_tables_query()) == 1
+
+
+if __name__ == "__main__":
+    test_orchestrated_profiling_prefetches_metadata()
+    test_incremental_runs_reuse_table_list()
+    print("Profiler factory tests passed")